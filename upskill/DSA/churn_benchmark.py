@@ -0,0 +1,114 @@
+import gc
+import random
+import time
+from collections import deque
+
+from queuelist import LinkedListQueue, Node as QueueNode, UnrolledQueue
+from stack import NodePool, Stack, UnrolledStack
+
+
+class GCPauses:
+    # Wall time of every cyclic GC pass, through gc.callbacks
+    def __init__(self):
+        self.pauses = []
+        self.started = None
+
+    def __call__(self, phase, info):
+        if phase == "start":
+            self.started = time.perf_counter()
+        elif self.started is not None:
+            self.pauses.append(time.perf_counter() - self.started)
+            self.started = None
+
+    def __enter__(self):
+        gc.collect()
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        gc.callbacks.remove(self)
+
+
+def burst_sizes(ops, seed=1):
+    # Push a burst, pop a burst, with the depth wandering between 0 and a few thousand
+    rnd = random.Random(seed)
+    sizes, done = [], 0
+    while done < ops:
+        n = rnd.randrange(1, 2000)
+        sizes.append(n)
+        done += 2 * n
+    return sizes
+
+
+def churn(put, take, sizes):
+    for n in sizes:
+        for i in range(n):
+            put(i)
+        for _ in range(n):
+            take()
+
+
+def run(label, put, take, sizes, ops):
+    # A live heap of ordinary objects, so each GC pass has realistic work to do
+    heap = [[i] for i in range(200000)]
+    churn(put, take, sizes[:10])        # warm pools and spare chunks
+    with GCPauses() as gcp:
+        start = time.perf_counter()
+        churn(put, take, sizes)
+        elapsed = time.perf_counter() - start
+    pauses = gcp.pauses
+    total = sum(pauses) * 1e3
+    worst = max(pauses, default=0) * 1e3
+    print(f"  {label:<22} {ops / elapsed / 1e6:>8.2f} {len(pauses):>8} {total:>9.2f} {worst:>9.3f}")
+    del heap
+
+
+def report(title, cases, sizes, ops):
+    print(f"{title}: {ops} ops in push/pop bursts")
+    print(f"  {'':<22} {'M ops/s':>8} {'GC runs':>8} {'GC ms':>9} {'worst ms':>9}")
+    for label, make in cases:
+        _, put, take = make()
+        run(label, put, take, sizes, ops)
+
+
+def stack_cases():
+    def linked():
+        s = Stack()
+        return s, s.push, s.pop
+    def pooled():
+        s = Stack(NodePool())
+        return s, s.push, s.pop
+    def unrolled():
+        s = UnrolledStack()
+        return s, s.push, s.pop
+    def dq():
+        d = deque()
+        return d, d.append, d.pop
+    return (("Stack", linked), ("Stack + NodePool", pooled),
+            ("UnrolledStack", unrolled), ("deque", dq))
+
+
+def queue_cases():
+    def linked():
+        q = LinkedListQueue()
+        return q, q.enqueue, q.dequeue
+    def pooled():
+        q = LinkedListQueue(NodePool(QueueNode))
+        return q, q.enqueue, q.dequeue
+    def unrolled():
+        q = UnrolledQueue()
+        return q, q.enqueue, q.dequeue
+    def dq():
+        d = deque()
+        return d, d.append, d.popleft
+    return (("LinkedListQueue", linked), ("LinkedListQueue + pool", pooled),
+            ("UnrolledQueue", unrolled), ("deque", dq))
+
+
+if __name__ == "__main__":
+    ops = 2000000
+    sizes = burst_sizes(ops)
+    ops = 2 * sum(sizes)
+    report("Stack churn", stack_cases(), sizes, ops)
+    print()
+    report("Queue churn", queue_cases(), sizes, ops)
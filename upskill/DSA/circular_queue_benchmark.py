@@ -0,0 +1,61 @@
+import queue
+import threading
+import time
+
+from queuelist import CircularQueue
+
+BATCH = 256
+
+
+def single(q, n):
+    def produce():
+        for i in range(n):
+            q.put(i)
+    def consume():
+        for _ in range(n):
+            q.get()
+    return produce, consume
+
+
+def bulk(q, n):
+    chunk = list(range(BATCH))
+    def produce():
+        sent = 0
+        while sent < n:
+            sent += q.put_many(chunk[:min(BATCH, n - sent)])
+    def consume():
+        got = 0
+        while got < n:
+            got += len(q.get_many(BATCH))
+    return produce, consume
+
+
+def run(workload, q, n):
+    produce, consume = workload(q, n)
+    threads = [threading.Thread(target=produce), threading.Thread(target=consume)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return n / (time.perf_counter() - start) / 1e6
+
+
+def bench(n=500000, capacity=1024):
+    # One producer thread feeding one consumer thread through each buffer
+    cases = (
+        ("queue.Queue", lambda: queue.Queue(capacity), single),
+        ("CircularQueue", lambda: CircularQueue(capacity), single),
+        ("CircularQueue bulk", lambda: CircularQueue(capacity), bulk),
+        ("CircularQueue spsc", lambda: CircularQueue(capacity, spsc=True), single),
+        ("spsc bulk", lambda: CircularQueue(capacity, spsc=True), bulk),
+    )
+    print(f"Producer -> consumer: {n} items, capacity {capacity}, batches of {BATCH}")
+    print(f"  {'':<20} {'M items/s':>10}")
+    for label, make, workload in cases:
+        best = max(run(workload, make(), n) for _ in range(3))
+        print(f"  {label:<20} {best:>10.2f}")
+
+
+if __name__ == "__main__":
+    bench()
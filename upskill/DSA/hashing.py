@@ -1,3 +1,6 @@
+import sys
+from array import array
+
 # class HashingDSAExamples:
 
 #     @staticmethod
@@ -77,79 +80,483 @@
 
 
 
-class Dictionary:
+_EMPTY = object()     # slot never used: ends a probe chain
+_DELETED = object()   # tombstone: slot freed by a delete, probing continues past it
 
-  def __init__(self, size):
-    self.size = size
-    self.slots = [None] * self.size
-    self.data = [None] * self.size
+
+class Dictionary:
+  # Open addressing with linear probing over parallel key/value/hash arrays.
+  # Hashes are cached so probing and resizing never call hash() again, the
+  # table doubles once live keys plus tombstones pass 2/3 of the slots, and
+  # deletes leave tombstones that are dropped on the next resize.
+  __slots__ = ("size", "used", "filled", "slots", "data", "hashes", "max_load")
+
+  MIN_SIZE = 8
+
+  def __init__(self, size=MIN_SIZE, max_load=2 / 3):
+    capacity = self.MIN_SIZE
+    while capacity < size:
+      capacity *= 2
+    self.max_load = max_load
+    self._allocate(capacity)
+
+  def _allocate(self, capacity):
+    self.size = capacity            # always a power of two, so index = hash & (size - 1)
+    self.used = 0                   # live keys
+    self.filled = 0                 # live keys + tombstones
+    self.slots = [_EMPTY] * capacity
+    self.data = [None] * capacity
+    self.hashes = [0] * capacity
+
+  def _find(self, key, hash_value):
+    # Slot holding key, or -(insert slot) - 1: the first tombstone seen, else the empty slot
+    slots = self.slots
+    hashes = self.hashes
+    mask = self.size - 1
+    position = hash_value & mask
+    free = -1
+    while True:
+      slot = slots[position]
+      if slot is _EMPTY:
+        return -(position if free < 0 else free) - 1
+      if slot is _DELETED:
+        if free < 0:
+          free = position
+      elif hashes[position] == hash_value and (slot is key or slot == key):
+        return position
+      position = (position + 1) & mask
 
   def put(self, key, value):
     hash_value = self.hash_function(key)
-
-    if self.slots[hash_value] == None:
-      self.slots[hash_value] = key
-      self.data[hash_value] = value
-
-    else:
-
-      if self.slots[hash_value] == key:
-        self.data[hash_value] = value
-      else:
-        new_hash_value = self.rehash(hash_value)
-
-        while self.slots[new_hash_value] != None and self.slots[new_hash_value] != key:
-          new_hash_value = self.rehash(new_hash_value)
-
-        if self.slots[new_hash_value] == None:
-          self.slots[new_hash_value] = key
-          self.data[new_hash_value] = value
-        else:
-          self.data[new_hash_value] = value
-
-  def get(self, key):
-    start_position = self.hash_function(key)
-    current_position = start_position
-
-    while self.slots[current_position] != None:
-
-      if self.slots[current_position] == key:
-        return self.data[current_position]
-      
-      current_position = self.rehash(current_position)
-
-      if current_position == start_position:
-        return "Not Found"
-
-    return "None wala Not Found"
+    position = self._find(key, hash_value)
+    if position >= 0:
+      self.data[position] = value
+      return
+    position = -position - 1
+    if self.slots[position] is _EMPTY:
+      self.filled += 1
+    self.slots[position] = key
+    self.data[position] = value
+    self.hashes[position] = hash_value
+    self.used += 1
+    if self.filled >= self.size * self.max_load:
+      self._resize()
+
+  def get(self, key, default=None):
+    position = self._find(key, self.hash_function(key))
+    return self.data[position] if position >= 0 else default
+
+  def delete(self, key):
+    position = self._find(key, self.hash_function(key))
+    if position < 0:
+      raise KeyError(key)
+    value = self.data[position]
+    self.slots[position] = _DELETED
+    self.data[position] = None
+    self.used -= 1
+    return value
+
+  def _resize(self):
+    # Grow for live keys only; a table full of tombstones is just rebuilt at the same size
+    capacity = self.MIN_SIZE
+    while capacity * self.max_load <= self.used * 2:
+      capacity *= 2
+    live = self.used
+    old_slots, old_data, old_hashes = self.slots, self.data, self.hashes
+    self._allocate(capacity)
+    slots, data, hashes = self.slots, self.data, self.hashes
+    mask = capacity - 1
+    for i, key in enumerate(old_slots):
+      if key is _EMPTY or key is _DELETED:
+        continue
+      hash_value = old_hashes[i]
+      position = hash_value & mask
+      while slots[position] is not _EMPTY:
+        position = (position + 1) & mask
+      slots[position] = key
+      data[position] = old_data[i]
+      hashes[position] = hash_value
+    self.used = self.filled = live
+
+  def __len__(self):
+    return self.used
+
+  def __contains__(self, key):
+    return self._find(key, self.hash_function(key)) >= 0
+
+  def __iter__(self):
+    for key in self.slots:
+      if key is not _EMPTY and key is not _DELETED:
+        yield key
+
+  def items(self):
+    for i, key in enumerate(self.slots):
+      if key is not _EMPTY and key is not _DELETED:
+        yield key, self.data[i]
 
   def __str__(self):
+    return "{" + ", ".join(f"{key!r}: {value!r}" for key, value in self.items()) + "}"
 
-    for i in range(len(self.slots)):
-      if self.slots[i] != None:
-        print(self.slots[i],":",self.data[i],end=' ')
+  def __getitem__(self, key):
+    position = self._find(key, self.hash_function(key))
+    if position < 0:
+      raise KeyError(key)
+    return self.data[position]
 
-    return ""
+  def __setitem__(self, key, value):
+    self.put(key, value)
 
-  def __getitem__(self,key):
-    return self.get(key)
+  def __delitem__(self, key):
+    self.delete(key)
 
-  def __setitem__(self,key,value):
-    self.put(key,value)
-  
   def rehash(self, old_hash):
-    return (old_hash + 1) % self.size
+    return (old_hash + 1) & (self.size - 1)
 
+  def probe_length(self, key):
+    # Slots examined to find key, or to prove it absent
+    hash_value = self.hash_function(key)
+    position = hash_value & (self.size - 1)
+    probes = 1
+    while self.slots[position] is not _EMPTY:
+      slot = self.slots[position]
+      if self.hashes[position] == hash_value and (slot is key or slot == key):
+        break
+      position = self.rehash(position)
+      probes += 1
+    return probes
+
+  def memory_bytes(self):
+    # Table overhead: the three arrays plus the cached hash int objects (keys and values not counted)
+    hash_objects = {id(h): h for h in self.hashes}.values()
+    return (sys.getsizeof(self.slots) + sys.getsizeof(self.data) + sys.getsizeof(self.hashes)
+            + sum(map(sys.getsizeof, hash_objects)))
 
   def hash_function(self, key):
+    return hash(key)
+
+
+class RobinHoodDictionary:
+  # Linear probing where an insert takes the slot of any resident that sits
+  # closer to its home slot than the newcomer would ("rich" gives to "poor").
+  # That evens out probe lengths, lets a lookup stop as soon as it meets a
+  # resident closer to home than the current distance, and allows deletes to
+  # shift the following run back by one instead of leaving tombstones.
+  # Hashes and probe distances live in flat typed arrays.
+  __slots__ = ("size", "used", "keys", "values", "hashes", "dists", "max_load")
+
+  MIN_SIZE = 8
+
+  def __init__(self, size=MIN_SIZE, max_load=0.9):
+    capacity = self.MIN_SIZE
+    while capacity < size:
+      capacity *= 2
+    self.max_load = max_load
+    self._allocate(capacity)
+
+  def _allocate(self, capacity):
+    self.size = capacity
+    self.used = 0
+    self.keys = [None] * capacity
+    self.values = [None] * capacity
+    self.hashes = array("q", bytes(8 * capacity))
+    self.dists = array("q", [-1]) * capacity     # distance from home slot, -1 when empty
+
+  def _find(self, key, hash_value):
+    keys, hashes, dists = self.keys, self.hashes, self.dists
+    mask = self.size - 1
+    position = hash_value & mask
+    distance = 0
+    while dists[position] >= distance:
+      if hashes[position] == hash_value and (keys[position] is key or keys[position] == key):
+        return position
+      position = (position + 1) & mask
+      distance += 1
+    return -1
 
-    return abs(hash(key)) % self.size
-
+  def put(self, key, value):
+    hash_value = hash(key)
+    position = self._find(key, hash_value)
+    if position >= 0:
+      self.values[position] = value
+      return
+    if self.used + 1 > self.size * self.max_load:
+      self._resize(self.size * 2)
+    self._insert_new(key, value, hash_value)
+    self.used += 1
+
+  def _insert_new(self, key, value, hash_value):
+    keys, values, hashes, dists = self.keys, self.values, self.hashes, self.dists
+    mask = self.size - 1
+    position = hash_value & mask
+    distance = 0
+    while True:
+      resident = dists[position]
+      if resident < 0:
+        keys[position], values[position] = key, value
+        hashes[position], dists[position] = hash_value, distance
+        return
+      if resident < distance:
+        # Swap with the richer resident and carry it further along
+        keys[position], key = key, keys[position]
+        values[position], value = value, values[position]
+        hashes[position], hash_value = hash_value, hashes[position]
+        dists[position], distance = distance, resident
+      position = (position + 1) & mask
+      distance += 1
+
+  def get(self, key, default=None):
+    position = self._find(key, hash(key))
+    return self.values[position] if position >= 0 else default
+
+  def delete(self, key):
+    position = self._find(key, hash(key))
+    if position < 0:
+      raise KeyError(key)
+    keys, values, hashes, dists = self.keys, self.values, self.hashes, self.dists
+    value = values[position]
+    mask = self.size - 1
+    following = (position + 1) & mask
+    # Backward shift: pull the rest of the run one slot closer to home
+    while dists[following] > 0:
+      keys[position], values[position] = keys[following], values[following]
+      hashes[position], dists[position] = hashes[following], dists[following] - 1
+      position, following = following, (following + 1) & mask
+    keys[position] = values[position] = None
+    dists[position] = -1
+    self.used -= 1
+    return value
+
+  def _resize(self, capacity):
+    old_keys, old_values, old_hashes, old_dists = self.keys, self.values, self.hashes, self.dists
+    used = self.used
+    self._allocate(capacity)
+    for i, distance in enumerate(old_dists):
+      if distance >= 0:
+        self._insert_new(old_keys[i], old_values[i], old_hashes[i])
+    self.used = used
+
+  def probe_length(self, key):
+    hash_value = hash(key)
+    mask = self.size - 1
+    position = hash_value & mask
+    distance = 0
+    while self.dists[position] >= distance:
+      if self.hashes[position] == hash_value and (self.keys[position] is key or self.keys[position] == key):
+        break
+      position = (position + 1) & mask
+      distance += 1
+    return distance + 1
+
+  def memory_bytes(self):
+    return (sys.getsizeof(self.keys) + sys.getsizeof(self.values)
+            + sys.getsizeof(self.hashes) + sys.getsizeof(self.dists))
+
+  def __len__(self):
+    return self.used
+
+  def __contains__(self, key):
+    return self._find(key, hash(key)) >= 0
+
+  def __iter__(self):
+    for i, distance in enumerate(self.dists):
+      if distance >= 0:
+        yield self.keys[i]
+
+  def items(self):
+    for i, distance in enumerate(self.dists):
+      if distance >= 0:
+        yield self.keys[i], self.values[i]
+
+  def __getitem__(self, key):
+    position = self._find(key, hash(key))
+    if position < 0:
+      raise KeyError(key)
+    return self.values[position]
+
+  def __setitem__(self, key, value):
+    self.put(key, value)
+
+  def __delitem__(self, key):
+    self.delete(key)
+
+
+_CTRL_EMPTY = 0x80
+_CTRL_DELETED = 0xFE
+_GROUP = 16
+
+
+class SwissDictionary:
+  # Swiss-table layout: one control byte per slot holding EMPTY, DELETED, or
+  # the low 7 bits of the key's hash (h2). Slots are probed a group of 16 at a
+  # time; bytearray.find scans a group for h2 in C, standing in for the SIMD
+  # compare, so full key comparisons only happen on 7-bit tag matches. Groups
+  # are visited in triangular order (quadratic probing over groups).
+  __slots__ = ("size", "used", "growth_left", "ctrl", "keys", "values", "hashes", "max_load")
+
+  MIN_SIZE = _GROUP
+
+  def __init__(self, size=MIN_SIZE, max_load=0.875):
+    capacity = self.MIN_SIZE
+    while capacity < size:
+      capacity *= 2
+    self.max_load = max_load
+    self._allocate(capacity)
+
+  def _allocate(self, capacity):
+    self.size = capacity
+    self.used = 0
+    self.growth_left = int(capacity * self.max_load)   # inserts allowed into EMPTY slots before a rebuild
+    self.ctrl = bytearray([_CTRL_EMPTY]) * capacity
+    self.keys = [None] * capacity
+    self.values = [None] * capacity
+    self.hashes = array("q", bytes(8 * capacity))
+
+  def _find(self, key, hash_value):
+    ctrl, keys, hashes = self.ctrl, self.keys, self.hashes
+    group_mask = self.size // _GROUP - 1
+    tag = hash_value & 0x7F
+    group = (hash_value >> 7) & group_mask
+    step = 0
+    while True:
+      start = group * _GROUP
+      end = start + _GROUP
+      i = ctrl.find(tag, start, end)
+      while i >= 0:
+        if hashes[i] == hash_value and (keys[i] is key or keys[i] == key):
+          return i
+        i = ctrl.find(tag, i + 1, end)
+      if ctrl.find(_CTRL_EMPTY, start, end) >= 0:
+        return -1
+      step += 1
+      group = (group + step) & group_mask
+
+  def _free_slot(self, hash_value):
+    # First EMPTY or DELETED slot along the key's probe sequence
+    ctrl = self.ctrl
+    group_mask = self.size // _GROUP - 1
+    group = (hash_value >> 7) & group_mask
+    step = 0
+    while True:
+      start = group * _GROUP
+      end = start + _GROUP
+      empty = ctrl.find(_CTRL_EMPTY, start, end)
+      deleted = ctrl.find(_CTRL_DELETED, start, end)
+      if empty >= 0 or deleted >= 0:
+        return deleted if empty < 0 or 0 <= deleted < empty else empty
+      step += 1
+      group = (group + step) & group_mask
 
-D1 = Dictionary(3)
-D1['python'] = 56
-D1['c'] = 1000
-print(D1.slots)
-print(D1.data)
-print(D1.__getitem__('python'))
-print(D1.__getitem__('c'))
\ No newline at end of file
+  def put(self, key, value):
+    hash_value = hash(key)
+    position = self._find(key, hash_value)
+    if position >= 0:
+      self.values[position] = value
+      return
+    position = self._free_slot(hash_value)
+    if self.ctrl[position] == _CTRL_EMPTY:
+      if self.growth_left == 0:
+        self._resize()
+        position = self._free_slot(hash_value)
+      self.growth_left -= 1
+    self.ctrl[position] = hash_value & 0x7F
+    self.keys[position], self.values[position] = key, value
+    self.hashes[position] = hash_value
+    self.used += 1
+
+  def get(self, key, default=None):
+    position = self._find(key, hash(key))
+    return self.values[position] if position >= 0 else default
+
+  def delete(self, key):
+    position = self._find(key, hash(key))
+    if position < 0:
+      raise KeyError(key)
+    value = self.values[position]
+    start = position - position % _GROUP
+    # A group that still has an EMPTY slot was never full, so no probe ever
+    # continued past it and the slot can go straight back to EMPTY
+    if self.ctrl.find(_CTRL_EMPTY, start, start + _GROUP) >= 0:
+      self.ctrl[position] = _CTRL_EMPTY
+      self.growth_left += 1
+    else:
+      self.ctrl[position] = _CTRL_DELETED
+    self.keys[position] = self.values[position] = None
+    self.used -= 1
+    return value
+
+  def _resize(self):
+    # Double when mostly live; rebuild in place when tombstones are what filled it
+    capacity = self.size * 2 if self.used >= self.size * self.max_load / 2 else self.size
+    old_ctrl, old_keys, old_values, old_hashes = self.ctrl, self.keys, self.values, self.hashes
+    used = self.used
+    self._allocate(capacity)
+    for i, c in enumerate(old_ctrl):
+      if c < 0x80:
+        position = self._free_slot(old_hashes[i])
+        self.ctrl[position] = c
+        self.keys[position], self.values[position] = old_keys[i], old_values[i]
+        self.hashes[position] = old_hashes[i]
+    self.used = used
+    self.growth_left -= used
+
+  def probe_length(self, key):
+    # Groups examined to find key, or to prove it absent
+    hash_value = hash(key)
+    group_mask = self.size // _GROUP - 1
+    group = (hash_value >> 7) & group_mask
+    step = 0
+    while True:
+      start = group * _GROUP
+      end = start + _GROUP
+      for i in range(start, end):
+        if self.ctrl[i] == hash_value & 0x7F and self.hashes[i] == hash_value and (self.keys[i] is key or self.keys[i] == key):
+          return step + 1
+      if self.ctrl.find(_CTRL_EMPTY, start, end) >= 0:
+        return step + 1
+      step += 1
+      group = (group + step) & group_mask
+
+  def memory_bytes(self):
+    return (sys.getsizeof(self.ctrl) + sys.getsizeof(self.keys)
+            + sys.getsizeof(self.values) + sys.getsizeof(self.hashes))
+
+  def __len__(self):
+    return self.used
+
+  def __contains__(self, key):
+    return self._find(key, hash(key)) >= 0
+
+  def __iter__(self):
+    for i, c in enumerate(self.ctrl):
+      if c < 0x80:
+        yield self.keys[i]
+
+  def items(self):
+    for i, c in enumerate(self.ctrl):
+      if c < 0x80:
+        yield self.keys[i], self.values[i]
+
+  def __getitem__(self, key):
+    position = self._find(key, hash(key))
+    if position < 0:
+      raise KeyError(key)
+    return self.values[position]
+
+  def __setitem__(self, key, value):
+    self.put(key, value)
+
+  def __delitem__(self, key):
+    self.delete(key)
+
+
+if __name__ == "__main__":
+  D1 = Dictionary(3)
+  D1['python'] = 56
+  D1['c'] = 1000
+  for i in range(20):
+    D1[f"key{i}"] = i
+  del D1['key3']
+  print(D1.size, len(D1))
+  print(D1['python'])
+  print(D1.get('key3', 'Not Found'))
+  print(D1)
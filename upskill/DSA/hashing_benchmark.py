@@ -0,0 +1,154 @@
+import random
+import sys
+import time
+
+from hashing import Dictionary, RobinHoodDictionary, SwissDictionary
+
+
+def int_keys(n, seed=1):
+  return random.Random(seed).sample(range(n * 10), n)
+
+
+def str_keys(n, seed=2):
+  return [f"user:{k}" for k in int_keys(n, seed)]
+
+
+def throughput(fn, keys, repeat=3):
+  # Best of `repeat` runs, in million operations per second
+  best = float("inf")
+  for _ in range(repeat):
+    start = time.perf_counter()
+    fn(keys)
+    best = min(best, time.perf_counter() - start)
+  return len(keys) / best / 1e6
+
+
+def bench_map(factory, keys, misses):
+  table = factory()
+
+  def insert(keys):
+    t = factory()
+    for k in keys:
+      t[k] = k
+
+  def get(keys):
+    for k in keys:
+      table[k]
+
+  def get_missing(keys):
+    for k in keys:
+      table.get(k)
+
+  def delete(keys):
+    t = factory()
+    for k in keys:
+      t[k] = k
+    start = time.perf_counter()
+    for k in keys:
+      del t[k]
+    return time.perf_counter() - start
+
+  for k in keys:
+    table[k] = k
+  # Deletes are timed without the inserts that set them up
+  delete_time = min(delete(keys) for _ in range(3))
+  return {
+    "insert": throughput(insert, keys),
+    "get": throughput(get, keys),
+    "miss": throughput(get_missing, misses),
+    "delete": len(keys) / delete_time / 1e6,
+  }
+
+
+def report(label, keys, misses):
+  print(f"{label}: {len(keys)} keys (M ops/s, higher is better)")
+  print(f"  {'':<12} {'insert':>8} {'get':>8} {'miss':>8} {'delete':>8}")
+  results = {}
+  for name, factory in (("dict", dict), ("Dictionary", Dictionary),
+                        ("RobinHood", RobinHoodDictionary), ("Swiss", SwissDictionary)):
+    r = results[name] = bench_map(factory, keys, misses)
+    print(f"  {name:<12} {r['insert']:>8.2f} {r['get']:>8.2f} {r['miss']:>8.2f} {r['delete']:>8.2f}")
+
+
+class ChainedHashTable:
+  # The separate-chaining HashTable from hashing.py, sized up front, as a baseline
+  def __init__(self, size):
+    self.size = size
+    self.table = [[] for _ in range(self.size)]
+
+  def _hash(self, key):
+    return hash(key) % self.size
+
+  def __setitem__(self, key, value):
+    bucket = self.table[self._hash(key)]
+    for pair in bucket:
+      if pair[0] == key:
+        pair[1] = value
+        return
+    bucket.append([key, value])
+
+  def get(self, key, default=None):
+    for pair in self.table[self._hash(key)]:
+      if pair[0] == key:
+        return pair[1]
+    return default
+
+  def probe_length(self, key):
+    # Entries examined, counting the bucket itself when it is empty
+    bucket = self.table[self._hash(key)]
+    for i, pair in enumerate(bucket):
+      if pair[0] == key:
+        return i + 1
+    return max(1, len(bucket))
+
+  def memory_bytes(self):
+    return (sys.getsizeof(self.table) + sum(map(sys.getsizeof, self.table))
+            + sum(sys.getsizeof(pair) for bucket in self.table for pair in bucket))
+
+
+# ----------------------------
+# Probe length, memory and throughput at fixed load factors
+# ----------------------------
+def fixed_capacity_tables(capacity):
+  # Max load just above the highest factor tested, so no table resizes mid-run
+  return (("chaining", lambda: ChainedHashTable(capacity), "entries"),
+          ("linear", lambda: Dictionary(capacity, max_load=0.96), "slots"),
+          ("robin hood", lambda: RobinHoodDictionary(capacity, max_load=0.96), "slots"),
+          ("swiss", lambda: SwissDictionary(capacity, max_load=0.96), "groups"))
+
+
+def probe_stats(table, keys):
+  lengths = [table.probe_length(k) for k in keys]
+  return sum(lengths) / len(lengths), max(lengths)
+
+
+def bench_load_factors(capacity=1 << 16, load_factors=(0.5, 0.75, 0.875, 0.95), samples=20000):
+  rnd = random.Random(5)
+  pool = rnd.sample(range(1 << 40), int(capacity * max(load_factors)) + samples)
+  misses = pool[-samples:]
+  print(f"Load factor sweep: {capacity} slots, random int keys")
+  print(f"  {'LF':>5} {'table':<11} {'probe hit':>10} {'max':>5} {'probe miss':>11} {'max':>5} {'unit':<8}"
+        f" {'B/entry':>8} {'insert':>7} {'get':>7} {'miss':>7}  (M ops/s)")
+  for load in load_factors:
+    keys = pool[:int(capacity * load)]
+    hits = rnd.sample(keys, min(samples, len(keys)))
+    for name, factory, unit in fixed_capacity_tables(capacity):
+      table = factory()
+      start = time.perf_counter()
+      for k in keys:
+        table[k] = k
+      insert = len(keys) / (time.perf_counter() - start) / 1e6
+      get = throughput(lambda ks: [table.get(k) for k in ks], hits)
+      miss = throughput(lambda ks: [table.get(k) for k in ks], misses)
+      hit_avg, hit_max = probe_stats(table, hits)
+      miss_avg, miss_max = probe_stats(table, misses)
+      per_entry = table.memory_bytes() / len(keys)
+      print(f"  {load:>5.3f} {name:<11} {hit_avg:>10.2f} {hit_max:>5} {miss_avg:>11.2f} {miss_max:>5} {unit:<8}"
+            f" {per_entry:>8.1f} {insert:>7.2f} {get:>7.2f} {miss:>7.2f}")
+
+
+if __name__ == "__main__":
+  n = 200000
+  report("int keys", int_keys(n), [-k - 1 for k in int_keys(n, seed=3)])
+  report("str keys", str_keys(n), [f"missing:{k}" for k in int_keys(n, seed=4)])
+  bench_load_factors()
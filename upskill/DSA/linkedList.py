@@ -1,47 +1,82 @@
 class Node:
+    __slots__ = ('data', 'next')
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+class DNode:
+    __slots__ = ('data', 'prev', 'next')
+
     def __init__(self, data):
         self.data = data
+        self.prev = None
         self.next = None
-    
+
 class LinkedList:
-    def __init__(self):
+    def __init__(self, values=()):
         self.head = None
+        self.tail = None
+        self.size = 0
+        for value in values:
+            self.append(value)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
 
     def append(self, value):
+        # O(1): link after the tail instead of walking to it
         newNode = Node(value)
         if self.head == None:
-            self.head = newNode
-            return
-        current = self.head
-        while current.next:
-            current = current.next
-        current.next = newNode
+            self.head = self.tail = newNode
+        else:
+            self.tail.next = newNode
+            self.tail = newNode
+        self.size += 1
+
+    def prepend(self, value):
+        newNode = Node(value)
+        newNode.next = self.head
+        self.head = newNode
+        if self.tail is None:
+            self.tail = newNode
+        self.size += 1
 
     def pop_first(self):
         if self.head is None:
             return None  # List is empty
         popped = self.head.data
         self.head = self.head.next  # Move head to next node
+        if self.head is None:
+            self.tail = None
+        self.size -= 1
         return popped
 
     def pop_last(self):
+        # Still O(n) here: a singly linked node does not know its predecessor
         if self.head == None:
             return None
-        
+
         if self.head.next == None:
             popped = self.head.data
-            self.head = None
+            self.head = self.tail = None
+            self.size = 0
             return popped
 
-        prev = None
         current = self.head
-        while current.next:
-            prev = current
+        while current.next is not self.tail:
             current = current.next
-        prev.next = None
-        return current.data
-            
-
+        popped = self.tail.data
+        current.next = None
+        self.tail = current
+        self.size -= 1
+        return popped
 
     def traverse(self):
 
@@ -52,21 +87,108 @@ class LinkedList:
         print("None")
 
     def reverse(self):
-        # reverse = '' 
-        if self.head:
-            popped = 1.1
-        while popped:
-            print(popped)
-            popped = self.pop_last()
-
-l = LinkedList()
-l.append(1)
-l.append(2)
-l.append(3)
-
-# print(l.pop_last())
-# l.traverse()
-# print(l.pop_last())
-# l.traverse()
-
-l.reverse()
\ No newline at end of file
+        # In place, O(n): flip each next pointer while walking once
+        prev = None
+        current = self.head
+        self.tail = current
+        while current:
+            current.next, prev, current = prev, current, current.next
+        self.head = prev
+
+class DoublyLinkedList:
+    # Same interface as LinkedList, with O(1) pop_last through prev links
+    def __init__(self, values=()):
+        self.head = None
+        self.tail = None
+        self.size = 0
+        for value in values:
+            self.append(value)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+
+    def __reversed__(self):
+        current = self.tail
+        while current:
+            yield current.data
+            current = current.prev
+
+    def append(self, value):
+        newNode = DNode(value)
+        if self.tail is None:
+            self.head = self.tail = newNode
+        else:
+            newNode.prev = self.tail
+            self.tail.next = newNode
+            self.tail = newNode
+        self.size += 1
+
+    def prepend(self, value):
+        newNode = DNode(value)
+        if self.head is None:
+            self.head = self.tail = newNode
+        else:
+            newNode.next = self.head
+            self.head.prev = newNode
+            self.head = newNode
+        self.size += 1
+
+    def pop_first(self):
+        if self.head is None:
+            return None
+        node = self.head
+        self.head = node.next
+        if self.head is None:
+            self.tail = None
+        else:
+            self.head.prev = None
+        self.size -= 1
+        return node.data
+
+    def pop_last(self):
+        if self.tail is None:
+            return None
+        node = self.tail
+        self.tail = node.prev
+        if self.tail is None:
+            self.head = None
+        else:
+            self.tail.next = None
+        self.size -= 1
+        return node.data
+
+    def traverse(self):
+        current = self.head
+        while current:
+            print(current.data, end=" ⇄ ")
+            current = current.next
+        print("None")
+
+    def reverse(self):
+        # In place, O(n): swap prev/next on every node, then swap the ends
+        current = self.head
+        while current:
+            current.prev, current.next = current.next, current.prev
+            current = current.prev
+        self.head, self.tail = self.tail, self.head
+
+
+if __name__ == "__main__":
+    l = LinkedList()
+    l.append(1)
+    l.append(2)
+    l.append(3)
+
+    # print(l.pop_last())
+    # l.traverse()
+    # print(l.pop_last())
+    # l.traverse()
+
+    l.reverse()
+    l.traverse()
@@ -0,0 +1,72 @@
+import gc
+import time
+
+from linkedList import DoublyLinkedList, LinkedList, Node
+
+
+class WalkingLinkedList(LinkedList):
+    # The original append, which walks to the tail on every call, as a baseline
+    def append(self, value):
+        newNode = Node(value)
+        if self.head is None:
+            self.head = newNode
+            return
+        current = self.head
+        while current.next:
+            current = current.next
+        current.next = newNode
+
+
+def timed(fn):
+    # Collector paused, as timeit does, so gen-2 passes over a million live
+    # nodes are not billed to whichever append happens to trigger them
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        result = fn()
+        return time.perf_counter() - start, result
+    finally:
+        gc.enable()
+
+
+def build(cls, n):
+    a = cls()
+    for i in range(n):
+        a.append(i)
+    return a
+
+
+def bench_build(sizes=(10000, 100000, 1000000)):
+    # Linear build: ns per node should stay flat as n grows
+    print("Build by append (ns/node, flat means linear)")
+    print(f"  {'n':>9} {'LinkedList':>11} {'Doubly':>9} {'list':>7} {'walking':>9}")
+    for n in sizes:
+        row = []
+        for cls in (LinkedList, DoublyLinkedList, list):
+            seconds, _ = timed(lambda: build(cls, n))
+            row.append(seconds / n * 1e9)
+        walking = "-"
+        if n <= 10000:
+            seconds, _ = timed(lambda: build(WalkingLinkedList, n))
+            walking = f"{seconds / n * 1e9:.0f}"
+        print(f"  {n:>9} {row[0]:>11.0f} {row[1]:>9.0f} {row[2]:>7.0f} {walking:>9}")
+
+
+def bench_ops(n=1000000):
+    print(f"Operations at {n} nodes (seconds)")
+    print(f"  {'':<16} {'iterate':>8} {'reverse':>8} {'pop_last us':>12}")
+    for cls in (LinkedList, DoublyLinkedList):
+        a = build(cls, n)
+        iterate, total = timed(lambda: sum(a))
+        assert total == n * (n - 1) // 2
+        reverse, _ = timed(a.reverse)
+        assert a.head.data == n - 1 and a.tail.data == 0
+        pops, _ = timed(lambda: [a.pop_last() for _ in range(20)])
+        print(f"  {cls.__name__:<16} {iterate:>8.3f} {reverse:>8.3f} {pops / 20 * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    bench_build()
+    print()
+    bench_ops()
@@ -1,106 +1,364 @@
 import ctypes
+import sys
+from array import array
+
+_PTR_SIZE = ctypes.sizeof(ctypes.c_void_p)
+# array module typecodes accepted as MyList(dtype=...)
+_CTYPES = {'b': ctypes.c_byte, 'B': ctypes.c_ubyte, 'h': ctypes.c_short, 'H': ctypes.c_ushort,
+           'i': ctypes.c_int, 'I': ctypes.c_uint, 'l': ctypes.c_long, 'L': ctypes.c_ulong,
+           'q': ctypes.c_longlong, 'Q': ctypes.c_ulonglong, 'f': ctypes.c_float, 'd': ctypes.c_double}
+# The list owns one reference per stored object; pointers can then be moved
+# around with memmove without touching reference counts
+_incref = ctypes.PYFUNCTYPE(None, ctypes.py_object)(("Py_IncRef", ctypes.pythonapi))
+_decref = ctypes.PYFUNCTYPE(None, ctypes.c_void_p)(("Py_DecRef", ctypes.pythonapi))
+
+def _numpy():
+    # NumPy is optional; the typed helpers fall back to the standard library
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
 
 class MyList:
-    def __init__(self):
-        self.size = 1
+    def __init__(self, items=(), growth_factor=2.0, min_capacity=4, dtype=None):
+        if growth_factor <= 1:
+            raise ValueError("growth_factor must be greater than 1")
+        if dtype is not None and dtype not in _CTYPES:
+            raise ValueError(f"unsupported dtype {dtype!r}, expected one of {''.join(_CTYPES)}")
+        # dtype=None stores object pointers; a typecode stores unboxed C values
+        self.dtype = dtype
+        self.itemsize = _PTR_SIZE if dtype is None else ctypes.sizeof(_CTYPES[dtype])
+        self.growth_factor = growth_factor
+        self.min_capacity = min_capacity
+        self.size = 0
         self.n = 0
 
-        self.A = self.__make_array(self.size)
+        self.__allocate(min_capacity)
+        self.extend(items)
 
     def __len__(self):
         return self.n
-    
+
     def append(self,item):
-        
+
         if self.n == self.size:
-        
-            self.__resize(self.size*2)
 
-        self.A[self.n] = item
-        self.n = self.n + 1 
+            self.__resize(self.__grown(self.n + 1))
+
+        self.__store(self.n, item)
+        self.n = self.n + 1
+
+    def extend(self,items):
+        # One reallocation for the whole batch
+        if self.dtype is not None:
+            self.__extend_typed(items)
+            return
+        if not hasattr(items, '__len__'):
+            items = list(items)
+        needed = self.n + len(items)
+        if needed > self.size:
+            self.__resize(self.__grown(needed))
+        for item in items:
+            self.__store(self.n, item)
+            self.n = self.n + 1
+
+    def __extend_typed(self, items):
+        # Convert at C speed, then copy the packed values in with one memmove
+        values = items if isinstance(items, array) and items.typecode == self.dtype else array(self.dtype, items)
+        needed = self.n + len(values)
+        if needed > self.size:
+            self.__resize(self.__grown(needed))
+        if len(values):
+            ctypes.memmove(ctypes.addressof(self.P) + self.n * self.itemsize,
+                           values.buffer_info()[0], len(values) * self.itemsize)
+        self.n = needed
+
+    def __allocate(self, capacity):
+        self.size = capacity
+        self.__exporter = None
+        if self.dtype is None:
+            # Raw pointer storage plus a py_object view of the same memory for reads
+            self.P = (capacity * ctypes.c_void_p)()
+            self.A = (capacity * ctypes.py_object).from_buffer(self.P)
+        else:
+            self.P = self.A = (capacity * _CTYPES[self.dtype])()
 
     def __resize(self,new_capacity):
-        # create a new array with new capacity
-        B = self.__make_array(new_capacity)
-        self.size = new_capacity
-        # copy the content of old array to new one
-        for i in range(self.n):
-            B[i] = self.A[i]
-            # reassign A
-            self.A = B
+        # create a new array with new capacity and move the contents over in one go
+        if self.__exported():
+            raise BufferError('Existing exports of data: object cannot be re-sized')
+        old = self.P
+        self.__allocate(max(new_capacity, self.min_capacity, self.n))
+        ctypes.memmove(self.P, old, self.n * self.itemsize)
+
+    def __grown(self, needed):
+        capacity = max(self.size, self.min_capacity)
+        while capacity < needed:
+            capacity = max(capacity + 1, int(capacity * self.growth_factor))
+        return capacity
+
+    def __shrink_if_sparse(self):
+        # Halve once a quarter full, so alternating append/pop never thrashes
+        if self.size > self.min_capacity and self.n <= self.size // 4 and not self.__exported():
+            self.__resize(self.size // 2)
+
+    def __store(self, i, item):
+        if self.dtype is not None:
+            # array() checks type and range; ctypes alone would silently wrap
+            self.P[i] = array(self.dtype, (item,))[0]
+            return
+        _incref(item)
+        self.P[i] = id(item)
 
+    def __release(self, ptr):
+        # Drop the reference held for a removed element (nothing to do for typed values)
+        if self.dtype is None:
+            _decref(ptr)
+
+    def __move(self, dst, src, count):
+        if count > 0:
+            ctypes.memmove(ctypes.addressof(self.P) + dst * self.itemsize,
+                           ctypes.addressof(self.P) + src * self.itemsize, count * self.itemsize)
+
+    def __index(self, index):
+        if index < 0:
+            index += self.n
+        if not 0 <= index < self.n:
+            raise IndexError('MyList index out of range')
+        return index
 
     def __getitem__(self,index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.n)
+            result = MyList(growth_factor=self.growth_factor, min_capacity=self.min_capacity, dtype=self.dtype)
+            if self.dtype is None:
+                result.extend([self.A[i] for i in range(start, stop, step)])
+            else:
+                result.extend(self.buffer()[index])
+            return result
+        return self.A[self.__index(index)]
 
-        if 0<= index < self.n:
-            return self.A[index]
-        else:
-            return 'IndexError'
+    def __setitem__(self,index,item):
+        if isinstance(index, slice):
+            self.__set_slice(index, item)
+            return
+        index = self.__index(index)
+        old = self.P[index]
+        self.__store(index, item)
+        self.__release(old)
 
-    def __delitem__(self,pos):
-        # delete pos wala item
-        if 0<= pos < self.n:
-            for i in range(pos,self.n-1):
-                self.A[i] = self.A[i+1]
+    def __set_slice(self, index, items):
+        # Typed values are checked up front so a bad one cannot leave a half-done shift
+        items = list(items) if self.dtype is None else array(self.dtype, items)
+        start, stop, step = index.indices(self.n)
+        if step != 1:
+            positions = range(start, stop, step)
+            if len(items) != len(positions):
+                raise ValueError(f'attempt to assign sequence of size {len(items)} to extended slice of size {len(positions)}')
+            for i, item in zip(positions, items):
+                self[i] = item
+            return
+        stop = max(start, stop)
+        removed = [self.P[i] for i in range(start, stop)]
+        delta = len(items) - (stop - start)
+        if self.n + delta > self.size:
+            self.__resize(self.__grown(self.n + delta))
+        self.__move(stop + delta, stop, self.n - stop)
+        for i, item in enumerate(items):
+            self.__store(start + i, item)
+        self.n = self.n + delta
+        for i in range(self.n, self.n - delta):
+            self.P[i] = 0
+        for ptr in removed:
+            self.__release(ptr)
+        self.__shrink_if_sparse()
 
+    def __delitem__(self,pos):
+        if isinstance(pos, slice):
+            start, stop, step = pos.indices(self.n)
+            if step == 1:
+                self.__set_slice(pos, ())
+            else:
+                for i in sorted(range(start, stop, step), reverse=True):
+                    del self[i]
+            return
+        # delete pos wala item: shift the tail left with one memmove
+        pos = self.__index(pos)
+        old = self.P[pos]
+        self.__move(pos, pos + 1, self.n - pos - 1)
         self.n = self.n - 1
+        self.P[self.n] = 0
+        self.__release(old)
+        self.__shrink_if_sparse()
 
-    def __str__(self):
-        result = ''
+    def __iter__(self):
         for i in range(self.n):
-            result = result + str(self.A[i]) + ','
+            yield self.A[i]
 
-        return '[' + result[:-1] + ']'
+    def __contains__(self, item):
+        if self.dtype is not None:
+            try:
+                self.find(item)
+            except ValueError:
+                return False
+            return True
+        return any(x is item or x == item for x in self)
 
+    def __str__(self):
+        return '[' + ','.join(str(self.A[i]) for i in range(self.n)) + ']'
 
-    def pop(self):
+    def pop(self, pos=-1):
         if self.n == 0:
-            return 'Empty List'
-        print(self.A[self.n-1])
-        self.n = self.n - 1
+            raise IndexError('pop from empty list')
+        pos = self.__index(pos)
+        item = self.A[pos]
+        del self[pos]
+        return item
 
     def clear(self):
+        if self.__exported():
+            raise BufferError('Existing exports of data: object cannot be re-sized')
+        old, n = self.P, self.n
         self.n = 0
-        self.size = 1
+        self.__allocate(self.min_capacity)
+        for i in range(n):
+            self.__release(old[i])
 
     def find(self,item):
+        if self.dtype is not None:
+            np = _numpy()
+            if np is not None:
+                hits = np.flatnonzero(self.to_numpy() == item)
+                if len(hits):
+                    return int(hits[0])
+            else:
+                values = self.buffer().tolist()
+                if item in values:
+                    return values.index(item)
+            raise ValueError(f'{item!r} is not in list')
 
         for i in range(self.n):
             if self.A[i] == item:
                 return i
-        return 'ValueError - not in list'
+        raise ValueError(f'{item!r} is not in list')
 
     def insert(self,pos,item):
+        if pos < 0:
+            pos = max(0, pos + self.n)
+        pos = min(pos, self.n)
 
         if self.n == self.size:
-            self.__resize(self.size*2)
-
-        for i in range(self.n,pos,-1):
-            self.A[i] = self.A[i-1]
+            self.__resize(self.__grown(self.n + 1))
 
-        self.A[pos] = item
+        self.__move(pos + 1, pos, self.n - pos)
+        try:
+            self.__store(pos, item)
+        except (TypeError, OverflowError):
+            self.__move(pos, pos + 1, self.n - pos)
+            raise
         self.n = self.n + 1
 
     def remove(self,item):
-        # search and get pos
-        pos = self.find(item)
-        if type(pos) == int:
-        # delete
-            self.__delitem__(pos)
-        else:
-            return pos
+        # search and get pos, then delete
+        del self[self.find(item)]
+
+    def sum(self, start=0):
+        if self.dtype is None:
+            return sum(self, start)
+        np = _numpy()
+        if np is not None:
+            return start + self.to_numpy().sum().item()
+        return sum(self.buffer(), start)
+
+    def sort(self, key=None, reverse=False):
+        # Typed values are sorted in place in the buffer; objects only have
+        # their pointers permuted, so no reference counts change
+        if self.dtype is not None and key is None:
+            np = _numpy()
+            if np is not None:
+                view = self.to_numpy()
+                view.sort(kind='stable')
+                if reverse:
+                    view[:] = view[::-1].copy()
+                return
+            self.buffer()[:] = array(self.dtype, sorted(self.buffer().tolist(), reverse=reverse))
+            return
+        items = list(self)
+        order = sorted(range(self.n), key=lambda i: items[i] if key is None else key(items[i]), reverse=reverse)
+        values = [self.P[i] for i in order]
+        for i, value in enumerate(values):
+            self.P[i] = value
+
+    # Copies and pickles go through the items: a shallow copy of the instance
+    # would share the buffer and release every reference twice
+    def __copy__(self):
+        return MyList(self, self.growth_factor, self.min_capacity, self.dtype)
 
+    def __deepcopy__(self, memo):
+        import copy
+        result = MyList(growth_factor=self.growth_factor, min_capacity=self.min_capacity, dtype=self.dtype)
+        memo[id(self)] = result
+        result.extend([copy.deepcopy(x, memo) for x in self])
+        return result
 
-    def __make_array(self, capacity):
-        return (capacity*ctypes.py_object)()
-    
+    def __reduce__(self):
+        return (MyList, (list(self), self.growth_factor, self.min_capacity, self.dtype))
+
+    if sys.version_info >= (3, 12):
+        # memoryview(lst) / bytes(lst) need the Python-level buffer protocol (PEP 688);
+        # on older versions buffer() is the only entry point
+        def __buffer__(self, flags):
+            return self.buffer()
+
+    def buffer(self):
+        # Zero-copy memoryview of the live elements of a typed list, in its dtype format.
+        # While any view (or ndarray over one) is alive, growing or clearing the list
+        # raises BufferError, as bytearray does, instead of moving the data under it.
+        if self.dtype is None:
+            raise TypeError('buffer() needs a typed MyList, e.g. MyList(dtype="d")')
+        if self.__exporter is None:
+            self.__exporter = type(self.P).from_buffer(self.P)
+        return memoryview(self.__exporter).cast('B')[:self.n * self.itemsize].cast(self.dtype)
+
+    def __exported(self):
+        # Views are only ever taken from the exporter alias, and each one keeps a
+        # reference to it; beyond ours and getrefcount's argument, they are live exports
+        return self.__exporter is not None and sys.getrefcount(self.__exporter) > 2
+
+    def to_numpy(self):
+        # Zero-copy ndarray over the typed buffer
+        if self.dtype is None:
+            raise TypeError('to_numpy() needs a typed MyList, e.g. MyList(dtype="d")')
+        np = _numpy()
+        if np is None:
+            raise ImportError('NumPy is not installed')
+        return np.frombuffer(self.buffer(), dtype=self.dtype)
+
+    def __array__(self, dtype=None, copy=None):
+        arr = self.to_numpy()
+        return arr if dtype is None else arr.astype(dtype)
+
+    def memory_bytes(self):
+        # Storage plus, for object lists, the boxed elements themselves
+        total = self.size * self.itemsize
+        if self.dtype is None:
+            total += sum(sys.getsizeof(x) for x in self)
+        return total
+
+    def __del__(self):
+        if getattr(self, 'dtype', 0) is None:
+            for i in range(self.n):
+                _decref(self.P[i])
+        self.n = 0
 
-l = MyList()
-print(l.__str__())
-print(l.__len__())
-l.append(3)
-l.append(3)
-print(l.__getitem__(1))
-print(l.__str__())
-print(l.__len__())
 
+if __name__ == "__main__":
+    l = MyList()
+    print(l.__str__())
+    print(l.__len__())
+    l.append(3)
+    l.append(3)
+    print(l.__getitem__(1))
+    print(l.__str__())
+    print(l.__len__())
@@ -0,0 +1,120 @@
+import random
+import sys
+import time
+from array import array
+
+from myArray import MyList
+
+
+def best_of(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def appends(factory, n):
+    def run():
+        a = factory()
+        for i in range(n):
+            a.append(i)
+    return run
+
+
+def front_inserts(factory, n):
+    def run():
+        a = factory()
+        for i in range(n):
+            a.insert(0, i)
+    return run
+
+
+def front_deletes(factory, n):
+    def run():
+        a = factory()
+        a.extend(range(n))
+        for _ in range(n):
+            del a[0]
+    return run
+
+
+def extends(factory, n, batch=1000):
+    chunk = list(range(batch))
+    def run():
+        a = factory()
+        for _ in range(n // batch):
+            a.extend(chunk)
+    return run
+
+
+def slices(factory, n, width=1000):
+    def run():
+        a = factory()
+        a.extend(range(n))
+        for start in range(0, n - width, width):
+            a[start:start + width]
+    return run
+
+
+def growth_sweep(n=200000, factors=(1.25, 1.5, 2.0, 3.0)):
+    # Reallocations and peak slack per growth factor, plus the shrink path
+    print(f"Growth factor sweep: {n} appends, then pop back down to 0")
+    print(f"  {'factor':>6} {'reallocs':>9} {'slack':>7} {'append s':>9} {'pop s':>7} {'final cap':>10}")
+    for factor in factors:
+        a = MyList(growth_factor=factor)
+        reallocs, capacity = 0, a.size
+        start = time.perf_counter()
+        for i in range(n):
+            a.append(i)
+            if a.size != capacity:
+                reallocs, capacity = reallocs + 1, a.size
+        append_time = time.perf_counter() - start
+        slack = a.size / len(a) - 1
+        start = time.perf_counter()
+        while len(a):
+            a.pop()
+        pop_time = time.perf_counter() - start
+        print(f"  {factor:>6} {reallocs:>9} {slack:>7.0%} {append_time:>9.3f} {pop_time:>7.3f} {a.size:>10}")
+
+
+def bench_typed(n=1000000, dtype="d"):
+    # Memory per element and the buffer-backed helpers, object vs typed storage
+    rnd = random.Random(7)
+    values = [rnd.random() for _ in range(n)]
+    target = values[n * 3 // 4]
+    boxed, typed = MyList(values), MyList(values, dtype=dtype)
+    plain = list(values)
+    print(f"Typed storage: {n} floats")
+    print(f"  {'':<16} {'B/element':>10}")
+    print(f"  {'list':<16} {(sys.getsizeof(plain) + sum(map(sys.getsizeof, plain))) / n:>10.1f}")
+    print(f"  {'MyList':<16} {boxed.memory_bytes() / n:>10.1f}")
+    print(f"  {'MyList(d)':<16} {typed.memory_bytes() / n:>10.1f}")
+    print(f"  {'':<16} {'sum':>10} {'find':>10} {'sort':>10}  (seconds)")
+    for name, a in (("list", plain), ("MyList", boxed), ("MyList(d)", typed)):
+        total = best_of(lambda: a.sum() if isinstance(a, MyList) else sum(a))
+        find = best_of(lambda: a.find(target) if isinstance(a, MyList) else a.index(target))
+        def sort():
+            b = MyList(values, dtype=a.dtype) if isinstance(a, MyList) else list(values)
+            start = time.perf_counter()
+            b.sort()
+            return time.perf_counter() - start
+        sort_time = min(sort() for _ in range(3))
+        print(f"  {name:<16} {total:>10.4f} {find:>10.4f} {sort_time:>10.4f}")
+
+
+if __name__ == "__main__":
+    n = 100000
+    kinds = (("list", list), ("array('q')", lambda: array("q")), ("MyList", MyList),
+             ("MyList(q)", lambda: MyList(dtype="q")))
+    cases = (("append", appends, n), ("insert(0)", front_inserts, 20000),
+             ("del [0]", front_deletes, 20000), ("extend 1k", extends, n), ("slice 1k", slices, n))
+    print(f"{'seconds, best of 3':<20}" + "".join(f"{name:>12}" for name, _ in kinds))
+    for label, case, size in cases:
+        times = [best_of(case(factory, size)) for _, factory in kinds]
+        print(f"  {label:<10} n={size:<6}" + "".join(f"{t:>12.4f}" for t in times))
+    print()
+    growth_sweep()
+    print()
+    bench_typed()
@@ -1,15 +1,25 @@
+import contextlib
+import threading
+import time
+from queue import Empty, Full
+
+from stack import Chunk
+
 class Node:
+    __slots__ = ('data', 'next')
+
     def __init__(self, value):
         self.data = value
         self.next = None
 
 class LinkedListQueue:
-    def __init__(self):
+    def __init__(self, pool=None):
         self.front = None
         self.rear = None
+        self.pool = pool
 
     def enqueue(self, value):
-        new_node = Node(value)
+        new_node = self.pool.acquire(value) if self.pool else Node(value)
         if self.rear is None:  # Queue is empty
             self.front = self.rear = new_node
         else:
@@ -20,10 +30,13 @@ class LinkedListQueue:
         if self.front is None:
             print("Queue is empty")
             return None
-        val = self.front.data
-        self.front = self.front.next
+        node = self.front
+        val = node.data
+        self.front = node.next
         if self.front is None:  # Queue became empty
             self.rear = None
+        if self.pool:
+            self.pool.release(node)
         return val
 
     def peek(self):
@@ -31,58 +44,248 @@ class LinkedListQueue:
 
     def is_empty(self):
         return self.front is None
-q = LinkedListQueue()
-q.enqueue(10)
-q.enqueue(20)
-print(q.peek())
-print(q.dequeue())  # 10
-print(q.peek())     # 20
+
+class UnrolledQueue:
+    # Same API as LinkedListQueue over fixed-size chunks: enqueue fills the
+    # rear chunk, dequeue drains the front one, and one drained chunk is kept
+    # as a spare for the next time the rear fills up.
+    def __init__(self, chunk_size=64):
+        self.chunk_size = chunk_size
+        self.front = self.rear = None
+        self.spare = None
+
+    def enqueue(self, value):
+        chunk = self.rear
+        if chunk is None or chunk.end == self.chunk_size:
+            chunk = self.spare or Chunk(self.chunk_size)
+            self.spare = None
+            if self.rear is None:
+                self.front = chunk
+            else:
+                self.rear.next = chunk
+            self.rear = chunk
+        chunk.items[chunk.end] = value
+        chunk.end += 1
+
+    def dequeue(self):
+        chunk = self.front
+        if chunk is None:
+            print("Queue is empty")
+            return None
+        val = chunk.items[chunk.start]
+        chunk.items[chunk.start] = None
+        chunk.start += 1
+        if chunk.start == chunk.end:    # chunk drained
+            self.front = chunk.next
+            if self.front is None:
+                self.rear = None
+            chunk.start = chunk.end = 0
+            chunk.next = None
+            self.spare = chunk
+        return val
+
+    def peek(self):
+        return self.front.items[self.front.start] if self.front else None
+
+    def is_empty(self):
+        return self.front is None
 
 
 
 
 class CircularQueue:
-    def __init__(self, capacity):
+    # Ring buffer for handing work between threads. head and tail count the
+    # items ever taken and added, so the slot is counter % capacity and the
+    # length is tail - head.
+    #   default:    one lock with not_empty/not_full conditions, any number of
+    #               producers and consumers; growable=True doubles the buffer
+    #               (up to max_capacity) instead of reporting it full
+    #   spsc=True:  one producer and one consumer thread, no lock. The
+    #               producer only writes tail and the consumer only writes
+    #               head, each after its slots are copied; this relies on the
+    #               GIL making those stores atomic. Blocking calls poll.
+    def __init__(self, capacity, growable=False, max_capacity=None, spsc=False):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if spsc and growable:
+            raise ValueError("an SPSC queue cannot grow: resizing would race the consumer")
         self.queue = [None] * capacity
         self.size = capacity
-        self.front = self.rear = -1
+        self.growable = growable
+        self.max_capacity = max_capacity
+        self.spsc = spsc
+        self.head = 0
+        self.tail = 0
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+        self.guard = contextlib.nullcontext() if spsc else self.lock
 
-    def enqueue(self, value):
-        if (self.rear + 1) % self.size == self.front:
-            print("Queue is full")
-            return
+    def __len__(self):
+        return self.tail - self.head
+
+    def __iter__(self):
+        # Snapshot, oldest first
+        with self.guard:
+            return iter(self._slice(self.head, self.tail - self.head))
+
+    def is_empty(self):
+        return self.tail == self.head
+
+    def is_full(self):
+        return self.tail - self.head >= self.size
 
-        if self.front == -1:  # First element
-            self.front = 0
-        self.rear = (self.rear + 1) % self.size
-        self.queue[self.rear] = value
+    # ----------------------------
+    # Single items
+    # ----------------------------
+    def put(self, item, block=True, timeout=None):
+        with self.guard:
+            if not self._wait_for_space(block, timeout):
+                raise Full
+            self.queue[self.tail % self.size] = item
+            self.tail += 1
+            if not self.spsc:
+                self.not_empty.notify()
+
+    def get(self, block=True, timeout=None):
+        with self.guard:
+            if not self._wait(self.not_empty, lambda: self.tail != self.head, block, self._deadline(timeout)):
+                raise Empty
+            slot = self.head % self.size
+            item = self.queue[slot]
+            self.queue[slot] = None
+            self.head += 1
+            if not self.spsc:
+                self.not_full.notify()
+            return item
+
+    def put_nowait(self, item):
+        self.put(item, block=False)
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def enqueue(self, value):
+        # Raises queue.Full rather than dropping the value
+        self.put(value, block=False)
 
     def dequeue(self):
-        if self.front == -1:
-            print("Queue is empty")
+        try:
+            return self.get(block=False)
+        except Empty:
             return None
 
-        val = self.queue[self.front]
-        if self.front == self.rear:  # Only one element
-            self.front = self.rear = -1
-        else:
-            self.front = (self.front + 1) % self.size
-        return val
-
     def peek(self):
-        if self.front == -1:
-            return None
-        return self.queue[self.front]
+        with self.guard:
+            if self.tail == self.head:
+                return None
+            return self.queue[self.head % self.size]
 
-    def is_empty(self):
-        return self.front == -1
+    # ----------------------------
+    # Bulk transfers: at most two slice copies per batch
+    # ----------------------------
+    def put_many(self, items, block=True, timeout=None):
+        # Returns how many items went in; fewer than len(items) only when a
+        # non-blocking call or the timeout finds the queue full
+        items = items if isinstance(items, list) else list(items)
+        deadline = self._deadline(timeout)
+        done = 0
+        while done < len(items):
+            with self.guard:
+                if self.growable:
+                    self._grow(len(self) + len(items) - done)
+                if not self._wait(self.not_full, lambda: self.tail - self.head < self.size, block, deadline):
+                    break
+                count = min(self.size - (self.tail - self.head), len(items) - done)
+                start = self.tail % self.size
+                first = min(count, self.size - start)
+                self.queue[start:start + first] = items[done:done + first]
+                self.queue[:count - first] = items[done + first:done + count]
+                self.tail += count
+                done += count
+                if not self.spsc:
+                    self.not_empty.notify_all()
+        return done
+
+    def get_many(self, max_items, block=True, timeout=None):
+        # Waits for at least one item, then takes up to max_items of what is there
+        with self.guard:
+            if not self._wait(self.not_empty, lambda: self.tail != self.head, block, self._deadline(timeout)):
+                raise Empty
+            count = min(max_items, self.tail - self.head)
+            items = self._slice(self.head, count)
+            start = self.head % self.size
+            first = min(count, self.size - start)
+            self.queue[start:start + first] = [None] * first
+            self.queue[:count - first] = [None] * (count - first)
+            self.head += count
+            if not self.spsc:
+                self.not_full.notify_all()
+            return items
+
+    # ----------------------------
+    # Helpers; the caller holds the guard
+    # ----------------------------
+    def _slice(self, counter, count):
+        start = counter % self.size
+        if start + count <= self.size:
+            return self.queue[start:start + count]
+        return self.queue[start:] + self.queue[:start + count - self.size]
+
+    def _grow(self, needed):
+        # Unroll into a larger buffer so the oldest item lands in slot 0
+        capacity = self.size
+        while capacity < needed and (self.max_capacity is None or capacity < self.max_capacity):
+            capacity *= 2
+        if self.max_capacity is not None:
+            capacity = min(capacity, self.max_capacity)
+        if capacity <= self.size:
+            return False
+        count = self.tail - self.head
+        self.queue = self._slice(self.head, count) + [None] * (capacity - count)
+        self.size = capacity
+        self.head, self.tail = 0, count
+        return True
+
+    def _wait_for_space(self, block, timeout):
+        if self.tail - self.head < self.size or (self.growable and self._grow(self.size + 1)):
+            return True
+        return self._wait(self.not_full, lambda: self.tail - self.head < self.size, block, self._deadline(timeout))
+
+    def _deadline(self, timeout):
+        return None if timeout is None else time.monotonic() + timeout
+
+    def _wait(self, condition, ready, block, deadline):
+        if ready():
+            return True
+        if not block:
+            return False
+        if not self.spsc:
+            return condition.wait_for(ready, None if deadline is None else max(0, deadline - time.monotonic()))
+        # No lock to wait on: poll, backing off from a bare yield to 1 ms sleeps
+        delay = 0
+        while not ready():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(delay)
+            delay = min(delay * 2 or 5e-5, 1e-3)
+        return True
+
+
+if __name__ == "__main__":
+    q = LinkedListQueue()
+    q.enqueue(10)
+    q.enqueue(20)
+    print(q.peek())
+    print(q.dequeue())  # 10
+    print(q.peek())     # 20
 
+    cq = CircularQueue(3)
+    cq.enqueue(1)
+    cq.enqueue(2)
+    print(cq.peek())
+    cq.enqueue(3)  # Full now
+    cq.dequeue()   # 1 removed
+    cq.enqueue(4)  # wraps around
+    print(cq.peek())  # 2
 
-cq = CircularQueue(3)
-cq.enqueue(1)
-cq.enqueue(2)
-print(cq.peek())
-cq.enqueue(3)  # Full now
-cq.dequeue()   # 1 removed
-cq.enqueue(4)  # wraps around
-print(cq.peek())  # 2
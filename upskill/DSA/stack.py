@@ -1,18 +1,55 @@
+from array import array, typecodes
+
+# One code point per item: 'w' (UCS-4) where available, else the older 'u'
+_CHAR = 'w' if 'w' in typecodes else 'u'
+
 class Node:
+    __slots__ = ('data', 'next')
+
     def __init__(self, data):
         self.data = data
         self.next = None
 
+class NodePool:
+    # Free list of released nodes, so steady push/pop churn stops allocating.
+    # Any node type with data/next slots works; it can be shared between
+    # structures. At most max_free idle nodes are kept.
+    def __init__(self, node_type=Node, max_free=1 << 16):
+        self.node_type = node_type
+        self.max_free = max_free
+        self.free = None
+        self.free_count = 0
+        self.allocated = 0
+
+    def acquire(self, value):
+        node = self.free
+        if node is None:
+            self.allocated += 1
+            return self.node_type(value)
+        self.free = node.next
+        self.free_count -= 1
+        node.data = value
+        node.next = None
+        return node
+
+    def release(self, node):
+        node.data = None        # don't keep the popped value alive
+        if self.free_count < self.max_free:
+            node.next = self.free
+            self.free = node
+            self.free_count += 1
+
 class Stack:
-    def __init__(self):
+    def __init__(self, pool=None):
         self.top = None
         self.size = 0
+        self.pool = pool
 
     def is_empty(self):
         return self.top == None
     
     def push(self, value):
-        new_node = Node(value)
+        new_node = self.pool.acquire(value) if self.pool else Node(value)
         new_node.next = self.top
         self.top = new_node
         self.size += 1
@@ -31,9 +68,72 @@ class Stack:
     def pop(self):
         if self.is_empty():
             return "stack is empty"
-        popped_value = self.top.data
-        self.top = self.top.next
+        node = self.top
+        popped_value = node.data
+        self.top = node.next
+        self.size -= 1
+        if self.pool:
+            self.pool.release(node)
+        return popped_value
+
+class Chunk:
+    # One block of an unrolled linked list: up to len(items) values
+    __slots__ = ('items', 'start', 'end', 'next')
+
+    def __init__(self, capacity):
+        self.items = [None] * capacity
+        self.start = 0
+        self.end = 0
+        self.next = None
+
+class UnrolledStack:
+    # Same API as Stack, but values live in fixed-size chunks, so only one
+    # object is allocated per chunk_size pushes. One emptied chunk is kept
+    # as a spare so pushing and popping across a chunk boundary never allocates.
+    def __init__(self, chunk_size=64):
+        self.chunk_size = chunk_size
+        self.top = None
+        self.spare = None
+        self.size = 0
+
+    def is_empty(self):
+        return self.size == 0
+
+    def push(self, value):
+        chunk = self.top
+        if chunk is None or chunk.end == self.chunk_size:
+            chunk = self.spare or Chunk(self.chunk_size)
+            self.spare = None
+            chunk.next = self.top
+            self.top = chunk
+        chunk.items[chunk.end] = value
+        chunk.end += 1
+        self.size += 1
+
+    def traverse(self):
+        chunk = self.top
+        while chunk:
+            for i in range(chunk.end - 1, -1, -1):
+                print(chunk.items[i])
+            chunk = chunk.next
+
+    def peek(self):
+        if self.is_empty():
+            return "stack is empty"
+        return self.top.items[self.top.end - 1]
+
+    def pop(self):
+        if self.is_empty():
+            return "stack is empty"
+        chunk = self.top
+        chunk.end -= 1
+        popped_value = chunk.items[chunk.end]
+        chunk.items[chunk.end] = None
         self.size -= 1
+        if chunk.end == 0:
+            self.top = chunk.next
+            chunk.next = None
+            self.spare = chunk
         return popped_value
 
 
@@ -50,29 +150,141 @@ def reverse_string(s):
     
     return reversed_str
 
-def text_editor(text, pattern):
-    u = Stack()
-    r = Stack()
+class GapBuffer:
+    # Text as a flat character array with a movable gap at the edit point.
+    # Moving the gap shifts only the characters between the old and new
+    # position, as one block copy. The gap doubles when it runs out.
+    def __init__(self, text='', gap=64):
+        self.buf = array(_CHAR, text)
+        self.buf.extend(array(_CHAR, ' ' * gap))
+        self.gap_start = len(text)
+        self.gap_end = len(self.buf)
 
-    for i in text:
-        u.pusjh(i)
-    
-    for i in pattern:
-        if i == 'u':
-            data = u.pop()
-            r.push(data)
-        elif i == 'r':
-            data = r.pop()
-            u.push(data)     
-
-    res = ""
-
-    while not u.is_empty():
-        res += u.pop()+""
+    def __len__(self):
+        return len(self.buf) - (self.gap_end - self.gap_start)
+
+    def __str__(self):
+        return self.text()
+
+    def text(self):
+        return self.buf[:self.gap_start].tounicode() + self.buf[self.gap_end:].tounicode()
+
+    def _move_gap(self, pos):
+        if not 0 <= pos <= len(self):
+            raise IndexError('position out of range')
+        if pos < self.gap_start:
+            k = self.gap_start - pos
+            self.buf[self.gap_end - k:self.gap_end] = self.buf[pos:self.gap_start]
+            self.gap_start = pos
+            self.gap_end -= k
+        elif pos > self.gap_start:
+            k = pos - self.gap_start
+            self.buf[self.gap_start:pos] = self.buf[self.gap_end:self.gap_end + k]
+            self.gap_start = pos
+            self.gap_end += k
+
+    def insert(self, pos, text):
+        self._move_gap(pos)
+        if self.gap_end - self.gap_start < len(text):
+            grow = max(len(text), len(self.buf))
+            self.buf[self.gap_end:self.gap_end] = array(_CHAR, ' ' * grow)
+            self.gap_end += grow
+        self.buf[self.gap_start:self.gap_start + len(text)] = array(_CHAR, text)
+        self.gap_start += len(text)
+
+    def delete(self, pos, length):
+        # Returns the removed text
+        if length < 0:
+            raise ValueError('length must not be negative')
+        self._move_gap(pos)
+        length = min(length, len(self.buf) - self.gap_end)
+        removed = self.buf[self.gap_end:self.gap_end + length].tounicode()
+        self.gap_end += length
+        return removed
+
+class TextEditor:
+    # Undo and redo are Stacks of (kind, pos, text) edits. An edit moves
+    # between the two stacks as a shared tuple, so undo/redo never copy the
+    # document. A new edit drops the redo history.
+    def __init__(self, text=''):
+        self.buffer = GapBuffer(text)
+        self.undo_stack = Stack()
+        self.redo_stack = Stack()
+
+    def text(self):
+        return self.buffer.text()
+
+    def insert(self, pos, text):
+        if text:
+            self.buffer.insert(pos, text)
+            self._record(('insert', pos, text))
+
+    def delete(self, pos, length):
+        if length < 0:
+            raise ValueError('length must not be negative')
+        removed = self.buffer.delete(pos, length)
+        if removed:
+            self._record(('delete', pos, removed))
+        return removed
+
+    def undo(self):
+        if self.undo_stack.is_empty():
+            return False
+        kind, pos, text = edit = self.undo_stack.pop()
+        if kind == 'insert':
+            self.buffer.delete(pos, len(text))
+        else:
+            self.buffer.insert(pos, text)
+        self.redo_stack.push(edit)
+        return True
+
+    def redo(self):
+        if self.redo_stack.is_empty():
+            return False
+        kind, pos, text = edit = self.redo_stack.pop()
+        if kind == 'insert':
+            self.buffer.insert(pos, text)
+        else:
+            self.buffer.delete(pos, len(text))
+        self.undo_stack.push(edit)
+        return True
+
+    def apply(self, pattern):
+        # 'u' = undo, 'r' = redo. Only the net position in the history
+        # matters, so walk it as a counter (clamped at both ends) and then
+        # replay just the difference: O(len(pattern)) plus the net edits.
+        done = self.undo_stack.size
+        total = done + self.redo_stack.size
+        position = done
+        for command in pattern:
+            if command == 'u':
+                if position:
+                    position -= 1
+            elif command == 'r':
+                if position < total:
+                    position += 1
+        for _ in range(done - position):
+            self.undo()
+        for _ in range(position - done):
+            self.redo()
+
+    def _record(self, edit):
+        self.undo_stack.push(edit)
+        if not self.redo_stack.is_empty():
+            self.redo_stack = Stack()
+
+def text_editor(text, pattern):
+    # Type text one character per edit, then apply the 'u'/'r' pattern
+    editor = TextEditor()
+    for i, char in enumerate(text):
+        editor.insert(i, char)
+    editor.apply(pattern)
+    return editor.text()
         
 # Example usage
 if __name__ == "__main__":  
     input_string = "Hello, World!"
     reversed_string = reverse_string(input_string)
     print(f"Original String: {input_string}")
-    print(f"Reversed String: {reversed_string}")
\ No newline at end of file
+    print(f"Reversed String: {reversed_string}")
+    print(f"Edited: {text_editor('abcdef', 'uuuru')}")
\ No newline at end of file
@@ -0,0 +1,112 @@
+import random
+import time
+
+from stack import TextEditor, text_editor
+
+
+def document(n, seed=1):
+    rnd = random.Random(seed)
+    return ''.join(rnd.choice('abcdefghij klmnopqrstuvwxyz\n') for _ in range(n))
+
+
+def edit_script(n_chars, edits, seed=2):
+    # A cursor that mostly stays put and sometimes jumps, typing and deleting words
+    rnd = random.Random(seed)
+    script, cursor, length = [], n_chars // 2, n_chars
+    for _ in range(edits):
+        if rnd.random() < 0.05:
+            cursor = rnd.randrange(length + 1)
+        else:
+            cursor = max(0, min(length, cursor + rnd.randrange(-40, 41)))
+        if rnd.random() < 0.6:
+            word = 'word' * rnd.randrange(1, 4)
+            script.append(('insert', cursor, word))
+            length += len(word)
+        else:
+            k = rnd.randrange(1, 12)
+            script.append(('delete', cursor, k))
+            length -= min(k, length - cursor)
+    return script
+
+
+def run_edits(editor, script):
+    for kind, pos, arg in script:
+        if kind == 'insert':
+            editor.insert(pos, arg)
+        else:
+            editor.delete(pos, arg)
+
+
+class StringEditor:
+    # Baseline: the document as one str, rebuilt on every edit
+    def __init__(self, text):
+        self.doc = text
+
+    def insert(self, pos, text):
+        self.doc = self.doc[:pos] + text + self.doc[pos:]
+
+    def delete(self, pos, length):
+        self.doc = self.doc[:pos] + self.doc[pos + length:]
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def bench_edits(n=1000000, edits=200000):
+    doc = document(n)
+    script = edit_script(n, edits)
+    editor = TextEditor(doc)
+    seconds = timed(run_edits, editor, script)
+    baseline = StringEditor(doc)
+    sample = script[:2000]
+    base_seconds = timed(run_edits, baseline, sample)
+    check = StringEditor(doc)
+    run_edits(check, script)
+    assert editor.text() == check.doc
+    print(f"Edits on a {n}-character document")
+    print(f"  gap buffer : {edits} edits in {seconds:.2f} s ({seconds / edits * 1e6:.1f} us/edit)")
+    print(f"  str rebuild: {len(sample)} edits in {base_seconds:.2f} s ({base_seconds / len(sample) * 1e6:.1f} us/edit)")
+    return editor
+
+
+def bench_pattern(editor, commands=1000000, seed=3):
+    # Undo/redo commands wandering through the history, applied netted and one at a time
+    rnd = random.Random(seed)
+    pattern = ''.join(rnd.choice('ur') for _ in range(commands))
+    before = editor.text()
+    netted = timed(editor.apply, pattern)
+    after = editor.text()
+    editor.apply('r' * commands)
+    assert editor.text() == before
+
+    def stepwise():
+        for command in pattern:
+            if command == 'u':
+                editor.undo()
+            else:
+                editor.redo()
+    stepped = timed(stepwise)
+    assert editor.text() == after
+    print(f"Undo/redo pattern of {commands} commands over {editor.undo_stack.size + editor.redo_stack.size} edits")
+    print(f"  apply (netted): {netted:.3f} s")
+    print(f"  one at a time : {stepped:.3f} s")
+
+
+def bench_typing(n=1000000, commands=1000000, seed=4):
+    rnd = random.Random(seed)
+    pattern = ''.join(rnd.choice('uur') for _ in range(commands))
+    doc = document(n)
+    seconds = timed(text_editor, doc, pattern)
+    print(f"text_editor: {n} characters typed one edit each, then {commands} commands")
+    print(f"  {seconds:.2f} s")
+
+
+if __name__ == "__main__":
+    editor = bench_edits()
+    print()
+    bench_pattern(editor)
+    print()
+    bench_typing()
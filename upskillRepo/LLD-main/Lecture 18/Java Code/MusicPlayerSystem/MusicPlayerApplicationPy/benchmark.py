@@ -0,0 +1,472 @@
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from array import array
+
+from core.device_fanout import FanoutOutputDevice
+from core.playback_state import PlaybackSnapshot, SnapshotWriter
+from core.playlist_store import PlaylistStore
+from device.iaudio_output_device import IAudioOutputDevice
+from core.audio_engine import AudioEngine
+from models import Playlist, Song, SongTable
+from song_library import SongLibrary
+from song_search import SongSearchIndex
+from strategies import CustomQueueStrategy, RandomPlayStrategy, SequentialPlayStrategy
+
+ARTISTS = [f"Artist {i}" for i in range(5000)]
+SYLLABLES = [c + v for c in "bcdfghjklmnprstvwyz" for v in ("a", "e", "i", "o", "u", "ai", "ee", "oo")]
+
+
+# ----------------------------
+# Synthetic catalog
+# ----------------------------
+def write_manifest(path, count, seed=1):
+    rnd = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("title,artist,file_path\n")
+        for i in range(count):
+            f.write(f"Track {i},{rnd.choice(ARTISTS)},/music/{i}.mp3\n")
+
+
+def random_title(rnd):
+    words = ["".join(rnd.choice(SYLLABLES) for _ in range(rnd.randint(1, 3))) for _ in range(rnd.randint(1, 4))]
+    return " ".join(w.capitalize() for w in words)
+
+
+def build_library(count, seed=3):
+    rnd = random.Random(seed)
+    library = SongLibrary()
+    for i in range(count):
+        library.add_song(f"{random_title(rnd)} {i}", rnd.choice(ARTISTS), f"/music/{i}.mp3")
+    return library
+
+
+# ----------------------------
+# Library index: hash lookups vs the old linear scan
+# ----------------------------
+def linear_find(songs, title):
+    for s in songs:
+        if s.get_title() == title:
+            return s
+    return None
+
+
+def bench_library_index(count=500000, lookups=200):
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    os.close(fd)
+    try:
+        write_manifest(path, count)
+        library = SongLibrary()
+        start = time.perf_counter()
+        library.import_manifest(path)
+        import_elapsed = time.perf_counter() - start
+    finally:
+        os.remove(path)
+
+    rnd = random.Random(2)
+    titles = [f"Track {rnd.randrange(count)}" for _ in range(lookups)]
+    start = time.perf_counter()
+    for title in titles:
+        linear_find(library.songs, title)
+    scan_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    for title in titles:
+        library.find_by_title(title)
+    index_elapsed = time.perf_counter() - start
+
+    report = library.memory_report()
+    print(f"Song library: {count} songs")
+    print(f"  manifest import : {import_elapsed * 1000:10.0f} ms")
+    print(f"  linear scan     : {scan_elapsed / lookups * 1e6:10.1f} us/lookup")
+    print(f"  title index     : {index_elapsed / lookups * 1e6:10.3f} us/lookup")
+    print(f"  memory          : {report['bytes_per_song']:10.0f} bytes/song "
+          f"({report['song_bytes'] // count} song + {report['index_bytes'] // count} index)")
+
+
+# ----------------------------
+# Typeahead search: prefix and trigram fuzzy queries
+# ----------------------------
+def bench_search(count=200000, queries=200, k=10):
+    library = build_library(count)
+    start = time.perf_counter()
+    index = SongSearchIndex(library)
+    build_elapsed = time.perf_counter() - start
+
+    rnd = random.Random(4)
+    sample = [library.songs[rnd.randrange(count)].get_title() for _ in range(queries)]
+    prefixes = [t[:rnd.randint(2, 6)] for t in sample]
+    # One dropped character per query to exercise typo matching
+    typos = []
+    for t in sample:
+        i = rnd.randrange(len(t))
+        typos.append(t[:i] + t[i + 1:])
+
+    print(f"Song search: {count} songs, top-{k}")
+    print(f"  index build     : {build_elapsed * 1000:10.0f} ms")
+    for label, fn, batch in (("prefix query", index.prefix_search, prefixes),
+                             ("fuzzy query", index.fuzzy_search, typos),
+                             ("search (mixed)", index.search, prefixes)):
+        latencies = []
+        for query in batch:
+            start = time.perf_counter()
+            fn(query, k)
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+        print(f"  {label:<16}: p50 {latencies[len(latencies) // 2] * 1e6:8.0f} us"
+              f"   p99 {latencies[int(len(latencies) * 0.99)] * 1e6:8.0f} us")
+    found = sum(any(s.get_title() == t for s in index.fuzzy_search(q, k)) for t, q in zip(sample, typos))
+    print(f"  typo recall     : {found / queries:10.0%} of misspelled titles in top-{k}")
+
+
+# ----------------------------
+# CustomQueueStrategy: playlist position index vs linear scan
+# ----------------------------
+class LinearScanQueueStrategy(CustomQueueStrategy):
+    # Old position lookup, kept for comparison
+    def _move_to(self, song):
+        for i, s in enumerate(self.current_playlist.get_songs()):
+            if s == song:
+                self.current_index = i
+                break
+
+
+def bench_custom_queue(tracks=100000, queued=2000):
+    library = build_library(tracks)
+    playlist = Playlist("bench")
+    for song in library:
+        playlist.add_song_to_playlist(song)
+    rnd = random.Random(5)
+    picks = [library.songs[rnd.randrange(tracks)] for _ in range(queued)]
+
+    print(f"Custom queue: {tracks}-track playlist, {queued} queued songs")
+    for label, strategy in (("linear scan", LinearScanQueueStrategy()), ("position index", CustomQueueStrategy())):
+        strategy.set_playlist(playlist)
+        for song in picks:
+            strategy.add_to_next(song)
+        start = time.perf_counter()
+        for _ in range(queued):
+            strategy.next()
+        for _ in range(queued):
+            strategy.previous()
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<15}: {elapsed / (2 * queued) * 1e6:10.2f} us per next/previous")
+
+
+# ----------------------------
+# RandomPlayStrategy: lazy Fisher-Yates vs copy + pop(random index)
+# ----------------------------
+def pop_shuffle(songs, rnd):
+    # Old behaviour: copy the playlist, then pop a random index per track
+    remaining = list(songs)
+    while remaining:
+        remaining.pop(rnd.randint(0, len(remaining) - 1))
+
+
+def ensure_song_table(size):
+    table = SongTable.get_instance()
+    while len(table) < size:
+        table.register(Song(f"Track {len(table)}", "Artist", f"/music/{len(table)}.mp3"))
+    return table
+
+
+def bench_shuffle(tracks=1000000, old_tracks=100000, first_tracks=10):
+    ensure_song_table(tracks)
+    playlist = Playlist("bench", array("I", range(tracks)))
+
+    start = time.perf_counter()
+    pop_shuffle(playlist.get_songs()[:old_tracks], random.Random(6))
+    old_elapsed = time.perf_counter() - start
+
+    strategy = RandomPlayStrategy(seed=6)
+    start = time.perf_counter()
+    strategy.set_playlist(playlist)
+    for _ in range(first_tracks):
+        strategy.next()
+    first_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    while strategy.has_next():
+        strategy.next()
+    full_elapsed = time.perf_counter() - start + first_elapsed
+
+    print(f"Shuffle: {tracks}-track playlist")
+    print(f"  copy + pop       : {old_elapsed:8.2f} s for {old_tracks} tracks (O(n^2), not run at {tracks})")
+    print(f"  lazy Fisher-Yates: {first_elapsed * 1e6:7.0f} us to first {first_tracks} tracks, "
+          f"{full_elapsed:.2f} s full pass ({full_elapsed / tracks * 1e6:.2f} us/next)")
+    print(f"  history          : {len(strategy.history) * strategy.history.itemsize / 1e6:8.1f} MB array('I')")
+
+
+# ----------------------------
+# Playlist memory: Song lists vs id vectors into the song table
+# ----------------------------
+class LegacySong:
+    def __init__(self, title, artist, file_path):
+        self.title = title
+        self.artist = artist
+        self.file_path = file_path
+
+
+class LegacyPlaylist:
+    # Previous layout: a plain list of Song references
+    def __init__(self, name):
+        self.playlist_name = name
+        self.song_list = []
+    def add_song_to_playlist(self, song):
+        self.song_list.append(song)
+
+
+def _traced(build):
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def bench_playlist_memory(songs=100000, playlists=2000, tracks_per_playlist=200):
+    rnd = random.Random(8)
+    picks = [[rnd.randrange(songs) for _ in range(tracks_per_playlist)] for _ in range(playlists)]
+    meta = [(f"Track {i}", f"Artist {i % 5000}", f"/music/{i}.mp3") for i in range(songs)]
+
+    def build_legacy():
+        table = [LegacySong(*m) for m in meta]
+        result = {}
+        for n, ids in enumerate(picks):
+            playlist = result[f"p{n}"] = LegacyPlaylist(f"p{n}")
+            for i in ids:
+                playlist.add_song_to_playlist(table[i])
+        return table, result
+
+    def build_compact():
+        table = SongTable()
+        for m in meta:
+            table.register(Song(*m))
+        return table, {f"p{n}": Playlist(f"p{n}", array("I", ids)) for n, ids in enumerate(picks)}
+
+    _, legacy_bytes = _traced(build_legacy)
+    (table, compact), compact_bytes = _traced(build_compact)
+
+    fd, path = tempfile.mkstemp(suffix=".plst")
+    os.close(fd)
+    try:
+        PlaylistStore.save(path, list(compact.values()), table)
+        start = time.perf_counter()
+        store = PlaylistStore.open(path, table)
+        open_elapsed = time.perf_counter() - start
+        start = time.perf_counter()
+        store.load(f"p{playlists // 2}")
+        load_elapsed = time.perf_counter() - start
+        file_bytes = os.path.getsize(path)
+        store.close()
+    finally:
+        os.remove(path)
+
+    print(f"Playlist memory: {songs} songs, {playlists} playlists x {tracks_per_playlist} tracks")
+    print(f"  Song list layout : {legacy_bytes / 1e6:8.1f} MB")
+    print(f"  id vector layout : {compact_bytes / 1e6:8.1f} MB  ({1 - compact_bytes / legacy_bytes:.0%} less)")
+    print(f"  store file       : {file_bytes / 1e6:8.1f} MB, open {open_elapsed * 1000:.0f} ms, "
+          f"lazy playlist load {load_elapsed * 1e6:.0f} us")
+
+
+# ----------------------------
+# Gapless playback: read-then-play vs prefetch pipeline
+# ----------------------------
+class TimedDevice(IAudioOutputDevice):
+    # Stands in for a real output: "plays" each track for a fixed duration
+    def __init__(self, track_seconds):
+        self.track_seconds = track_seconds
+    def play_audio(self, song):
+        time.sleep(self.track_seconds)
+
+
+def drop_page_cache(paths):
+    # Make every run read from disk, not memory, where the OS allows it
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+def read_then_play(engine, device, strategy):
+    # Old behaviour: each track is loaded only once the previous one has finished
+    gaps = []
+    finished = None
+    while strategy.has_next():
+        song = strategy.next()
+        with open(song.get_file_path(), "rb") as f:
+            audio = f.read()
+        if finished is not None:
+            gaps.append((time.perf_counter() - finished) * 1000)
+        engine.play(device, song, audio)
+        finished = time.perf_counter()
+    return gaps
+
+
+def bench_gapless(tracks=12, track_mb=16, track_seconds=0.1, depth=4):
+    directory = tempfile.mkdtemp()
+    block = os.urandom(1 << 20)
+    playlist = Playlist("gapless")
+    paths = []
+    try:
+        for i in range(tracks):
+            path = os.path.join(directory, f"track{i}.raw")
+            with open(path, "wb") as f:
+                for _ in range(track_mb):
+                    f.write(block)
+            paths.append(path)
+            playlist.add_song_to_playlist(Song(f"Track {i}", "Artist", path))
+        device = TimedDevice(track_seconds)
+        engine = AudioEngine(prefetch_depth=depth)
+
+        print(f"Gapless playback: {tracks} tracks x {track_mb} MB, {track_seconds * 1000:.0f} ms per track")
+        for label, run in (("read then play", lambda strategy: read_then_play(engine, device, strategy)),
+                           ("prefetch pipeline", lambda strategy: engine.play_stream(device, strategy, playlist) or engine.track_gaps_ms)):
+            drop_page_cache(paths)
+            strategy = SequentialPlayStrategy()
+            strategy.set_playlist(playlist)
+            gaps = sorted(run(strategy))
+            print(f"  {label:<17}: gap mean {sum(gaps) / len(gaps):7.2f} ms   max {gaps[-1]:7.2f} ms")
+    finally:
+        for path in paths:
+            os.remove(path)
+        os.rmdir(directory)
+
+
+# ----------------------------
+# Multi-device output: serial play_audio calls vs per-device workers
+# ----------------------------
+def bench_fanout(tracks=100, latencies_ms=(5, 8, 40)):
+    devices = {f"device{i} ({ms} ms)": TimedDevice(ms / 1000) for i, ms in enumerate(latencies_ms)}
+    songs = [Song(f"Track {i}", "Artist", f"/music/{i}.mp3") for i in range(tracks)]
+
+    start = time.perf_counter()
+    for song in songs:
+        for device in devices.values():
+            device.play_audio(song)
+    serial_elapsed = time.perf_counter() - start
+
+    fanout = FanoutOutputDevice(capacity=8)
+    for name, device in devices.items():
+        fanout.add_device(name, device)
+    start = time.perf_counter()
+    for song in songs:
+        fanout.play_audio(song)
+    fanout_elapsed = time.perf_counter() - start
+    fanout.flush()
+    stats = fanout.get_stats()
+    fanout.close()
+
+    print(f"Device fan-out: {tracks} tracks to {len(devices)} outputs")
+    print(f"  serial calls    : {serial_elapsed * 1000 / tracks:8.2f} ms per track")
+    print(f"  fan-out workers : {fanout_elapsed * 1000 / tracks:8.2f} ms per track")
+    for name, s in stats.items():
+        print(f"    {name:<16} played {s['played']:4}  dropped {s['dropped']:4}  "
+              f"lag avg {s['avg_lag_ms']:7.1f} ms  max {s['max_lag_ms']:7.1f} ms")
+
+
+# ----------------------------
+# Playback state: snapshot cost on track change, resume vs replaying the shuffle
+# ----------------------------
+def bench_resume(tracks=1000000, played=500000, track_changes=200):
+    # Worst case for capture: a half-played shuffle holds the most swapped slots
+    ensure_song_table(tracks)
+    playlist = Playlist("resume", array("I", range(tracks)))
+    strategy = RandomPlayStrategy(seed=9)
+    strategy.set_playlist(playlist)
+    for _ in range(played):
+        strategy.next()
+
+    fd, path = tempfile.mkstemp(suffix=".state")
+    os.close(fd)
+    try:
+        writer = SnapshotWriter(path)
+        capture = 0.0
+        for _ in range(track_changes):
+            song = strategy.next()
+            start = time.perf_counter()
+            table = SongTable.get_instance()
+            song_count = len(table)
+            writer.submit(PlaybackSnapshot("resume", 2, song.song_id, strategy.snapshot_state(), song_count,
+                                           lambda: table.fingerprint(song_count), playlist.get_size()))
+            capture += time.perf_counter() - start
+        writer.close()
+        expected = [strategy.next() for _ in range(10)]
+        file_bytes = os.path.getsize(path)
+
+        start = time.perf_counter()
+        snapshot = PlaybackSnapshot.load(path)
+        resumed = RandomPlayStrategy()
+        resumed.restore_state(playlist, snapshot.state)
+        resume_elapsed = time.perf_counter() - start
+        matches = [resumed.next() for _ in range(10)] == expected
+    finally:
+        os.remove(path)
+
+    start = time.perf_counter()
+    replay = RandomPlayStrategy(seed=9)
+    replay.set_playlist(playlist)
+    for _ in range(played + track_changes):
+        replay.next()
+    replay_elapsed = time.perf_counter() - start
+
+    print(f"Playback state: {tracks}-track shuffle, {played + track_changes} played")
+    print(f"  playback thread : {capture / track_changes * 1000:8.2f} ms per track change (capture + hand-off)")
+    print(f"  writer thread   : {writer.writes} writes, {writer.coalesced} coalesced, {file_bytes / 1e6:.1f} MB snapshot")
+    print(f"  resume (mmap)   : {resume_elapsed * 1000:8.1f} ms   same next tracks: {matches}")
+    print(f"  replay shuffle  : {replay_elapsed * 1000:8.1f} ms")
+
+
+# ----------------------------
+# Cold start: python -X importtime report for the application module
+# ----------------------------
+LAZY_PACKAGES = ("strategies.", "device.", "external.")
+
+
+def import_times(module):
+    # One fresh interpreter; returns {module: (self us, cumulative us)} from -X importtime
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=os.path.dirname(os.path.abspath(__file__)),
+                            capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def bench_startup(module="music_player_application", target_ms=25.0, runs=15, top=6):
+    samples = sorted((import_times(module) for _ in range(runs)), key=lambda t: t[module][1])
+    median = samples[len(samples) // 2]
+    total_ms = median[module][1] / 1000
+    eager = sorted(name for name in median if name.startswith(LAZY_PACKAGES))
+
+    print(f"Cold start: import {module} (median of {runs} runs)")
+    print(f"  cumulative      : {total_ms:8.1f} ms  target {target_ms:.0f} ms  "
+          f"{'OK' if total_ms <= target_ms else 'OVER TARGET'}")
+    print(f"  loaded eagerly  : {', '.join(eager) if eager else 'no strategies/device adapters/APIs'}")
+    print(f"  slowest modules (self time):")
+    for name, (self_us, _) in sorted(median.items(), key=lambda item: -item[1][0])[:top]:
+        print(f"    {name:<28} {self_us / 1000:6.2f} ms")
+
+
+if __name__ == "__main__":
+    bench_library_index()
+    bench_search()
+    bench_custom_queue()
+    bench_shuffle()
+    bench_playlist_memory()
+    bench_gapless()
+    bench_fanout()
+    bench_resume(10000, 5000)
+    bench_resume()
+    bench_startup()
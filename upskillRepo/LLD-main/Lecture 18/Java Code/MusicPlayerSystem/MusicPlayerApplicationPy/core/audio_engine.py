@@ -1,9 +1,36 @@
+import time
+
 class AudioEngine:
-    def __init__(self):
+    def __init__(self, prefetch_depth=4):
         self.current_song_title = None
-    def play(self, device, song):
+        self.current_audio = None       # bytes of the playing track, None if not loaded
+        self.prefetch_depth = prefetch_depth
+        self.track_gaps_ms = []         # idle time between consecutive tracks of the last stream
+        self.pipeline = None            # PlaybackPipeline of the stream in progress
+    def play(self, device, song, audio=None):
+        self.current_audio = audio
         device.play_audio(song)
         self.current_song_title = song.get_title()
+    def play_stream(self, device, strategy, playlist, capture=None, on_track=None):
+        # Gapless playback: tracks are fetched ahead on a background thread.
+        # on_track(captured) runs as each track starts, with what capture(song) returned for it.
+        from core.playback_pipeline import PlaybackPipeline
+        pipeline = PlaybackPipeline(strategy, playlist, self.prefetch_depth, capture)
+        self.pipeline = pipeline.start()
+        self.track_gaps_ms = []
+        finished = None
+        try:
+            for song, audio, captured in pipeline:
+                if on_track is not None:
+                    on_track(captured)
+                if finished is not None:
+                    self.track_gaps_ms.append((time.perf_counter() - finished) * 1000)
+                self.play(device, song, audio)
+                finished = time.perf_counter()
+            device.flush()
+        finally:
+            self.pipeline = None
+            pipeline.stop()
     def pause(self):
         print(f"Paused: {self.current_song_title}")
     def get_current_song_title(self):
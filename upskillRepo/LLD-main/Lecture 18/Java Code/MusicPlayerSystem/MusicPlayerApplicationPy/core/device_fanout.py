@@ -0,0 +1,145 @@
+import threading
+import time
+from collections import deque
+
+from device.iaudio_output_device import IAudioOutputDevice
+
+class DeviceStats:
+    # Per-device counters; lag is the time a track waited in the queue before it started
+    def __init__(self):
+        self.played = 0
+        self.dropped = 0
+        self.errors = 0
+        self.total_lag = 0.0
+        self.max_lag = 0.0
+    def snapshot(self, backlog):
+        return {
+            "played": self.played,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "backlog": backlog,
+            "avg_lag_ms": self.total_lag / self.played * 1000 if self.played else 0.0,
+            "max_lag_ms": self.max_lag * 1000,
+        }
+
+class DeviceWorker:
+    # Owns one output device: a bounded queue drained by a dedicated thread.
+    # When the device falls behind and the queue is full, the oldest pending
+    # track is dropped so the device skips ahead instead of blocking the caller.
+    def __init__(self, name, device, capacity=8, progress=None):
+        self.name = name
+        self.device = device
+        self.capacity = capacity
+        self.pending = deque()      # (song, enqueued at)
+        self.stats = DeviceStats()
+        self.cond = threading.Condition()
+        self.running = True
+        self.busy = False           # a track is playing on the device right now
+        self.progress = progress    # Condition notified whenever a track starts or the worker stops
+        self.thread = threading.Thread(target=self._run, name=f"audio-out-{name}", daemon=True)
+        self.thread.start()
+    def submit(self, song):
+        with self.cond:
+            if not self.running:
+                return
+            if len(self.pending) == self.capacity:
+                self.pending.popleft()
+                self.stats.dropped += 1
+            self.pending.append((song, time.perf_counter()))
+            self.cond.notify_all()
+    def stop(self):
+        # An idle worker is joined; one still inside play_audio is not waited for,
+        # it exits (daemon thread) as soon as that track ends and plays nothing more
+        with self.cond:
+            self.running = False
+            self.stats.dropped += len(self.pending)
+            self.pending.clear()
+            self.cond.notify_all()
+            busy = self.busy
+        self._notify_progress()
+        if not busy and self.thread is not threading.current_thread():
+            self.thread.join()
+    def flush(self, timeout=None):
+        # Waits until every queued track has been played; False on timeout
+        with self.cond:
+            return self.cond.wait_for(lambda: not (self.pending or self.busy) or not self.running, timeout)
+    def get_stats(self):
+        with self.cond:
+            return self.stats.snapshot(len(self.pending))
+    def backlog(self):
+        # Tracks queued that the device has not started yet
+        with self.cond:
+            return len(self.pending) if self.running else 0
+    def _notify_progress(self):
+        if self.progress is not None:
+            with self.progress:
+                self.progress.notify_all()
+    def _run(self):
+        while True:
+            with self.cond:
+                while not self.pending and self.running:
+                    self.cond.wait()
+                if not self.running:
+                    return
+                song, enqueued = self.pending.popleft()
+                self.busy = True
+            self._notify_progress()
+            lag = time.perf_counter() - enqueued
+            try:
+                self.device.play_audio(song)
+                failed = False
+            except Exception:
+                failed = True
+            with self.cond:
+                self.busy = False
+                self.cond.notify_all()
+                if failed:
+                    self.stats.errors += 1
+                else:
+                    self.stats.played += 1
+                    self.stats.total_lag += lag
+                    self.stats.max_lag = max(self.stats.max_lag, lag)
+
+class FanoutOutputDevice(IAudioOutputDevice):
+    # Plays every track on all connected devices at once. play_audio queues the
+    # track on each device's worker and returns once the fastest device has
+    # started it, so playback is paced by the quickest output and stays at most
+    # `lead` tracks ahead of it. A slower device only drops tracks once it lags
+    # a full queue (`capacity` tracks) behind.
+    def __init__(self, capacity=8, lead=1):
+        if not 1 <= lead <= capacity:
+            raise Exception("Fan-out lead must be between 1 and the queue capacity.")
+        self.capacity = capacity
+        self.lead = lead
+        self.workers = {}
+        self.progress = threading.Condition()
+    def add_device(self, name, device):
+        self.remove_device(name)
+        self.workers[name] = DeviceWorker(name, device, self.capacity, self.progress)
+    def remove_device(self, name):
+        worker = self.workers.pop(name, None)
+        if worker is not None:
+            worker.stop()
+    def play_audio(self, song):
+        if not self.workers:
+            raise Exception("No output device is connected.")
+        for worker in list(self.workers.values()):
+            worker.submit(song)
+        with self.progress:
+            self.progress.wait_for(self._caught_up)
+    def _caught_up(self):
+        # The fastest device has fewer than `lead` tracks waiting; a removed device stops counting
+        return min((worker.backlog() for worker in list(self.workers.values())), default=0) < self.lead
+    def flush(self, timeout=None):
+        # Blocks until every device has played what was queued for it
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        for worker in list(self.workers.values()):
+            remaining = None if deadline is None else max(0.0, deadline - time.perf_counter())
+            if not worker.flush(remaining):
+                return False
+        return True
+    def get_stats(self):
+        return {name: worker.get_stats() for name, worker in self.workers.items()}
+    def close(self):
+        for name in list(self.workers):
+            self.remove_device(name)
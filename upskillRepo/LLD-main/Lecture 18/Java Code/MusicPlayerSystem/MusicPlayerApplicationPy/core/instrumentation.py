@@ -0,0 +1,56 @@
+import time
+
+from device.iaudio_output_device import IAudioOutputDevice
+from strategies.play_strategy import PlayStrategy
+
+# ----------------------------
+# Proxies the facade swaps in while telemetry is enabled
+# ----------------------------
+class InstrumentedStrategy(PlayStrategy):
+    # Counts every strategy call and times the ones that move the cursor
+    def __init__(self, strategy, telemetry):
+        self.strategy = strategy
+        self.telemetry = telemetry
+        self.name = type(strategy).__name__
+    def set_playlist(self, playlist):
+        self.telemetry.count("strategy", self.name, "set_playlist")
+        self.strategy.set_playlist(playlist)
+    def has_next(self):
+        self.telemetry.count("strategy", self.name, "has_next")
+        return self.strategy.has_next()
+    def has_previous(self):
+        self.telemetry.count("strategy", self.name, "has_previous")
+        return self.strategy.has_previous()
+    def next(self):
+        start = time.perf_counter_ns()
+        try:
+            return self.strategy.next()
+        finally:
+            self.telemetry.record("strategy", self.name, "next", time.perf_counter_ns() - start)
+    def previous(self):
+        start = time.perf_counter_ns()
+        try:
+            return self.strategy.previous()
+        finally:
+            self.telemetry.record("strategy", self.name, "previous", time.perf_counter_ns() - start)
+    def add_to_next(self, song):
+        self.telemetry.count("strategy", self.name, "add_to_next")
+        self.strategy.add_to_next(song)
+    def snapshot_state(self):
+        return self.strategy.snapshot_state()
+    def restore_state(self, playlist, state):
+        self.strategy.restore_state(playlist, state)
+
+class InstrumentedDevice(IAudioOutputDevice):
+    def __init__(self, device, telemetry):
+        self.device = device
+        self.telemetry = telemetry
+        self.name = type(device).__name__
+    def play_audio(self, song):
+        start = time.perf_counter_ns()
+        try:
+            self.device.play_audio(song)
+        finally:
+            self.telemetry.record("device", self.name, "play_audio", time.perf_counter_ns() - start)
+    def flush(self):
+        self.device.flush()
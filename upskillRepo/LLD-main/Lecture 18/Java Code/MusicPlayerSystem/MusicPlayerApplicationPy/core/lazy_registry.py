@@ -0,0 +1,25 @@
+import importlib
+
+class LazyRegistry:
+    # Maps keys to "module:attribute" paths. A module is only imported the
+    # first time one of its keys is loaded, which keeps startup cheap.
+    def __init__(self, kind, entries=None):
+        self.kind = kind
+        self.entries = dict(entries or {})
+        self.loaded = {}
+    def register(self, key, path):
+        self.entries[key] = path
+        self.loaded.pop(key, None)
+    def __contains__(self, key):
+        return key in self.entries
+    def keys(self):
+        return list(self.entries)
+    def load(self, key):
+        value = self.loaded.get(key)
+        if value is None:
+            path = self.entries.get(key)
+            if path is None:
+                raise Exception(f"No {self.kind} registered for {key}.")
+            module_name, _, attr = path.partition(":")
+            value = self.loaded[key] = getattr(importlib.import_module(module_name), attr)
+        return value
@@ -0,0 +1,143 @@
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+class AudioRingBuffer:
+    # Bounded FIFO of decoded tracks shared by one producer and one consumer.
+    # put() blocks while all slots are full, get() blocks while they are empty.
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise Exception("Ring buffer capacity must be at least 1.")
+        self.slots = [None] * capacity
+        self.head = 0               # next slot to read
+        self.count = 0
+        self.closed = False
+        self.error = None
+        self.cond = threading.Condition()
+    def put(self, item):
+        with self.cond:
+            while self.count == len(self.slots) and not self.closed:
+                self.cond.wait()
+            if self.closed:
+                return False
+            self.slots[(self.head + self.count) % len(self.slots)] = item
+            self.count += 1
+            self.cond.notify_all()
+            return True
+    def get(self):
+        # Returns None once the buffer is closed and drained
+        with self.cond:
+            while self.count == 0 and not self.closed:
+                self.cond.wait()
+            if self.count == 0:
+                if self.error is not None:
+                    raise self.error
+                return None
+            item = self.slots[self.head]
+            self.slots[self.head] = None
+            self.head = (self.head + 1) % len(self.slots)
+            self.count -= 1
+            self.cond.notify_all()
+            return item
+    def clear(self):
+        with self.cond:
+            self.slots = [None] * len(self.slots)
+            self.head = 0
+            self.count = 0
+            self.cond.notify_all()
+    def close(self, error=None):
+        with self.cond:
+            self.closed = True
+            self.error = error
+            self.cond.notify_all()
+    def __len__(self):
+        with self.cond:
+            return self.count
+
+class PlaybackPipeline:
+    # Read-ahead for a PlayStrategy: a background thread pulls the next songs
+    # from the strategy and loads their files into the ring buffer, so the
+    # consumer finds each track ready the moment the previous one finishes.
+    # The strategy runs up to `depth` tracks ahead of what is being played, so
+    # `capture(song)`, when given, records strategy state right after each pick
+    # and travels with the track.
+    # Everything that touches the strategy holds `lock`. Other threads edit it
+    # through editing(), which first rewinds it to the track actually playing.
+    def __init__(self, strategy, playlist, depth=4, capture=None):
+        self.strategy = strategy
+        self.playlist = playlist
+        self.capture = capture
+        self.buffer = AudioRingBuffer(depth)
+        self.lock = threading.RLock()
+        self.epoch = 0              # bumped by every rewind; older buffered tracks are dropped
+        self.pending = deque()      # strategy state before each prefetched, unplayed track
+        self.thread = None
+    def start(self):
+        with self.lock:
+            self._start_producer()
+        return self
+    def stop(self):
+        self.buffer.close()
+        thread = self.thread
+        if thread.is_alive() and thread is not threading.current_thread():
+            thread.join()
+        with self.lock:
+            self.rewind()
+    @contextmanager
+    def editing(self):
+        # Holds off the prefetch thread while the caller moves the strategy
+        with self.lock:
+            self.rewind()
+            yield self.strategy
+    def rewind(self):
+        # Caller holds the lock. Puts the strategy back to just after the last
+        # track handed to the consumer and lets the producer pick again from there.
+        self.epoch += 1
+        self.buffer.clear()
+        if self.pending:
+            self.strategy.restore_state(self.playlist, self.pending[0])
+            self.pending.clear()
+        if not self.buffer.closed:
+            self._start_producer()      # the old thread exits at its next pick
+    def __iter__(self):
+        while True:
+            item = self.buffer.get()
+            if item is None:
+                return
+            epoch, track = item
+            with self.lock:
+                if epoch != self.epoch:
+                    continue        # picked before a rewind
+                if track is None:
+                    return          # strategy exhausted
+                self.pending.popleft()
+            yield track
+    def _start_producer(self):
+        self.thread = threading.Thread(target=self._produce, args=(self.epoch,), name="playback-prefetch", daemon=True)
+        self.thread.start()
+    def _produce(self, epoch):
+        try:
+            while True:
+                with self.lock:
+                    if epoch != self.epoch:
+                        return      # a newer producer took over after a rewind
+                    if not self.strategy.has_next():
+                        break
+                    before = self.strategy.snapshot_state()
+                    song = self.strategy.next()
+                    captured = self.capture(song) if self.capture is not None else None
+                    self.pending.append(before)
+                if not self.buffer.put((epoch, (song, self.read_audio(song), captured))):
+                    return          # stopped by the consumer
+            self.buffer.put((epoch, None))
+        except Exception as error:
+            with self.lock:
+                if epoch == self.epoch:
+                    self.buffer.close(error)
+    def read_audio(self, song):
+        # Missing files play as metadata only, the way devices did before
+        try:
+            with open(song.get_file_path(), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
@@ -0,0 +1,189 @@
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+
+# File layout (little-endian):
+#   b"PBST" | u32 version | u32 strategy type | i64 current song id (-1: none)
+#   u32 song table size | 16-byte song table fingerprint | u32 playlist size
+#   u32 playlist name length, name | u32 field count
+#   fields: u8 name length, name, u8 kind, payload
+#     kind b"q": i64 | kind b"d": f64 | kind b"I": u32 count + u32 values
+#     kind b"M": u32 count + u32 keys + u32 values (a dict of u32 -> u32)
+_MAGIC = b"PBST"
+_VERSION = 2
+_U8 = struct.Struct("<B")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+def _u32_bytes(values):
+    if sys.byteorder != "little":
+        values = array("I", values)
+        values.byteswap()
+    return values.tobytes()
+
+def _u32_array(buf, offset, count):
+    values = array("I")
+    values.frombytes(buf[offset:offset + 4 * count])
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+def resolve_state(state):
+    # Strategy state values may be zero-argument functions that build the real
+    # value, so capturing stays cheap and the copying happens where it is used
+    return {key: value() if callable(value) else value for key, value in state.items()}
+
+class PlaybackSnapshot:
+    # What is needed to pick playback up again: the playlist, the strategy type
+    # and the strategy's own state (ints, floats, u32 arrays and u32 -> u32
+    # dicts keyed by name, or functions returning one). Functions are called and
+    # dicts turned into arrays only in encode(), so that work happens on the
+    # writer thread. Song ids are SongTable ids, so the table size and
+    # fingerprint (and the playlist size) are kept to check that the ids still
+    # mean the same songs when resuming; the fingerprint may be a function too.
+    def __init__(self, playlist_name, strategy_type, current_song_id, state,
+                 song_count=0, song_fingerprint=bytes(16), playlist_size=0):
+        self.playlist_name = playlist_name
+        self.strategy_type = strategy_type
+        self.current_song_id = current_song_id
+        self.state = state
+        self.song_count = song_count
+        self.song_fingerprint = song_fingerprint
+        self.playlist_size = playlist_size
+
+    def encode(self):
+        name = self.playlist_name.encode("utf-8")
+        current = -1 if self.current_song_id is None else self.current_song_id
+        fingerprint = self.song_fingerprint() if callable(self.song_fingerprint) else self.song_fingerprint
+        parts = [_MAGIC, _U32.pack(_VERSION), _U32.pack(self.strategy_type), _I64.pack(current),
+                 _U32.pack(self.song_count), fingerprint, _U32.pack(self.playlist_size),
+                 _U32.pack(len(name)), name, _U32.pack(len(self.state))]
+        for key, value in resolve_state(self.state).items():
+            key = key.encode("ascii")
+            parts.append(_U8.pack(len(key)) + key)
+            if isinstance(value, array):
+                parts.append(b"I" + _U32.pack(len(value)))
+                parts.append(_u32_bytes(value))
+            elif isinstance(value, dict):
+                keys, values = array("I"), array("I")
+                keys.fromlist(list(value))
+                values.fromlist(list(value.values()))
+                parts.append(b"M" + _U32.pack(len(value)))
+                parts.append(_u32_bytes(keys) + _u32_bytes(values))
+            elif isinstance(value, float):
+                parts.append(b"d" + _F64.pack(value))
+            else:
+                parts.append(b"q" + _I64.pack(value))
+        return b"".join(parts)
+
+    @classmethod
+    def decode(cls, buf):
+        if buf[:4] != _MAGIC or _U32.unpack_from(buf, 4)[0] != _VERSION:
+            raise Exception("Not a playback snapshot.")
+        strategy_type = _U32.unpack_from(buf, 8)[0]
+        current = _I64.unpack_from(buf, 12)[0]
+        song_count = _U32.unpack_from(buf, 20)[0]
+        song_fingerprint = bytes(buf[24:40])
+        playlist_size = _U32.unpack_from(buf, 40)[0]
+        length = _U32.unpack_from(buf, 44)[0]
+        pos = 48
+        playlist_name = bytes(buf[pos:pos + length]).decode("utf-8")
+        pos += length
+        field_count = _U32.unpack_from(buf, pos)[0]
+        pos += 4
+        state = {}
+        for _ in range(field_count):
+            length = buf[pos]
+            key = bytes(buf[pos + 1:pos + 1 + length]).decode("ascii")
+            pos += 1 + length
+            kind = buf[pos:pos + 1]
+            pos += 1
+            if kind == b"I":
+                count = _U32.unpack_from(buf, pos)[0]
+                value = _u32_array(buf, pos + 4, count)
+                pos += 4 + 4 * count
+            elif kind == b"M":
+                count = _U32.unpack_from(buf, pos)[0]
+                keys = _u32_array(buf, pos + 4, count)
+                value = dict(zip(keys, _u32_array(buf, pos + 4 + 4 * count, count)))
+                pos += 4 + 8 * count
+            elif kind == b"d":
+                value = _F64.unpack_from(buf, pos)[0]
+                pos += 8
+            else:
+                value = _I64.unpack_from(buf, pos)[0]
+                pos += 8
+            state[key] = value
+        return cls(playlist_name, strategy_type, None if current < 0 else current, state,
+                   song_count, song_fingerprint, playlist_size)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return cls.decode(mm)
+
+class SnapshotWriter:
+    # Persists snapshots on a background thread so the playback thread only
+    # hands over a captured state. Only the latest pending snapshot is kept:
+    # if tracks change faster than the disk keeps up, older ones are skipped.
+    # Each write goes to a temp file, is fsynced, then renamed over the old one.
+    def __init__(self, path):
+        self.path = path
+        self.pending = None
+        self.writing = False
+        self.running = True
+        self.writes = 0
+        self.coalesced = 0
+        self.last_error = None
+        self.cond = threading.Condition()
+        self.thread = threading.Thread(target=self._run, name="playback-snapshot", daemon=True)
+        self.thread.start()
+    def submit(self, snapshot):
+        with self.cond:
+            if self.pending is not None:
+                self.coalesced += 1
+            self.pending = snapshot
+            self.cond.notify_all()
+    def flush(self):
+        with self.cond:
+            while self.pending is not None or self.writing:
+                self.cond.wait()
+    def close(self):
+        self.flush()
+        with self.cond:
+            self.running = False
+            self.cond.notify_all()
+        self.thread.join()
+    def _run(self):
+        while True:
+            with self.cond:
+                while self.pending is None and self.running:
+                    self.cond.wait()
+                if self.pending is None:
+                    return
+                snapshot, self.pending = self.pending, None
+                self.writing = True
+            error = None
+            try:
+                self._write(snapshot.encode())
+            except Exception as e:
+                error = e           # keep the previous snapshot; the next track change retries
+            finally:
+                # Always clear writing, or flush() and close() would wait forever
+                with self.cond:
+                    self.writing = False
+                    self.last_error = error
+                    self.writes += error is None
+                    self.cond.notify_all()
+    def _write(self, data):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
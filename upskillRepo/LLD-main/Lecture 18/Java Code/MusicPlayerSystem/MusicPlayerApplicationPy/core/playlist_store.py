@@ -0,0 +1,103 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from models import Playlist, Song, SongTable
+
+# File layout (little-endian):
+#   b"PLST" | u32 version | u32 song count | songs: 3 x (u32 length + utf-8 bytes)
+#   u32 playlist count | playlists: u32 name length, name, u32 id count, u32 ids
+_MAGIC = b"PLST"
+_VERSION = 1
+_U32 = struct.Struct("<I")
+
+class PlaylistStore:
+    # Playlists persisted as raw u32 id vectors. open() maps the file, checks the
+    # stored songs against the table and reads the playlist headers; load()
+    # copies a single playlist's ids out of the mapping.
+    def __init__(self, path, mm, directory):
+        self.path = path
+        self.mm = mm
+        self.directory = directory      # playlist name -> (offset of ids, id count)
+
+    @staticmethod
+    def save(path, playlists, song_table=None):
+        song_table = SongTable.get_instance() if song_table is None else song_table
+        # Write a temp file and rename it, so a store still mapping the old file stays valid
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_MAGIC + _U32.pack(_VERSION) + _U32.pack(len(song_table)))
+            for song in song_table.songs:
+                for field in (song.get_title(), song.get_artist(), song.get_file_path()):
+                    data = field.encode("utf-8")
+                    f.write(_U32.pack(len(data)) + data)
+            f.write(_U32.pack(len(playlists)))
+            for playlist in playlists:
+                name = playlist.get_playlist_name().encode("utf-8")
+                ids = playlist.get_song_ids()
+                if sys.byteorder != "little":
+                    ids = array("I", ids)
+                    ids.byteswap()
+                f.write(_U32.pack(len(name)) + name + _U32.pack(len(ids)))
+                f.write(ids.tobytes())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def open(cls, path, song_table=None):
+        song_table = SongTable.get_instance() if song_table is None else song_table
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if mm[:4] != _MAGIC or _U32.unpack_from(mm, 4)[0] != _VERSION:
+            mm.close()
+            raise Exception(f"'{path}' is not a playlist store.")
+        song_count = _U32.unpack_from(mm, 8)[0]
+        pos = 12
+        fresh = len(song_table) == 0
+        if not fresh and len(song_table) != song_count:
+            mm.close()
+            raise Exception(f"'{path}' was saved with {song_count} songs, table has {len(song_table)}.")
+        for song_id in range(song_count):
+            fields = []
+            for _ in range(3):
+                length = _U32.unpack_from(mm, pos)[0]
+                fields.append(mm[pos + 4:pos + 4 + length].decode("utf-8"))
+                pos += 4 + length
+            if fresh:
+                song_table.register(Song(*fields))
+                continue
+            # Playlists hold table ids, so every id must still name the same song
+            song = song_table.get(song_id)
+            if (song.get_title(), song.get_artist(), song.get_file_path()) != tuple(fields):
+                mm.close()
+                raise Exception(f"'{path}' does not match the song table: id {song_id} was '{fields[0]}', "
+                                f"table has '{song.get_title()}'.")
+        directory = {}
+        playlist_count = _U32.unpack_from(mm, pos)[0]
+        pos += 4
+        for _ in range(playlist_count):
+            length = _U32.unpack_from(mm, pos)[0]
+            name = mm[pos + 4:pos + 4 + length].decode("utf-8")
+            pos += 4 + length
+            count = _U32.unpack_from(mm, pos)[0]
+            directory[name] = (pos + 4, count)
+            pos += 4 + 4 * count
+        return cls(path, mm, directory)
+
+    def names(self):
+        return list(self.directory)
+
+    def __contains__(self, name):
+        return name in self.directory
+
+    def load(self, name):
+        offset, count = self.directory[name]
+        ids = array("I")
+        ids.frombytes(self.mm[offset:offset + 4 * count])
+        if sys.byteorder != "little":
+            ids.byteswap()
+        return Playlist(name, ids)
+
+    def close(self):
+        self.mm.close()
@@ -0,0 +1,60 @@
+import random
+from array import array
+
+class ShuffleEngine:
+    # Lazy Fisher-Yates over the virtual index array [0, size): untouched slots
+    # hold their own index, so only swapped slots are stored. Each draw is O(1)
+    # and nothing is allocated up front.
+    # For snapshots, the state at base_drawn is kept as an untouched dict plus a log
+    # of the draws made since; frozen() hands out that pair without copying.
+    REBASE_MIN = 4096
+    def __init__(self, size, rng=None):
+        self.size = size
+        self.drawn = 0
+        self.swapped = {}
+        self.rng = rng if rng is not None else random.Random()
+        self.base_drawn = 0
+        self.base_swapped = {}      # swapped as it was at base_drawn; never mutated
+        self.draws = array("I")     # j of each draw since base_drawn
+    def remaining(self):
+        return self.size - self.drawn
+    def has_next(self):
+        return self.drawn < self.size
+    def next_index(self):
+        if self.drawn >= self.size:
+            raise Exception("No songs left to play")
+        i = self.drawn
+        j = self.rng.randrange(i, self.size)
+        chosen = self.swapped.get(j, j)
+        if j != i:
+            self.swapped[j] = self.swapped.get(i, i)
+        self.swapped.pop(i, None)   # slot i is behind the cursor now and never read again
+        self.drawn += 1
+        self.draws.append(j)
+        # Rebasing copies swapped, which has grown by at most one entry per draw,
+        # so waiting for as many draws as the base holds keeps it O(1) amortized
+        if len(self.draws) >= max(self.REBASE_MIN, len(self.base_swapped)):
+            self.rebase()
+        return chosen
+    def rebase(self):
+        self.base_drawn = self.drawn
+        self.base_swapped = dict(self.swapped)
+        self.draws = array("I")     # a new log, so frozen() views of the old one stay valid
+    def restore(self, drawn, swapped):
+        self.drawn = drawn
+        self.swapped = swapped
+        self.rebase()
+    def frozen(self):
+        # (drawn, thaw) as of now in O(1); thaw() rebuilds swapped by replaying the
+        # logged draws over the base, on whichever thread calls it
+        base_drawn, base_swapped, draws, count = self.base_drawn, self.base_swapped, self.draws, len(self.draws)
+        def thaw():
+            swapped = dict(base_swapped)
+            i = base_drawn
+            for j in draws[:count]:
+                if j != i:
+                    swapped[j] = swapped.get(i, i)
+                swapped.pop(i, None)
+                i += 1
+            return swapped
+        return base_drawn + count, thaw
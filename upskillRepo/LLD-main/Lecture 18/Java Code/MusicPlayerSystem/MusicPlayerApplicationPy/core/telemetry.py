@@ -0,0 +1,123 @@
+import threading
+
+class LatencyHistogram:
+    # Log-linear buckets (2^sub_bucket_bits linear slots per power of two, ~2
+    # significant digits) allocated once up to max_value; larger samples are
+    # clamped into the last bucket, so recording never allocates.
+    def __init__(self, sub_bucket_bits=7, max_value=(1 << 32) - 1):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.sub_bucket_half = 1 << (sub_bucket_bits - 1)
+        self.sub_bucket_count = 1 << sub_bucket_bits
+        self.max_trackable = max_value
+        self.counts = [0] * (self._index_for(max_value) + 1)
+        self.total_count = 0
+        self.min_value = None
+        self.max_value = 0
+        self.sum_value = 0
+
+    def _index_for(self, value):
+        if value < self.sub_bucket_count:
+            return value
+        shift = value.bit_length() - self.sub_bucket_bits
+        return shift * self.sub_bucket_half + (value >> shift)
+
+    def _highest_value_at(self, index):
+        if index < self.sub_bucket_count:
+            return index
+        shift = index // self.sub_bucket_half - 1
+        mantissa = index - shift * self.sub_bucket_half
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, value):
+        value = min(max(0, int(value)), self.max_trackable)
+        self.counts[self._index_for(value)] += 1
+        self.total_count += 1
+        self.sum_value += value
+        if self.min_value is None or value < self.min_value:
+            self.min_value = value
+        if value > self.max_value:
+            self.max_value = value
+
+    def percentile(self, pct):
+        if self.total_count == 0:
+            return 0
+        target = max(1, int(round(pct / 100.0 * self.total_count)))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self._highest_value_at(index), self.max_value)
+        return self.max_value
+
+    def summary(self):
+        return {
+            "count": self.total_count,
+            "min_us": self.min_value or 0,
+            "max_us": self.max_value,
+            "mean_us": self.sum_value / self.total_count if self.total_count else 0.0,
+            "p50_us": self.percentile(50),
+            "p90_us": self.percentile(90),
+            "p99_us": self.percentile(99),
+            "p999_us": self.percentile(99.9),
+        }
+
+# ----------------------------
+# Playback instrumentation (Singleton), disabled by default
+# ----------------------------
+class PlaybackTelemetry:
+    _instance = None
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self.reset()
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = PlaybackTelemetry()
+        return cls._instance
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self.histograms = {}    # (component, name, operation) -> LatencyHistogram of microseconds
+            self.counts = {}        # (component, name, operation) -> calls
+
+    def record(self, component, name, operation, elapsed_ns):
+        key = (component, name, operation)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = LatencyHistogram()
+            histogram.record(elapsed_ns // 1000)
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+    def count(self, component, name, operation):
+        key = (component, name, operation)
+        with self._lock:
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+    def snapshot(self):
+        # {component: {name: {"calls": {op: n}, "latency": {op: summary}}}}
+        with self._lock:
+            result = {}
+            for (component, name, operation), calls in self.counts.items():
+                entry = result.setdefault(component, {}).setdefault(name, {"calls": {}, "latency": {}})
+                entry["calls"][operation] = calls
+            for (component, name, operation), histogram in self.histograms.items():
+                result[component][name]["latency"][operation] = histogram.summary()
+            return result
+
+    def export(self, path=None):
+        import json
+        data = json.dumps(self.snapshot(), indent=2, sort_keys=True)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(data)
+        return data
@@ -4,3 +4,6 @@ class IAudioOutputDevice(ABC):
     @abstractmethod
     def play_audio(self, song):
         pass
+    def flush(self):
+        # Blocks until queued audio has played; direct devices play synchronously
+        pass
@@ -1,2 +1,2 @@
-from .device_factory import DeviceFactory  # or whatever file defines it
-__all__ = ["DeviceFactory"]
+from .device_factory import DEVICE_API_REGISTRY, DEVICE_REGISTRY, DeviceFactory
+__all__ = ["DEVICE_API_REGISTRY", "DEVICE_REGISTRY", "DeviceFactory"]
@@ -1,21 +1,23 @@
-
-
+from core.lazy_registry import LazyRegistry
 from enums.device_type import DeviceType
-from device.bluetooth_speaker_adapter import BluetoothSpeakerAdapter
-from device.headphones_adapter import HeadphonesAdapter
-from device.wired_speaker_adapter import WiredSpeakerAdapter
-from external.bluetooth_speaker_api import BluetoothSpeakerAPI
-from external.headphones_api import HeadphonesAPI
-from external.wired_speaker_api import WiredSpeakerAPI
+
+# Adapters and the vendor APIs behind them are imported on the first connect
+DEVICE_REGISTRY = LazyRegistry("audio device", {
+    DeviceType.BLUETOOTH: "device.bluetooth_speaker_adapter:BluetoothSpeakerAdapter",
+    DeviceType.WIRED: "device.wired_speaker_adapter:WiredSpeakerAdapter",
+    DeviceType.HEADPHONES: "device.headphones_adapter:HeadphonesAdapter",
+})
+DEVICE_API_REGISTRY = LazyRegistry("device API", {
+    DeviceType.BLUETOOTH: "external.bluetooth_speaker_api:BluetoothSpeakerAPI",
+    DeviceType.WIRED: "external.wired_speaker_api:WiredSpeakerAPI",
+    DeviceType.HEADPHONES: "external.headphones_api:HeadphonesAPI",
+})
 
 class DeviceFactory:
     @staticmethod
     def create_device(device_type):
-        if device_type == DeviceType.BLUETOOTH:
-            return BluetoothSpeakerAdapter(BluetoothSpeakerAPI())
-        elif device_type == DeviceType.WIRED:
-            return WiredSpeakerAdapter(WiredSpeakerAPI())
-        elif device_type == DeviceType.HEADPHONES:
-            return HeadphonesAdapter(HeadphonesAPI())
-        else:
-            return HeadphonesAdapter(HeadphonesAPI())
+        if device_type not in DEVICE_REGISTRY:
+            device_type = DeviceType.HEADPHONES
+        adapter = DEVICE_REGISTRY.load(device_type)
+        api = DEVICE_API_REGISTRY.load(device_type)
+        return adapter(api())
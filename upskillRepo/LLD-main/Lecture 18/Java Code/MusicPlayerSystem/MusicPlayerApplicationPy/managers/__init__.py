@@ -0,0 +1,4 @@
+from .device_manager import DeviceManager
+from .playlist_manager import PlaylistManager
+from .strategy_manager import StrategyManager
+__all__ = ["DeviceManager", "PlaylistManager", "StrategyManager"]
@@ -1,4 +1,3 @@
-
 from enums.device_type import DeviceType
 from factories.device_factory import DeviceFactory
 
@@ -6,22 +5,61 @@ class DeviceManager:
     _instance = None
     def __init__(self):
         self.current_output_device = None
+        self.devices = {}               # DeviceType -> adapter, in connection order
+        self.fanout = None              # set while more than one device is connected
     @classmethod
     def get_instance(cls):
         if cls._instance is None:
             cls._instance = DeviceManager()
         return cls._instance
     def connect(self, device_type):
+        # Replaces every connected output with this one
+        self._close_fanout()
         self.current_output_device = DeviceFactory.create_device(device_type)
-        if device_type == DeviceType.BLUETOOTH:
-            print("Bluetooth device connected")
-        elif device_type == DeviceType.WIRED:
-            print("Wired device connected")
-        elif device_type == DeviceType.HEADPHONES:
-            print("Headphones connected")
+        self.devices = {device_type: self.current_output_device}
+        self._announce(device_type)
+    def add_device(self, device_type):
+        # Party mode: play on this output as well as the ones already connected
+        if device_type in self.devices:
+            return
+        device = DeviceFactory.create_device(device_type)
+        self.devices[device_type] = device
+        self._announce(device_type)
+        if self.fanout is None and len(self.devices) > 1:
+            from core.device_fanout import FanoutOutputDevice      # worker threads only in party mode
+            self.fanout = FanoutOutputDevice()
+            for connected_type, connected in self.devices.items():
+                self.fanout.add_device(connected_type.name, connected)
+        elif self.fanout is not None:
+            self.fanout.add_device(device_type.name, device)
+        self.current_output_device = self.fanout or device
+    def disconnect(self, device_type):
+        if self.devices.pop(device_type, None) is None:
+            raise Exception(f"{device_type.name} is not connected.")
+        if self.fanout is not None:
+            self.fanout.remove_device(device_type.name)
+        if len(self.devices) > 1:
+            return
+        self._close_fanout()
+        self.current_output_device = next(iter(self.devices.values()), None)
+    def get_device_stats(self):
+        # Per-device played/dropped/lag counters; only tracked while fanning out
+        return self.fanout.get_stats() if self.fanout is not None else {}
     def get_output_device(self):
         if self.current_output_device is None:
             raise Exception("No output device is connected.")
         return self.current_output_device
     def has_output_device(self):
         return self.current_output_device is not None
+    def _close_fanout(self):
+        if self.fanout is not None:
+            self.fanout.close()
+            self.fanout = None
+    @staticmethod
+    def _announce(device_type):
+        if device_type == DeviceType.BLUETOOTH:
+            print("Bluetooth device connected")
+        elif device_type == DeviceType.WIRED:
+            print("Wired device connected")
+        elif device_type == DeviceType.HEADPHONES:
+            print("Headphones connected")
@@ -1,30 +1,42 @@
-import os 
-import sys
-
-base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-sys.path.insert(0, os.path.join(base_dir, 'MusicPlayerApplicationPy'))
-
 from models.playlist import Playlist
-from models.song import Song
 
 class PlaylistManager:
     _instance = None
     def __init__(self):
         self.playlists = {}
+        self.store = None           # PlaylistStore backing playlists not loaded yet
     @classmethod
     def get_instance(cls):
         if cls._instance is None:
             cls._instance = PlaylistManager()
         return cls._instance
     def create_playlist(self, name):
-        if name in self.playlists:
+        if name in self.playlists or (self.store is not None and name in self.store):
             raise Exception(f"Playlist \"{name}\" already exists.")
         self.playlists[name] = Playlist(name)
     def add_song_to_playlist(self, playlist_name, song):
-        if playlist_name not in self.playlists:
-            raise Exception(f"Playlist \"{playlist_name}\" not found.")
-        self.playlists[playlist_name].add_song_to_playlist(song)
+        self.get_playlist(playlist_name).add_song_to_playlist(song)
     def get_playlist(self, name):
-        if name not in self.playlists:
-            raise Exception(f"Playlist \"{name}\" not found.")
-        return self.playlists[name]
+        playlist = self.playlists.get(name)
+        if playlist is None:
+            if self.store is None or name not in self.store:
+                raise Exception(f"Playlist \"{name}\" not found.")
+            # Lazily materialize playlists from the memory-mapped store
+            playlist = self.playlists[name] = self.store.load(name)
+        return playlist
+    def get_playlist_names(self):
+        names = list(self.playlists)
+        if self.store is not None:
+            names.extend(n for n in self.store.names() if n not in self.playlists)
+        return names
+    def save(self, path):
+        from core.playlist_store import PlaylistStore      # mmap/struct only needed once playlists persist
+        PlaylistStore.save(path, [self.get_playlist(n) for n in self.get_playlist_names()])
+    def open_store(self, path):
+        if self.store is not None:
+            # Pull in anything not yet loaded before dropping the old mapping
+            for name in self.get_playlist_names():
+                self.get_playlist(name)
+            self.store.close()
+        from core.playlist_store import PlaylistStore
+        self.store = PlaylistStore.open(path)
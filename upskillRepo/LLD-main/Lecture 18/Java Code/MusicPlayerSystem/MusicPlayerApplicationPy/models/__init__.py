@@ -1,3 +1,4 @@
 from .playlist import Playlist
 from .song import Song
-__all__ = ["Playlist","Song"]
\ No newline at end of file
+from .song_table import SongTable
+__all__ = ["Playlist","Song","SongTable"]
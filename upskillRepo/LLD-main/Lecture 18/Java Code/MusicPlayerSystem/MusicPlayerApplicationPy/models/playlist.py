@@ -1,14 +1,60 @@
+from array import array
+
+from .song_table import SongTable
+
+class SongListView:
+    # Read-only sequence of Songs over a playlist's id vector
+    __slots__ = ("songs", "song_ids")
+    def __init__(self, songs, song_ids):
+        self.songs = songs
+        self.song_ids = song_ids
+    def __len__(self):
+        return len(self.song_ids)
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.songs[i] for i in self.song_ids[index]]
+        return self.songs[self.song_ids[index]]
+    def __iter__(self):
+        songs = self.songs
+        return (songs[i] for i in self.song_ids)
+
 class Playlist:
-    def __init__(self, name):
+    def __init__(self, name, song_ids=None):
         self.playlist_name = name
-        self.song_list = []
+        self.song_ids = array("I") if song_ids is None else song_ids
+        self.song_table = SongTable.get_instance()
+        self.members = None             # bitset over song ids, built on first contains()
     def get_playlist_name(self):
         return self.playlist_name
     def get_songs(self):
-        return self.song_list
+        return SongListView(self.song_table.songs, self.song_ids)
+    def get_song_ids(self):
+        return self.song_ids
     def get_size(self):
-        return len(self.song_list)
+        return len(self.song_ids)
     def add_song_to_playlist(self, song):
         if song is None:
             raise Exception("Cannot add null song to playlist.")
-        self.song_list.append(song)
+        song_id = song.song_id if song.song_id is not None else self.song_table.register(song)
+        if self.members is not None:
+            self._set_member(song_id)
+        self.song_ids.append(song_id)
+    def contains(self, song):
+        if song is None or song.song_id is None:
+            return False
+        if self.members is None:
+            self.members = bytearray()
+            for song_id in self.song_ids:
+                self._set_member(song_id)
+        byte = song.song_id >> 3
+        return byte < len(self.members) and bool(self.members[byte] & (1 << (song.song_id & 7)))
+    def index_of(self, song):
+        # First position of song, or -1 when it is not in the playlist; misses never scan
+        if not self.contains(song):
+            return -1
+        return self.song_ids.index(song.song_id)
+    def _set_member(self, song_id):
+        byte = song_id >> 3
+        if byte >= len(self.members):
+            self.members.extend(bytes(byte + 1 - len(self.members)))
+        self.members[byte] |= 1 << (song_id & 7)
@@ -1,8 +1,10 @@
 class Song:
+    __slots__ = ("title", "artist", "file_path", "song_id")
     def __init__(self, title, artist, file_path):
         self.title = title
         self.artist = artist
         self.file_path = file_path
+        self.song_id = None         # assigned by SongTable.register
     def get_title(self):
         return self.title
     def get_artist(self):
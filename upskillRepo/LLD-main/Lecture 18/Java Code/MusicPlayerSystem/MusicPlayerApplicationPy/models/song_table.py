@@ -0,0 +1,39 @@
+class SongTable:
+    # Central song table (Singleton); playlists store ids into it instead of Song references
+    _instance = None
+    def __init__(self):
+        self.songs = []
+        self.digest = None          # running hash of registered paths, see fingerprint()
+        self.digested = 0
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = SongTable()
+        return cls._instance
+    def register(self, song):
+        if song.song_id is None:
+            song.song_id = len(self.songs)
+            self.songs.append(song)
+        return song.song_id
+    def get(self, song_id):
+        return self.songs[song_id]
+    def __len__(self):
+        return len(self.songs)
+    def fingerprint(self, count=None):
+        # 16-byte digest of the file paths of the first count songs (all by default).
+        # Ids saved by another run only name the same songs if this matches.
+        import hashlib
+        count = len(self.songs) if count is None else count
+        if count < self.digested:
+            digest = hashlib.blake2b(digest_size=16)
+            for song in self.songs[:count]:
+                digest.update(song.get_file_path().encode("utf-8") + b"\0")
+            return digest.digest()
+        # Songs are only appended, so a running hash serves every later count
+        if self.digest is None:
+            self.digest = hashlib.blake2b(digest_size=16)
+        songs = self.songs
+        for i in range(self.digested, count):
+            self.digest.update(songs[i].get_file_path().encode("utf-8") + b"\0")
+        self.digested = count
+        return self.digest.digest()
@@ -1,27 +1,45 @@
-from models import Song
-from managers import PlaylistManager
-from enums import DeviceType, PlayStrategyType
+from models import SongTable
+from song_library import SongLibrary
+from managers import DeviceManager, PlaylistManager
 from music_player_facade import MusicPlayerFacade
+from core.telemetry import PlaybackTelemetry
 
 class MusicPlayerApplication:
     _instance = None
     def __init__(self):
-        self.song_library = []
+        self.song_library = SongLibrary()
+        self.search_index = None
     @classmethod
     def get_instance(cls):
         if cls._instance is None:
             cls._instance = MusicPlayerApplication()
         return cls._instance
     def create_song_in_library(self, title, artist, path):
-        new_song = Song(title, artist, path)
-        self.song_library.append(new_song)
+        self.song_library.add_song(title, artist, path)
+    def import_library_manifest(self, manifest_path):
+        return self.song_library.import_manifest(manifest_path)
     def find_song_by_title(self, title):
-        for s in self.song_library:
-            if s.get_title() == title:
-                return s
-        return None
+        return self.song_library.find_by_title(title)
+    def search_songs(self, query, limit=10):
+        # The library only grows, so its size tells whether the index is stale
+        if self.search_index is None or self.search_index.version != len(self.song_library):
+            from song_search import SongSearchIndex     # unicodedata/re only loaded once search is used
+            self.search_index = SongSearchIndex(self.song_library)
+        return self.search_index.search(query, limit)
+    def find_songs_by_artist(self, artist):
+        return self.song_library.find_by_artist(artist)
+    def find_song_by_path(self, path):
+        return self.song_library.find_by_path(path)
     def create_playlist(self, playlist_name):
         PlaylistManager.get_instance().create_playlist(playlist_name)
+    def save_playlists(self, path):
+        PlaylistManager.get_instance().save(path)
+    def open_playlist_store(self, path):
+        PlaylistManager.get_instance().open_store(path)
+        if len(self.song_library) == 0:
+            # Fresh start: the store restored the song table, make those songs findable by title
+            for song in SongTable.get_instance().songs:
+                self.song_library.add(song)
     def add_song_to_playlist(self, playlist_name, song_title):
         song = self.find_song_by_title(song_title)
         if song is None:
@@ -29,6 +47,12 @@ class MusicPlayerApplication:
         PlaylistManager.get_instance().add_song_to_playlist(playlist_name, song)
     def connect_audio_device(self, device_type):
         MusicPlayerFacade.get_instance().connect_device(device_type)
+    def add_audio_device(self, device_type):
+        MusicPlayerFacade.get_instance().add_device(device_type)
+    def disconnect_audio_device(self, device_type):
+        MusicPlayerFacade.get_instance().disconnect_device(device_type)
+    def get_device_stats(self):
+        return DeviceManager.get_instance().get_device_stats()
     def select_play_strategy(self, strategy_type):
         MusicPlayerFacade.get_instance().set_play_strategy(strategy_type)
     def load_playlist(self, playlist_name):
@@ -45,8 +69,22 @@ class MusicPlayerApplication:
         MusicPlayerFacade.get_instance().pause_song(song)
     def play_all_tracks_in_playlist(self):
         MusicPlayerFacade.get_instance().play_all_tracks()
+    def play_next_track_in_playlist(self):
+        MusicPlayerFacade.get_instance().play_next_track()
     def play_previous_track_in_playlist(self):
         MusicPlayerFacade.get_instance().play_previous_track()
+    def enable_playback_snapshots(self, path):
+        MusicPlayerFacade.get_instance().enable_state_snapshots(path)
+    def disable_playback_snapshots(self):
+        MusicPlayerFacade.get_instance().disable_state_snapshots()
+    def resume_playback(self, path):
+        return MusicPlayerFacade.get_instance().resume_playback(path)
+    def enable_telemetry(self):
+        PlaybackTelemetry.get_instance().enable()
+    def disable_telemetry(self):
+        PlaybackTelemetry.get_instance().disable()
+    def get_telemetry(self):
+        return MusicPlayerFacade.get_instance().get_telemetry()
     def queue_song_next(self, song_title):
         song = self.find_song_by_title(song_title)
         if song is None:
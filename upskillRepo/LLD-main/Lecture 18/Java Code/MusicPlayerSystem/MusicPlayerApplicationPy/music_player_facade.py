@@ -1,19 +1,10 @@
-from managers import DeviceManager, PlaylistManager
-from strategy_manager import StrategyManager
-from strategies import PlayStrategy
-from models import Song, Playlist
-from enums import DeviceType, PlayStrategyType
-
-class AudioEngine:
-    def __init__(self):
-        self.current_song_title = None
-    def play(self, device, song):
-        device.play_audio(song)
-        self.current_song_title = song.get_title()
-    def pause(self):
-        print(f"Paused: {self.current_song_title}")
-    def get_current_song_title(self):
-        return self.current_song_title
+from managers import DeviceManager, PlaylistManager, StrategyManager
+from enums import PlayStrategyType
+from core.audio_engine import AudioEngine
+from core.telemetry import PlaybackTelemetry
+from models import SongTable
+from contextlib import nullcontext
+import time
 
 class MusicPlayerFacade:
     _instance = None
@@ -21,6 +12,9 @@ class MusicPlayerFacade:
         self.audio_engine = AudioEngine()
         self.loaded_playlist = None
         self.play_strategy = None
+        self.play_strategy_type = None
+        self.snapshot_writer = None     # SnapshotWriter once state persistence is enabled
+        self.telemetry = PlaybackTelemetry.get_instance()
     @classmethod
     def get_instance(cls):
         if cls._instance is None:
@@ -28,47 +22,148 @@ class MusicPlayerFacade:
         return cls._instance
     def connect_device(self, device_type):
         DeviceManager.get_instance().connect(device_type)
+    def add_device(self, device_type):
+        DeviceManager.get_instance().add_device(device_type)
+    def disconnect_device(self, device_type):
+        DeviceManager.get_instance().disconnect(device_type)
     def set_play_strategy(self, strategy_type):
         self.play_strategy = StrategyManager.get_instance().get_strategy(strategy_type)
+        self.play_strategy_type = strategy_type
     def load_playlist(self, name):
-        self.loaded_playlist = PlaylistManager.get_instance().get_playlist(name)
-        if self.play_strategy is None:
-            raise Exception("Play strategy not set before loading.")
-        self.play_strategy.set_playlist(self.loaded_playlist)
+        if self.telemetry.enabled:
+            return self._instrumented("load_playlist", self._load_playlist, name, device=False)
+        self._load_playlist(self.play_strategy, name)
     def play_song(self, song):
-        if not DeviceManager.get_instance().has_output_device():
-            raise Exception("No audio device connected.")
-        device = DeviceManager.get_instance().get_output_device()
-        self.audio_engine.play(device, song)
+        if self.telemetry.enabled:
+            return self._instrumented("play_song", self._play_song, song, strategy=False)
+        self._play_song(self._output_device, song)
     def pause_song(self, song):
         if self.audio_engine.get_current_song_title() != song.get_title():
             raise Exception(f"Cannot pause '{song.get_title()}'; not currently playing.")
         self.audio_engine.pause()
     def play_all_tracks(self):
+        if self.telemetry.enabled:
+            return self._instrumented("play_all_tracks", self._play_all_tracks)
+        self._play_all_tracks(self.play_strategy, self._output_device)
+    def play_next_track(self):
+        if self.telemetry.enabled:
+            return self._instrumented("play_next_track", self._play_next_track)
+        self._play_next_track(self.play_strategy, self._output_device)
+    def play_previous_track(self):
+        if self.telemetry.enabled:
+            return self._instrumented("play_previous_track", self._play_previous_track)
+        self._play_previous_track(self.play_strategy, self._output_device)
+    def enqueue_next(self, song):
+        if self.telemetry.enabled:
+            return self._instrumented("enqueue_next", self._enqueue_next, song, device=False)
+        self._enqueue_next(self.play_strategy, song)
+    def get_telemetry(self):
+        return self.telemetry.snapshot()
+    def enable_state_snapshots(self, path):
+        from core.playback_state import SnapshotWriter
+        self.disable_state_snapshots()
+        self.snapshot_writer = SnapshotWriter(path)
+    def disable_state_snapshots(self):
+        if self.snapshot_writer is not None:
+            self.snapshot_writer.close()
+            self.snapshot_writer = None
+    def resume_playback(self, path):
+        # Restores playlist, strategy and position from the last snapshot; returns the song that was playing
+        from core.playback_state import PlaybackSnapshot
+        snapshot = PlaybackSnapshot.load(path)
+        table = SongTable.get_instance()
+        if len(table) < snapshot.song_count or table.fingerprint(snapshot.song_count) != snapshot.song_fingerprint:
+            raise Exception("Saved playback state is for a different song library; not resuming.")
+        strategy_type = PlayStrategyType(snapshot.strategy_type)
+        playlist = PlaylistManager.get_instance().get_playlist(snapshot.playlist_name)
+        if playlist.get_size() != snapshot.playlist_size:
+            raise Exception(f"Playlist '{snapshot.playlist_name}' changed since playback state was saved; not resuming.")
+        strategy = StrategyManager.get_instance().get_strategy(strategy_type)
+        strategy.restore_state(playlist, snapshot.state)
+        self.loaded_playlist = playlist
+        self.play_strategy = strategy
+        self.play_strategy_type = strategy_type
+        if snapshot.current_song_id is None:
+            return None
+        song = SongTable.get_instance().get(snapshot.current_song_id)
+        self.audio_engine.current_song_title = song.get_title()
+        return song
+    def _capture_state(self, song):
+        # Runs on whichever thread advanced the strategy; the writer does the encoding and I/O
+        from core.playback_state import PlaybackSnapshot
+        table = SongTable.get_instance()
+        song_id = table.register(song)
+        song_count = len(table)
+        return PlaybackSnapshot(self.loaded_playlist.get_playlist_name(), self.play_strategy_type.value,
+                                song_id, self.play_strategy.snapshot_state(),
+                                song_count, lambda: table.fingerprint(song_count), self.loaded_playlist.get_size())
+    # Playback operations take the strategy and/or a device getter as arguments, so
+    # the same code runs with the plain objects or with their instrumented proxies
+    def _load_playlist(self, strategy, name):
+        self.loaded_playlist = PlaylistManager.get_instance().get_playlist(name)
+        if self.play_strategy is None:
+            raise Exception("Play strategy not set before loading.")
+        strategy.set_playlist(self.loaded_playlist)
+    def _play_song(self, output_device, song):
+        if not DeviceManager.get_instance().has_output_device():
+            raise Exception("No audio device connected.")
+        self.audio_engine.play(output_device(), song)
+    def _play_all_tracks(self, strategy, output_device):
         if self.loaded_playlist is None:
             raise Exception("No playlist loaded.")
-        while self.play_strategy.has_next():
-            next_song = self.play_strategy.next()
-            device = DeviceManager.get_instance().get_output_device()
-            self.audio_engine.play(device, next_song)
+        if self.snapshot_writer is None:
+            self.audio_engine.play_stream(output_device(), strategy, self.loaded_playlist)
+        else:
+            self.audio_engine.play_stream(output_device(), strategy, self.loaded_playlist,
+                                          self._capture_state, self.snapshot_writer.submit)
         print(f"Completed playlist: {self.loaded_playlist.get_playlist_name()}")
-    def play_next_track(self):
+    def _play_next_track(self, strategy, output_device):
         if self.loaded_playlist is None:
             raise Exception("No playlist loaded.")
-        if self.play_strategy.has_next():
-            next_song = self.play_strategy.next()
-            device = DeviceManager.get_instance().get_output_device()
-            self.audio_engine.play(device, next_song)
+        with self._editing_strategy():
+            next_song = strategy.next() if strategy.has_next() else None
+            if next_song is not None:
+                self._save_state(next_song)
+        if next_song is not None:
+            self.audio_engine.play(output_device(), next_song)
         else:
             print(f"Completed playlist: {self.loaded_playlist.get_playlist_name()}")
-    def play_previous_track(self):
+    def _play_previous_track(self, strategy, output_device):
         if self.loaded_playlist is None:
             raise Exception("No playlist loaded.")
-        if self.play_strategy.has_previous():
-            prev_song = self.play_strategy.previous()
-            device = DeviceManager.get_instance().get_output_device()
-            self.audio_engine.play(device, prev_song)
+        with self._editing_strategy():
+            prev_song = strategy.previous() if strategy.has_previous() else None
+            if prev_song is not None:
+                self._save_state(prev_song)
+        if prev_song is not None:
+            self.audio_engine.play(output_device(), prev_song)
         else:
             print(f"Completed playlist: {self.loaded_playlist.get_playlist_name()}")
-    def enqueue_next(self, song):
-        self.play_strategy.add_to_next(song)
+    def _enqueue_next(self, strategy, song):
+        with self._editing_strategy():
+            strategy.add_to_next(song)
+    def _editing_strategy(self):
+        # While play_all_tracks streams, the prefetch thread owns the strategy;
+        # edits wait for it and start from the track that is actually playing
+        pipeline = self.audio_engine.pipeline
+        return nullcontext() if pipeline is None else pipeline.editing()
+    def _output_device(self):
+        return DeviceManager.get_instance().get_output_device()
+    def _instrumented(self, operation, fn, *args, strategy=True, device=True):
+        # Proxies are imported here so strategies/device stay lazy at startup
+        from core.instrumentation import InstrumentedDevice, InstrumentedStrategy
+        telemetry = self.telemetry
+        proxies = []
+        if strategy:
+            play_strategy = self.play_strategy
+            proxies.append(None if play_strategy is None else InstrumentedStrategy(play_strategy, telemetry))
+        if device:
+            proxies.append(lambda: InstrumentedDevice(self._output_device(), telemetry))
+        start = time.perf_counter_ns()
+        try:
+            fn(*proxies, *args)
+        finally:
+            telemetry.record("facade", "MusicPlayerFacade", operation, time.perf_counter_ns() - start)
+    def _save_state(self, song):
+        if self.snapshot_writer is not None:
+            self.snapshot_writer.submit(self._capture_state(song))
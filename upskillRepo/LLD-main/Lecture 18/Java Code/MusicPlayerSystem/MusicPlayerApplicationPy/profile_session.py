@@ -0,0 +1,101 @@
+import contextlib
+import cProfile
+import os
+import pstats
+import random
+import sys
+import time
+
+from enums import DeviceType, PlayStrategyType
+from music_player_application import MusicPlayerApplication
+from core.telemetry import PlaybackTelemetry
+
+STRATEGIES = [PlayStrategyType.SEQUENTIAL, PlayStrategyType.RANDOM, PlayStrategyType.CUSTOM_QUEUE]
+
+
+# ----------------------------
+# Synthetic listening session
+# ----------------------------
+def build_catalog(app, songs=20000, playlists=20, tracks_per_playlist=500, seed=1):
+    rnd = random.Random(seed)
+    for i in range(songs):
+        app.create_song_in_library(f"Track {i}", f"Artist {i % 800}", f"/music/{i}.mp3")
+    names = []
+    for p in range(playlists):
+        name = f"Mix {p}"
+        app.create_playlist(name)
+        for _ in range(tracks_per_playlist):
+            app.add_song_to_playlist(name, f"Track {rnd.randrange(songs)}")
+        names.append(name)
+    return names
+
+
+def replay_session(app, playlists, actions=100000, seed=2):
+    # Mostly skipping forward, with some going back, queueing, one-off plays
+    # and switching playlist or play mode every so often
+    rnd = random.Random(seed)
+    songs = len(app.song_library)
+    app.select_play_strategy(STRATEGIES[0])
+    app.load_playlist(playlists[0])
+    for _ in range(actions):
+        roll = rnd.random()
+        if roll < 0.75:
+            app.play_next_track_in_playlist()
+        elif roll < 0.85:
+            app.play_previous_track_in_playlist()
+        elif roll < 0.92:
+            app.queue_song_next(f"Track {rnd.randrange(songs)}")
+        elif roll < 0.98:
+            app.play_single_song(f"Track {rnd.randrange(songs)}")
+        else:
+            app.select_play_strategy(rnd.choice(STRATEGIES))
+            app.load_playlist(rnd.choice(playlists))
+
+
+def run_quietly(fn, *args):
+    # Adapters print every track; send that to /dev/null so it is not what we measure
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        start = time.perf_counter()
+        fn(*args)
+        return time.perf_counter() - start
+
+
+def print_telemetry(snapshot):
+    print(f"  {'component':<10} {'name':<22} {'operation':<20} {'calls':>8} {'p50 us':>8} {'p99 us':>8}")
+    for component in sorted(snapshot):
+        for name in sorted(snapshot[component]):
+            entry = snapshot[component][name]
+            for operation in sorted(entry["calls"]):
+                latency = entry["latency"].get(operation)
+                p50 = f"{latency['p50_us']:>8}" if latency else f"{'-':>8}"
+                p99 = f"{latency['p99_us']:>8}" if latency else f"{'-':>8}"
+                print(f"  {component:<10} {name:<22} {operation:<20} {entry['calls'][operation]:>8} {p50} {p99}")
+
+
+if __name__ == "__main__":
+    actions = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    app = MusicPlayerApplication.get_instance()
+    playlists = build_catalog(app)
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        app.connect_audio_device(DeviceType.BLUETOOTH)
+
+    plain = run_quietly(replay_session, app, playlists, actions)
+    app.enable_telemetry()
+    instrumented = run_quietly(replay_session, app, playlists, actions)
+    app.disable_telemetry()
+    snapshot = app.get_telemetry()
+
+    profiler = cProfile.Profile()
+    profiled = run_quietly(profiler.runcall, replay_session, app, playlists, actions)
+
+    print(f"Listening session: {actions} actions")
+    print(f"  telemetry off : {plain:8.2f} s  ({plain / actions * 1e6:6.1f} us/action)")
+    print(f"  telemetry on  : {instrumented:8.2f} s  ({instrumented / actions * 1e6:6.1f} us/action, "
+          f"{instrumented / plain - 1:+.0%})")
+    print(f"  under cProfile: {profiled:8.2f} s")
+    print()
+    print("Telemetry snapshot:")
+    print_telemetry(snapshot)
+    print()
+    print("Hot path (cProfile, by internal time):")
+    pstats.Stats(profiler).strip_dirs().sort_stats("tottime").print_stats(15)
@@ -0,0 +1,75 @@
+import sys
+
+from models import Song, SongTable
+
+class SongLibrary:
+    # Song catalog with a hash index by title plus secondary indexes by artist and file path.
+    # Duplicate titles/paths keep the first song added, like the old linear scan did.
+    def __init__(self):
+        self.songs = []
+        self.by_title = {}
+        self.by_artist = {}
+        self.by_path = {}
+    def __len__(self):
+        return len(self.songs)
+    def __iter__(self):
+        return iter(self.songs)
+    def add_song(self, title, artist, file_path):
+        song = Song(title, artist, file_path)
+        self.add(song)
+        return song
+    def add(self, song):
+        if song is None:
+            raise Exception("Cannot add null song to library.")
+        SongTable.get_instance().register(song)
+        self.songs.append(song)
+        self.by_title.setdefault(song.get_title(), song)
+        self.by_path.setdefault(song.get_file_path(), song)
+        artist_songs = self.by_artist.get(song.get_artist())
+        if artist_songs is None:
+            self.by_artist[song.get_artist()] = [song]
+        else:
+            artist_songs.append(song)
+    def find_by_title(self, title):
+        return self.by_title.get(title)
+    def find_by_artist(self, artist):
+        return list(self.by_artist.get(artist, ()))
+    def find_by_path(self, file_path):
+        return self.by_path.get(file_path)
+    def import_manifest(self, manifest_path):
+        # CSV rows of title,artist,file_path; an optional header row is skipped
+        import csv      # pulls in re; keep it off the startup path
+        count = 0
+        with open(manifest_path, newline="", encoding="utf-8") as f:
+            for row in csv.reader(f):
+                if not row or row[0].startswith("#"):
+                    continue
+                if count == 0 and [c.strip().lower() for c in row] == ["title", "artist", "file_path"]:
+                    continue
+                if len(row) != 3:
+                    raise Exception(f"Invalid manifest row: {row}")
+                self.add_song(row[0], row[1], row[2])
+                count += 1
+        return count
+    def memory_report(self):
+        # Approximate bytes per song: Song objects and their fields, plus index overhead
+        count = len(self.songs)
+        if count == 0:
+            return {"songs": 0, "song_bytes": 0, "index_bytes": 0, "bytes_per_song": 0.0}
+        seen = set()
+        song_bytes = 0
+        for song in self.songs:
+            song_bytes += sys.getsizeof(song)
+            for value in (song.title, song.artist, song.file_path):
+                if id(value) not in seen:
+                    seen.add(id(value))
+                    song_bytes += sys.getsizeof(value)
+        index_bytes = (sys.getsizeof(self.songs) + sys.getsizeof(self.by_title) + sys.getsizeof(self.by_path)
+                       + sys.getsizeof(self.by_artist)
+                       + sum(sys.getsizeof(songs) for songs in self.by_artist.values()))
+        return {
+            "songs": count,
+            "song_bytes": song_bytes,
+            "index_bytes": index_bytes,
+            "bytes_per_song": (song_bytes + index_bytes) / count,
+        }
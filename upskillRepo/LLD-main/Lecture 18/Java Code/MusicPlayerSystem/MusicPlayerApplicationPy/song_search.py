@@ -0,0 +1,158 @@
+import bisect
+import heapq
+import math
+import re
+import unicodedata
+from array import array
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+_MAX_OFFSET = 255           # entries pack (id << 8) | word offset
+_EMPTY = array("I")
+
+def normalize(text):
+    # Case-fold, strip accents and collapse punctuation so "Chaiyyá-Chaiyya!" == "chaiyya chaiyya"
+    text = unicodedata.normalize("NFKD", text.casefold())
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return _NON_ALNUM.sub(" ", text).strip()
+
+def trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class _PrefixIndex:
+    # Sorted array of word starts in the keys, packed as (key id << 8 | offset):
+    # the key start itself and/or the start of every later word.
+    # Suffixes are sliced on demand, so the index stores one 8-byte int per word.
+    def __init__(self, keys, key_starts=True, inner_words=True):
+        self.keys = keys
+        entries = []
+        for key_id, key in enumerate(keys):
+            if not key:
+                continue
+            if key_starts:
+                entries.append(key_id << 8)
+            if not inner_words:
+                continue
+            for match in re.finditer(" ", key):
+                offset = match.end()
+                if offset > _MAX_OFFSET:
+                    break
+                entries.append((key_id << 8) | offset)
+        entries.sort(key=self._suffix)
+        self.entries = array("Q", entries)
+
+    def _suffix(self, entry):
+        return self.keys[entry >> 8][entry & 0xFF:]
+
+    def scan(self, prefix):
+        # Yields (key id, offset) for every suffix starting with prefix. Normalized
+        # keys only hold [0-9a-z ], so prefix + "{" sorts after all of them.
+        lo = bisect.bisect_left(self.entries, prefix, key=self._suffix)
+        hi = bisect.bisect_left(self.entries, prefix + "{", lo, key=self._suffix)
+        for entry in self.entries[lo:hi]:
+            yield entry >> 8, entry & 0xFF
+
+class _TrigramIndex:
+    def __init__(self, keys):
+        self.keys = keys
+        self.postings = {}
+        for key_id, key in enumerate(keys):
+            for gram in trigrams(key):
+                posting = self.postings.get(gram)
+                if posting is None:
+                    posting = self.postings[gram] = array("I")
+                posting.append(key_id)
+
+    def similar(self, key, min_similarity, max_candidates=5000):
+        # Jaccard similarity over trigrams. A key scoring >= s shares at least
+        # t = ceil(s * |Q|) trigrams with the query, so it must appear in one of
+        # the |Q| - t + 1 shortest posting lists; only those are scanned. When
+        # those lists are too long, t is raised: weaker matches may be skipped,
+        # but the strongest ones (which share the most trigrams) are kept.
+        grams = trigrams(key)
+        if not grams or not key:
+            return []
+        needed = max(1, math.ceil(min_similarity * len(grams)))
+        lists = sorted((self.postings.get(g, _EMPTY) for g in grams), key=len)
+        while needed < len(grams) and sum(map(len, lists[:len(grams) - needed + 1])) > max_candidates:
+            needed += 1
+        candidates = set()
+        for posting in lists[:len(grams) - needed + 1]:
+            candidates.update(posting)
+        scored = []
+        for key_id in candidates:
+            other = trigrams(self.keys[key_id])
+            overlap = len(grams & other)
+            score = overlap / (len(grams) + len(other) - overlap)
+            if score >= min_similarity:
+                scored.append((score, key_id))
+        return scored
+
+class SongSearchIndex:
+    # Typeahead over a SongLibrary: word-prefix matches on titles and artists,
+    # topped up with trigram fuzzy matches for typos
+    def __init__(self, library, min_similarity=0.3):
+        self.min_similarity = min_similarity
+        self.songs = list(library.songs)
+        self.version = len(self.songs)
+        self.title_keys = [normalize(s.get_title()) for s in self.songs]
+        artist_ids = {}
+        self.artist_songs = []      # artist id -> song ids
+        for song_id, song in enumerate(self.songs):
+            artist_id = artist_ids.setdefault(song.get_artist(), len(artist_ids))
+            if artist_id == len(self.artist_songs):
+                self.artist_songs.append(array("I"))
+            self.artist_songs[artist_id].append(song_id)
+        self.artist_keys = [normalize(a) for a in artist_ids]
+        self.title_start = _PrefixIndex(self.title_keys, inner_words=False)
+        self.title_words = _PrefixIndex(self.title_keys, key_starts=False)
+        self.artist_prefix = _PrefixIndex(self.artist_keys)
+        self.title_trigrams = _TrigramIndex(self.title_keys)
+        self.artist_trigrams = _TrigramIndex(self.artist_keys)
+
+    def prefix_search(self, query, k=10):
+        prefix = normalize(query)
+        if not prefix:
+            return []
+        ranked = {}
+        # Rank: whole-title match, title starts with query, title word starts with query, artist match.
+        # Each tier is read in full, since order within it is by title length, not by
+        # the index order; a tier is only read when the better ones hold fewer than k songs.
+        for song_id, _ in self.title_start.scan(prefix):
+            key = self.title_keys[song_id]
+            ranked[song_id] = (0 if key == prefix else 1, len(key), song_id)
+        if len(ranked) < k:
+            for song_id, _ in self.title_words.scan(prefix):
+                self._keep_best(ranked, song_id, (2, len(self.title_keys[song_id]), song_id))
+        if len(ranked) < k:
+            for artist_id, _ in self.artist_prefix.scan(prefix):
+                for song_id in self.artist_songs[artist_id]:
+                    self._keep_best(ranked, song_id, (3, len(self.title_keys[song_id]), song_id))
+        return [self.songs[rank[2]] for rank in heapq.nsmallest(k, ranked.values())]
+
+    def fuzzy_search(self, query, k=10):
+        key = normalize(query)
+        scored = {}
+        for score, song_id in self.title_trigrams.similar(key, self.min_similarity):
+            scored[song_id] = max(scored.get(song_id, 0.0), score)
+        for score, artist_id in self.artist_trigrams.similar(key, self.min_similarity):
+            for song_id in self.artist_songs[artist_id]:
+                scored[song_id] = max(scored.get(song_id, 0.0), score)
+        best = heapq.nsmallest(k, ((-score, song_id) for song_id, score in scored.items()))
+        return [self.songs[song_id] for _, song_id in best]
+
+    def search(self, query, k=10):
+        results = self.prefix_search(query, k)
+        if len(results) < k:
+            seen = {id(s) for s in results}
+            for song in self.fuzzy_search(query, k):
+                if id(song) not in seen and len(results) < k:
+                    seen.add(id(song))
+                    results.append(song)
+        return results
+
+    @staticmethod
+    def _keep_best(ranked, song_id, rank):
+        current = ranked.get(song_id)
+        if current is None or rank < current:
+            ranked[song_id] = rank
@@ -0,0 +1,23 @@
+from core.lazy_registry import LazyRegistry
+from enums.play_strategy_type import PlayStrategyType
+
+# Strategy classes are imported the first time they are asked for, not with the package
+STRATEGY_REGISTRY = LazyRegistry("play strategy", {
+    PlayStrategyType.SEQUENTIAL: "strategies.sequential_play_strategy:SequentialPlayStrategy",
+    PlayStrategyType.RANDOM: "strategies.random_play_strategy:RandomPlayStrategy",
+    PlayStrategyType.CUSTOM_QUEUE: "strategies.custom_queue_strategy:CustomQueueStrategy",
+})
+
+_EXPORTS = LazyRegistry("strategies attribute", {
+    "PlayStrategy": "strategies.play_strategy:PlayStrategy",
+    "SequentialPlayStrategy": "strategies.sequential_play_strategy:SequentialPlayStrategy",
+    "RandomPlayStrategy": "strategies.random_play_strategy:RandomPlayStrategy",
+    "CustomQueueStrategy": "strategies.custom_queue_strategy:CustomQueueStrategy",
+})
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'strategies' has no attribute '{name}'")
+    return _EXPORTS.load(name)
+
+__all__ = ["STRATEGY_REGISTRY", "PlayStrategy", "SequentialPlayStrategy", "RandomPlayStrategy", "CustomQueueStrategy"]
@@ -1,16 +1,23 @@
 from models.playlist import Playlist
 from models.song import Song
+from strategies.play_strategy import PlayStrategy
+from models.song_table import SongTable
 from collections import deque
+from array import array
 
-class CustomQueueStrategy:
+class CustomQueueStrategy(PlayStrategy):
     def __init__(self):
         self.current_playlist = None
         self.current_index = -1
         self.next_queue = deque()
         self.prev_stack = []
+        self.positions = {}         # song id -> first position in the playlist, for queued songs
+        self.indexed = 0            # playlist entries already folded into positions
     def set_playlist(self, playlist: Playlist):
         self.current_playlist = playlist
         self.current_index = -1
+        self.positions = {}
+        self.indexed = 0
         self.next_queue.clear()
         self.prev_stack.clear()
     def has_next(self):
@@ -21,10 +28,7 @@ class CustomQueueStrategy:
         if self.next_queue:
             s = self.next_queue.popleft()
             self.prev_stack.append(s)
-            for i, song in enumerate(self.current_playlist.get_songs()):
-                if song == s:
-                    self.current_index = i
-                    break
+            self._move_to(s)
             return s
         return self.next_sequential()
     def next_sequential(self):
@@ -39,10 +43,7 @@ class CustomQueueStrategy:
             raise Exception("No playlist loaded or playlist is empty.")
         if self.prev_stack:
             s = self.prev_stack.pop()
-            for i, song in enumerate(self.current_playlist.get_songs()):
-                if song == s:
-                    self.current_index = i
-                    break
+            self._move_to(s)
             return s
         return self.previous_sequential()
     def previous_sequential(self):
@@ -54,3 +55,27 @@ class CustomQueueStrategy:
         if song is None:
             raise Exception("Cannot enqueue null song.")
         self.next_queue.append(song)
+    def snapshot_state(self):
+        table = SongTable.get_instance()
+        return {
+            "index": self.current_index,
+            "next_queue": array("I", (table.register(s) for s in self.next_queue)),
+            "prev_stack": array("I", (table.register(s) for s in self.prev_stack)),
+        }
+    def restore_state(self, playlist: Playlist, state):
+        self.set_playlist(playlist)
+        songs = SongTable.get_instance().songs
+        self.current_index = state["index"]
+        self.next_queue.extend(songs[i] for i in state["next_queue"])
+        self.prev_stack.extend(songs[i] for i in state["prev_stack"])
+    def _move_to(self, song: Song):
+        # The playlist's bitset rules out songs it does not hold (they keep the current
+        # index); positions of the rest come from a map built on the first queued song
+        # and extended as the playlist grows
+        if not self.current_playlist.contains(song):
+            return
+        song_ids = self.current_playlist.get_song_ids()
+        for i in range(self.indexed, len(song_ids)):
+            self.positions.setdefault(song_ids[i], i)
+        self.indexed = len(song_ids)
+        self.current_index = self.positions[song.song_id]
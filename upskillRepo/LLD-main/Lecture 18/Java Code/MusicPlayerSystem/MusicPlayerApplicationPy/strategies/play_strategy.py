@@ -18,3 +18,8 @@ class PlayStrategy(ABC):
         pass
     def add_to_next(self, song):
         pass
+    def snapshot_state(self):
+        # Position in the playlist as a dict of ints and array('I')s, for PlaybackSnapshot
+        raise NotImplementedError
+    def restore_state(self, playlist, state):
+        raise NotImplementedError
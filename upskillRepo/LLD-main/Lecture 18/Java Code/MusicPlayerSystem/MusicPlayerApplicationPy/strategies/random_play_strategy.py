@@ -1,32 +1,68 @@
 from models.playlist import Playlist
 from models.song import Song
+from strategies.play_strategy import PlayStrategy
+from core.shuffle_engine import ShuffleEngine
+from core.playback_state import resolve_state
 import random
+from array import array
 
-class RandomPlayStrategy:
-    def __init__(self):
+class RandomPlayStrategy(PlayStrategy):
+    def __init__(self, seed=None):
         self.current_playlist = None
-        self.remaining_songs = []
-        self.history = []
+        self.rng = random.Random(seed)
+        self.shuffle = None
+        self.history = array("I")     # playlist positions already played, most recent last
+        self.history_shared = False     # a snapshot still reads history; copy before popping
+    def set_seed(self, seed):
+        self.rng.seed(seed)
     def set_playlist(self, playlist: Playlist):
         self.current_playlist = playlist
+        self.history = array("I")
+        self.history_shared = False
         if self.current_playlist is None or self.current_playlist.get_size() == 0:
+            self.shuffle = None
             return
-        self.remaining_songs = list(self.current_playlist.get_songs())
-        self.history = []
+        self.shuffle = ShuffleEngine(self.current_playlist.get_size(), self.rng)
     def has_next(self):
-        return self.current_playlist is not None and len(self.remaining_songs) > 0
+        return self.shuffle is not None and self.shuffle.has_next()
     def next(self):
         if self.current_playlist is None or self.current_playlist.get_size() == 0:
             raise Exception("No playlist loaded or playlist is empty.")
-        if not self.remaining_songs:
+        if not self.has_next():
             raise Exception("No songs left to play")
-        idx = random.randint(0, len(self.remaining_songs) - 1)
-        selected_song = self.remaining_songs.pop(idx)
-        self.history.append(selected_song)
-        return selected_song
+        idx = self.shuffle.next_index()
+        self.history.append(idx)
+        return self.current_playlist.get_songs()[idx]
     def has_previous(self):
         return len(self.history) > 0
     def previous(self):
         if not self.history:
             raise Exception("No previous song available.")
-        return self.history.pop()
+        if self.history_shared:
+            self.history = array("I", self.history)
+            self.history_shared = False
+        return self.current_playlist.get_songs()[self.history.pop()]
+    def snapshot_state(self):
+        # Constant time on the playback thread: history and the shuffle are handed
+        # over as functions that copy them later, when the snapshot is encoded.
+        # history is only appended to while shared, so its first `played` slots hold.
+        version, words, gauss_next = self.rng.getstate()
+        history, played = self.history, len(self.history)
+        self.history_shared = True
+        state = {"history": lambda: history[:played], "rng_version": version, "rng": lambda: array("I", words)}
+        if gauss_next is not None:
+            state["rng_gauss"] = gauss_next
+        if self.shuffle is not None:
+            state["drawn"], state["swapped"] = self.shuffle.frozen()
+        return state
+    def restore_state(self, playlist: Playlist, state):
+        # Picks the shuffle up where it stopped instead of replaying the draws
+        state = resolve_state(state)
+        self.current_playlist = playlist
+        self.history = state["history"]
+        self.history_shared = False
+        self.rng.setstate((state["rng_version"], tuple(state["rng"]), state.get("rng_gauss")))
+        self.shuffle = None
+        if "drawn" in state:
+            self.shuffle = ShuffleEngine(playlist.get_size(), self.rng)
+            self.shuffle.restore(state["drawn"], state["swapped"])
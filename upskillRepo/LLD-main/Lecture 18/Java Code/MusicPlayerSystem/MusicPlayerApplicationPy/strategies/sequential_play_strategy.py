@@ -1,7 +1,8 @@
 from models.playlist import Playlist
 from models.song import Song
+from strategies.play_strategy import PlayStrategy
 
-class SequentialPlayStrategy:
+class SequentialPlayStrategy(PlayStrategy):
     def __init__(self):
         self.current_playlist = None
         self.current_index = -1
@@ -22,3 +23,8 @@ class SequentialPlayStrategy:
             raise Exception("No playlist loaded or playlist is empty.")
         self.current_index -= 1
         return self.current_playlist.get_songs()[self.current_index]
+    def snapshot_state(self):
+        return {"index": self.current_index}
+    def restore_state(self, playlist: Playlist, state):
+        self.set_playlist(playlist)
+        self.current_index = state["index"]
@@ -1,4 +1,7 @@
+import json
 import random
+import threading
+import time
 from enum import Enum
 
 # ----------------------------
@@ -11,6 +14,149 @@ class PaymentRequest:
         self.amount = amount
         self.currency = currency
 
+# ----------------------------
+# Latency histogram (HDR-style log-linear buckets, values in microseconds)
+# ----------------------------
+class LatencyHistogram:
+    # Log-linear buckets (2^sub_bucket_bits linear slots per power of two, ~2
+    # significant digits) allocated once up to max_value; larger samples are
+    # clamped into the last bucket, so recording never allocates.
+    def __init__(self, sub_bucket_bits=7, max_value=(1 << 32) - 1):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.sub_bucket_half = 1 << (sub_bucket_bits - 1)
+        self.sub_bucket_count = 1 << sub_bucket_bits
+        self.max_trackable = max_value
+        self.counts = [0] * (self._index_for(max_value) + 1)
+        self.total_count = 0
+        self.min_value = None
+        self.max_value = 0
+        self.sum_value = 0
+
+    def _index_for(self, value):
+        if value < self.sub_bucket_count:
+            return value
+        shift = value.bit_length() - self.sub_bucket_bits
+        return shift * self.sub_bucket_half + (value >> shift)
+
+    def _highest_value_at(self, index):
+        if index < self.sub_bucket_count:
+            return index
+        shift = index // self.sub_bucket_half - 1
+        mantissa = index - shift * self.sub_bucket_half
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, value):
+        value = min(max(0, int(value)), self.max_trackable)
+        self.counts[self._index_for(value)] += 1
+        self.total_count += 1
+        self.sum_value += value
+        if self.min_value is None or value < self.min_value:
+            self.min_value = value
+        if value > self.max_value:
+            self.max_value = value
+
+    def percentile(self, pct):
+        if self.total_count == 0:
+            return 0
+        target = max(1, int(round(pct / 100.0 * self.total_count)))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self._highest_value_at(index), self.max_value)
+        return self.max_value
+
+    def summary(self):
+        return {
+            "count": self.total_count,
+            "min_us": self.min_value or 0,
+            "max_us": self.max_value,
+            "mean_us": self.sum_value / self.total_count if self.total_count else 0.0,
+            "p50_us": self.percentile(50),
+            "p90_us": self.percentile(90),
+            "p99_us": self.percentile(99),
+            "p999_us": self.percentile(99.9),
+        }
+
+# ----------------------------
+# Payment pipeline instrumentation (Singleton), disabled by default
+# ----------------------------
+class PaymentMetrics:
+    _instance = None
+    STAGES = ("validate", "initiate", "confirm", "total")
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self.reset()
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = PaymentMetrics()
+        return cls._instance
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def active(self):
+        # Hot path check: callers skip all timing work when this returns None
+        return self if self.enabled else None
+
+    def reset(self):
+        with self._lock:
+            self.histograms = {}   # (gateway name, stage) -> LatencyHistogram
+            self.failures = {}     # (gateway name, stage) -> count
+            self.retries = {}      # gateway name -> retry attempts
+            self.exhausted = {}    # gateway name -> payments failed after all retries
+
+    @staticmethod
+    def _key(gateway_type):
+        return gateway_type.name if gateway_type is not None else "UNKNOWN"
+
+    def record(self, gateway_type, stage, elapsed_ns, ok=True):
+        key = (self._key(gateway_type), stage)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = LatencyHistogram()
+            histogram.record(elapsed_ns // 1000)
+            if not ok:
+                self.failures[key] = self.failures.get(key, 0) + 1
+
+    def record_retry(self, gateway_type):
+        key = self._key(gateway_type)
+        with self._lock:
+            self.retries[key] = self.retries.get(key, 0) + 1
+
+    def record_exhausted(self, gateway_type):
+        key = self._key(gateway_type)
+        with self._lock:
+            self.exhausted[key] = self.exhausted.get(key, 0) + 1
+
+    def snapshot(self):
+        with self._lock:
+            result = {}
+            for (gateway, stage), histogram in self.histograms.items():
+                stats = histogram.summary()
+                stats["failures"] = self.failures.get((gateway, stage), 0)
+                result.setdefault(gateway, {"stages": {}})["stages"][stage] = stats
+            for gateway in set(self.retries) | set(self.exhausted):
+                entry = result.setdefault(gateway, {"stages": {}})
+                entry["retries"] = self.retries.get(gateway, 0)
+                entry["exhausted"] = self.exhausted.get(gateway, 0)
+            return result
+
+    def export(self, path=None):
+        data = json.dumps(self.snapshot(), indent=2, sort_keys=True)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(data)
+        return data
+
 # ----------------------------
 # Banking System interface and implementations (Strategy for actual payment logic)
 # ----------------------------
@@ -37,19 +183,37 @@ class RazorpayBankingSystem(BankingSystem):
 class PaymentGateway:
     def __init__(self):
         self.banking_system = None
+        self.gateway_type = None
 
     def process_payment(self, request: PaymentRequest):
-        if not self.validate_payment(request):
+        metrics = PaymentMetrics.get_instance().active()
+        if metrics is None:
+            return self._process_stages(request, None)
+        start = time.perf_counter_ns()
+        result = self._process_stages(request, metrics)
+        metrics.record(self.gateway_type, "total", time.perf_counter_ns() - start, result)
+        return result
+
+    def _process_stages(self, request: PaymentRequest, metrics):
+        if not self._run_stage(metrics, "validate", self.validate_payment, request):
             print(f"[PaymentGateway] Validation failed for {request.sender}.")
             return False
-        if not self.initiate_payment(request):
+        if not self._run_stage(metrics, "initiate", self.initiate_payment, request):
             print(f"[PaymentGateway] Initiation failed for {request.sender}.")
             return False
-        if not self.confirm_payment(request):
+        if not self._run_stage(metrics, "confirm", self.confirm_payment, request):
             print(f"[PaymentGateway] Confirmation failed for {request.sender}.")
             return False
         return True
 
+    def _run_stage(self, metrics, stage, step, request: PaymentRequest):
+        if metrics is None:
+            return step(request)
+        start = time.perf_counter_ns()
+        ok = step(request)
+        metrics.record(self.gateway_type, stage, time.perf_counter_ns() - start, ok)
+        return ok
+
     def validate_payment(self, request: PaymentRequest):
         raise NotImplementedError
     def initiate_payment(self, request: PaymentRequest):
@@ -64,6 +228,7 @@ class PaytmGateway(PaymentGateway):
     def __init__(self):
         super().__init__()
         self.banking_system = PaytmBankingSystem()
+        self.gateway_type = GatewayType.PAYTM
 
     def validate_payment(self, request: PaymentRequest):
         print(f"[Paytm] Validating payment for {request.sender}.")
@@ -86,6 +251,7 @@ class RazorpayGateway(PaymentGateway):
     def __init__(self):
         super().__init__()
         self.banking_system = RazorpayBankingSystem()
+        self.gateway_type = GatewayType.RAZORPAY
 
     def validate_payment(self, request: PaymentRequest):
         print(f"[Razorpay] Validating payment for {request.sender}.")
@@ -109,17 +275,23 @@ class PaymentGatewayProxy(PaymentGateway):
         super().__init__()
         self.real_gateway = real_gateway
         self.retries = max_retries
+        self.gateway_type = real_gateway.gateway_type
 
     def process_payment(self, request: PaymentRequest):
+        metrics = PaymentMetrics.get_instance().active()
         result = False
         for attempt in range(self.retries):
             if attempt > 0:
                 print(f"[Proxy] Retrying payment (attempt {attempt+1}) for {request.sender}.")
+                if metrics is not None:
+                    metrics.record_retry(self.gateway_type)
             result = self.real_gateway.process_payment(request)
             if result:
                 break
         if not result:
             print(f"[Proxy] Payment failed after {self.retries} attempts for {request.sender}.")
+            if metrics is not None:
+                metrics.record_exhausted(self.gateway_type)
         return result
 
     def validate_payment(self, request: PaymentRequest):
@@ -204,6 +376,8 @@ class PaymentController:
 # Main: Client code now goes through controller
 # ----------------------------
 if __name__ == "__main__":
+    PaymentMetrics.get_instance().enable()
+
     req1 = PaymentRequest("Aditya", "Shubham", 1000.0, "INR")
     print("Processing via Paytm")
     print("------------------------------")
@@ -217,3 +391,7 @@ if __name__ == "__main__":
     res2 = PaymentController.get_instance().handle_payment(GatewayType.RAZORPAY, req2)
     print(f"Result: {'SUCCESS' if res2 else 'FAIL'}")
     print("------------------------------")
+
+    print("Pipeline metrics")
+    print("------------------------------")
+    print(PaymentMetrics.get_instance().export())
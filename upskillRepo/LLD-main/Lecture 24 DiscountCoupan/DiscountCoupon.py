@@ -1,6 +1,15 @@
+import bisect
+import csv
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import List
+from typing import Iterable, List
+
+try:
+    import numpy as np
+except ImportError:  # only needed for CouponManager.reprice_batch
+    np = None
 
 # ----------------------------
 # Discount Strategy (Strategy Pattern)
@@ -8,18 +17,25 @@ from typing import List
 class DiscountStrategy:
     def calculate(self, base_amount: float) -> float:
         raise NotImplementedError
+    def calculate_batch(self, base_amounts):
+        # Vectorized calculate over a NumPy array; subclasses override with array ops
+        return np.fromiter((self.calculate(b) for b in base_amounts), dtype=float, count=len(base_amounts))
 
 class FlatDiscountStrategy(DiscountStrategy):
     def __init__(self, amount: float):
         self.amount = amount
     def calculate(self, base_amount: float) -> float:
         return min(self.amount, base_amount)
+    def calculate_batch(self, base_amounts):
+        return np.minimum(self.amount, base_amounts)
 
 class PercentageDiscountStrategy(DiscountStrategy):
     def __init__(self, percent: float):
         self.percent = percent
     def calculate(self, base_amount: float) -> float:
         return (self.percent / 100.0) * base_amount
+    def calculate_batch(self, base_amounts):
+        return (self.percent / 100.0) * base_amounts
 
 class PercentageWithCapStrategy(DiscountStrategy):
     def __init__(self, percent: float, cap: float):
@@ -28,6 +44,8 @@ class PercentageWithCapStrategy(DiscountStrategy):
     def calculate(self, base_amount: float) -> float:
         disc = (self.percent / 100.0) * base_amount
         return min(disc, self.cap)
+    def calculate_batch(self, base_amounts):
+        return np.minimum((self.percent / 100.0) * base_amounts, self.cap)
 
 class StrategyType(Enum):
     FLAT = 1
@@ -41,14 +59,26 @@ class DiscountStrategyManager:
     _instance = None
     _lock = threading.Lock()
     def __init__(self):
-        pass
+        # Strategies are stateless, so equal (type, param1, param2) share one instance
+        self._cache = {}
     @classmethod
     def get_instance(cls):
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = DiscountStrategyManager()
-            return cls._instance
+        # Double-checked locking: the lock is only taken until the instance exists
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = DiscountStrategyManager()
+        return cls._instance
     def get_strategy(self, type_: StrategyType, param1: float, param2: float):
+        key = (type_, param1, param2)
+        strat = self._cache.get(key)
+        if strat is None:
+            strat = self._create_strategy(type_, param1, param2)
+            if strat is not None:
+                # setdefault is atomic, so racing callers still end up sharing one instance
+                strat = self._cache.setdefault(key, strat)
+        return strat
+    def _create_strategy(self, type_: StrategyType, param1: float, param2: float):
         if type_ == StrategyType.FLAT:
             return FlatDiscountStrategy(param1)
         elif type_ == StrategyType.PERCENT:
@@ -57,6 +87,8 @@ class DiscountStrategyManager:
             return PercentageWithCapStrategy(param1, param2)
         else:
             return None
+    def cache_size(self):
+        return len(self._cache)
 
 # ----------------------------
 # Product, CartItem, Cart
@@ -82,6 +114,22 @@ class CartItem:
     def get_product(self):
         return self.product
 
+class CartSummary:
+    # Aggregates every coupon needs, maintained incrementally by Cart
+    def __init__(self):
+        self.category_totals = {}
+        self.original_total = 0.0
+        self.payment_bank = ""
+        self.loyalty_member = False
+    def add_item(self, item: CartItem, total: float):
+        category = item.get_product().get_category()
+        self.category_totals[category] = self.category_totals.get(category, 0) + total
+        self.original_total += total
+    def has_category(self, category: str):
+        return category in self.category_totals
+    def category_total(self, category: str):
+        return self.category_totals.get(category, 0)
+
 class Cart:
     def __init__(self):
         self.items: List[CartItem] = []
@@ -89,11 +137,14 @@ class Cart:
         self.current_total = 0.0
         self.loyalty_member = False
         self.payment_bank = ""
+        self.summary = CartSummary()
     def add_product(self, prod: Product, qty: int):
         item = CartItem(prod, qty)
+        total = item.item_total()
         self.items.append(item)
-        self.original_total += item.item_total()
-        self.current_total += item.item_total()
+        self.original_total += total
+        self.current_total += total
+        self.summary.add_item(item, total)
     def get_original_total(self):
         return self.original_total
     def get_current_total(self):
@@ -104,14 +155,18 @@ class Cart:
             self.current_total = 0
     def set_loyalty_member(self, member: bool):
         self.loyalty_member = member
+        self.summary.loyalty_member = member
     def is_loyalty_member(self):
         return self.loyalty_member
     def set_payment_bank(self, bank: str):
         self.payment_bank = bank
+        self.summary.payment_bank = bank
     def get_payment_bank(self):
         return self.payment_bank
     def get_items(self):
         return self.items
+    def get_summary(self):
+        return self.summary
 
 # ----------------------------
 # Coupon base class (Chain of Responsibility)
@@ -125,17 +180,31 @@ class Coupon:
         return self.next
     def apply_discount(self, cart: Cart):
         if self.is_applicable(cart):
-            discount = self.get_discount(cart)
-            cart.apply_discount(discount)
-            print(f"{self.name()} applied: {discount}")
+            self.redeem(cart)
             if not self.is_combinable():
                 return
         if self.next:
             self.next.apply_discount(cart)
+    def redeem(self, cart: Cart):
+        discount = self.get_discount(cart)
+        cart.apply_discount(discount)
+        print(f"{self.name()} applied: {discount}")
+    def index_key(self):
+        # (rule kind, key) used by CouponRuleTable; None means "always a candidate"
+        return None
+    def pricing_key(self):
+        # Coupons with equal keys discount identically; CouponOptimizer explores only one of them
+        return id(self)
     def is_applicable(self, cart: Cart):
         raise NotImplementedError
     def get_discount(self, cart: Cart):
         raise NotImplementedError
+    def batch_applicable(self, batch):
+        # Bool array over batch.carts; generic fallback calls is_applicable per cart
+        return np.fromiter((self.is_applicable(c) for c in batch.carts), dtype=bool, count=len(batch))
+    def batch_discount(self, batch, current_totals):
+        return np.fromiter((self.get_discount(_CartView(c, t)) for c, t in zip(batch.carts, current_totals)),
+                           dtype=float, count=len(batch))
     def is_combinable(self):
         return True
     def name(self):
@@ -150,11 +219,18 @@ class SeasonalOffer(Coupon):
         self.percent = percent
         self.category = category
         self.strat = DiscountStrategyManager.get_instance().get_strategy(StrategyType.PERCENT, percent, 0.0)
+    def index_key(self):
+        return ("category", self.category)
+    def pricing_key(self):
+        return ("seasonal", self.percent, self.category)
     def is_applicable(self, cart: Cart):
-        return any(item.get_product().get_category() == self.category for item in cart.get_items())
+        return cart.get_summary().has_category(self.category)
     def get_discount(self, cart: Cart):
-        subtotal = sum(item.item_total() for item in cart.get_items() if item.get_product().get_category() == self.category)
-        return self.strat.calculate(subtotal)
+        return self.strat.calculate(cart.get_summary().category_total(self.category))
+    def batch_applicable(self, batch):
+        return batch.has_category(self.category)
+    def batch_discount(self, batch, current_totals):
+        return self.strat.calculate_batch(batch.category_total(self.category))
     def name(self):
         return f"Seasonal Offer {int(self.percent)}% off {self.category}"
 
@@ -163,10 +239,18 @@ class LoyaltyDiscount(Coupon):
         super().__init__()
         self.percent = percent
         self.strat = DiscountStrategyManager.get_instance().get_strategy(StrategyType.PERCENT, percent, 0.0)
+    def index_key(self):
+        return ("loyalty", True)
+    def pricing_key(self):
+        return ("loyalty", self.percent)
     def is_applicable(self, cart: Cart):
-        return cart.is_loyalty_member()
+        return cart.get_summary().loyalty_member
     def get_discount(self, cart: Cart):
         return self.strat.calculate(cart.get_current_total())
+    def batch_applicable(self, batch):
+        return batch.loyalty_member
+    def batch_discount(self, batch, current_totals):
+        return self.strat.calculate_batch(current_totals)
     def name(self):
         return f"Loyalty Discount {int(self.percent)}% off"
 
@@ -176,10 +260,18 @@ class BulkPurchaseDiscount(Coupon):
         self.threshold = threshold
         self.flat_off = flat_off
         self.strat = DiscountStrategyManager.get_instance().get_strategy(StrategyType.FLAT, flat_off, 0.0)
+    def index_key(self):
+        return ("min_spend", self.threshold)
+    def pricing_key(self):
+        return ("bulk", self.threshold, self.flat_off)
     def is_applicable(self, cart: Cart):
-        return cart.get_original_total() >= self.threshold
+        return cart.get_summary().original_total >= self.threshold
     def get_discount(self, cart: Cart):
         return self.strat.calculate(cart.get_current_total())
+    def batch_applicable(self, batch):
+        return batch.original_total >= self.threshold
+    def batch_discount(self, batch, current_totals):
+        return self.strat.calculate_batch(current_totals)
     def name(self):
         return f"Bulk Purchase Rs {int(self.flat_off)} off over {int(self.threshold)}"
 
@@ -191,50 +283,404 @@ class BankingCoupon(Coupon):
         self.percent = percent
         self.off_cap = off_cap
         self.strat = DiscountStrategyManager.get_instance().get_strategy(StrategyType.PERCENT_WITH_CAP, percent, off_cap)
+    def index_key(self):
+        return ("bank", (self.bank, self.min_spend))
+    def pricing_key(self):
+        return ("bank", self.bank, self.min_spend, self.percent, self.off_cap)
     def is_applicable(self, cart: Cart):
-        return cart.get_payment_bank() == self.bank and cart.get_original_total() >= self.min_spend
+        summary = cart.get_summary()
+        return summary.payment_bank == self.bank and summary.original_total >= self.min_spend
     def get_discount(self, cart: Cart):
         return self.strat.calculate(cart.get_current_total())
+    def batch_applicable(self, batch):
+        return batch.bank_is(self.bank) & (batch.original_total >= self.min_spend)
+    def batch_discount(self, batch, current_totals):
+        return self.strat.calculate_batch(current_totals)
     def name(self):
         return f"{self.bank} Bank Rs {int(self.percent)} off upto {int(self.off_cap)}"
 
+# Row parsers used by CouponManager.load_coupons: type -> (field names, parser)
+COUPON_LOADERS = {
+    "seasonal": (("percent", "category"), lambda f: SeasonalOffer(float(f[0]), f[1])),
+    "loyalty": (("percent",), lambda f: LoyaltyDiscount(float(f[0]))),
+    "bulk": (("threshold", "flat_off"), lambda f: BulkPurchaseDiscount(float(f[0]), float(f[1]))),
+    "bank": (("bank", "min_spend", "percent", "off_cap"),
+             lambda f: BankingCoupon(f[0], float(f[1]), float(f[2]), float(f[3]))),
+}
+
+# ----------------------------
+# CouponRuleTable: coupons compiled into indexes so a cart only visits candidates.
+# Never mutated after construction, so readers can share it without locking.
+# ----------------------------
+class CouponRuleTable:
+    def __init__(self, coupons: Iterable[Coupon] = ()):
+        self.coupons = tuple(coupons)
+        self.by_category = {}                       # category -> [position]
+        self.by_bank = {}                           # bank -> ([min_spend], [position]) sorted by min_spend
+        self.loyalty: List[int] = []
+        self.min_spend_keys: List[float] = []       # sorted thresholds
+        self.min_spend_positions: List[int] = []
+        self.always: List[int] = []                 # coupons without an index key
+        bank_rules = {}
+        min_spend_rules = []
+        for pos, coupon in enumerate(self.coupons):
+            key = coupon.index_key()
+            kind = key[0] if key else None
+            if kind == "category":
+                self.by_category.setdefault(key[1], []).append(pos)
+            elif kind == "bank":
+                bank, min_spend = key[1]
+                bank_rules.setdefault(bank, []).append((min_spend, pos))
+            elif kind == "loyalty":
+                self.loyalty.append(pos)
+            elif kind == "min_spend":
+                min_spend_rules.append((key[1], pos))
+            else:
+                self.always.append(pos)
+        for bank, rules in bank_rules.items():
+            rules.sort()
+            self.by_bank[bank] = ([r[0] for r in rules], [r[1] for r in rules])
+        min_spend_rules.sort()
+        self.min_spend_keys = [r[0] for r in min_spend_rules]
+        self.min_spend_positions = [r[1] for r in min_spend_rules]
+
+    def extended(self, coupons: Iterable[Coupon]) -> "CouponRuleTable":
+        # New table with coupons appended. The compiled indexes are copied and only
+        # the new coupons are placed, instead of re-deriving every index; large
+        # batches are cheaper to compile from scratch.
+        coupons = tuple(coupons)
+        if len(coupons) * 8 > len(self.coupons):
+            return CouponRuleTable(self.coupons + coupons)
+        table = CouponRuleTable.__new__(CouponRuleTable)
+        table.coupons = self.coupons + coupons
+        table.by_category = {category: list(positions) for category, positions in self.by_category.items()}
+        table.by_bank = {bank: (list(keys), list(positions)) for bank, (keys, positions) in self.by_bank.items()}
+        table.loyalty = list(self.loyalty)
+        table.min_spend_keys = list(self.min_spend_keys)
+        table.min_spend_positions = list(self.min_spend_positions)
+        table.always = list(self.always)
+        for pos in range(len(self.coupons), len(table.coupons)):
+            key = table.coupons[pos].index_key()
+            kind = key[0] if key else None
+            if kind == "category":
+                table.by_category.setdefault(key[1], []).append(pos)
+            elif kind == "bank":
+                bank, min_spend = key[1]
+                keys, positions = table.by_bank.setdefault(bank, ([], []))
+                i = bisect.bisect_right(keys, min_spend)    # after equal thresholds, like the sort by (key, pos)
+                keys.insert(i, min_spend)
+                positions.insert(i, pos)
+            elif kind == "loyalty":
+                table.loyalty.append(pos)
+            elif kind == "min_spend":
+                i = bisect.bisect_right(table.min_spend_keys, key[1])
+                table.min_spend_keys.insert(i, key[1])
+                table.min_spend_positions.insert(i, pos)
+            else:
+                table.always.append(pos)
+        return table
+
+    def candidates(self, cart: Cart) -> List[Coupon]:
+        summary = cart.get_summary()
+        total = summary.original_total
+        positions = list(self.always)
+        for category in summary.category_totals:
+            positions.extend(self.by_category.get(category, ()))
+        bank_rules = self.by_bank.get(summary.payment_bank)
+        if bank_rules:
+            positions.extend(bank_rules[1][:bisect.bisect_right(bank_rules[0], total)])
+        if summary.loyalty_member:
+            positions.extend(self.loyalty)
+        positions.extend(self.min_spend_positions[:bisect.bisect_right(self.min_spend_keys, total)])
+        positions.sort()  # keep registration order so results match the chain
+        return [self.coupons[pos] for pos in positions]
+
+    def get_applicable(self, cart: Cart) -> List[str]:
+        return [c.name() for c in self.candidates(cart) if c.is_applicable(cart)]
+
+    def apply(self, cart: Cart) -> float:
+        for coupon in self.candidates(cart):
+            if coupon.is_applicable(cart):
+                coupon.redeem(cart)
+                if not coupon.is_combinable():
+                    break
+        return cart.get_current_total()
+
+# ----------------------------
+# CouponOptimizer: picks the coupon subset and order giving the lowest total
+# ----------------------------
+class _CartView:
+    # Read-only cart with a hypothetical running total, so discounts can be probed without mutating the cart
+    def __init__(self, cart: Cart, current_total: float):
+        self.cart = cart
+        self.current_total = current_total
+    def get_current_total(self):
+        return self.current_total
+    def __getattr__(self, attr):
+        return getattr(self.cart, attr)
+
+class CouponPlan:
+    def __init__(self, coupons: List[Coupon], final_total: float, optimal: bool, nodes: int):
+        self.coupons = coupons
+        self.final_total = final_total
+        self.optimal = optimal      # False when the time budget cut the search short
+        self.nodes = nodes
+    def names(self):
+        return [c.name() for c in self.coupons]
+
+class CouponOptimizer:
+    # Depth-first branch-and-bound over application orders. Assumes what every
+    # DiscountStrategy here satisfies: discounts are >= 0 and never grow as the
+    # running total shrinks. Then the lowest total reached for a given set of
+    # applied coupons dominates (memoized per bitmask), and the current total
+    # minus every remaining coupon's discount at that total is a lower bound.
+    EPS = 1e-9
+    def __init__(self, time_budget_ms: float = 20.0):
+        self.time_budget_ms = time_budget_ms
+
+    @staticmethod
+    def _step(coupon: Coupon, cart: Cart, total: float) -> float:
+        return max(total - coupon.get_discount(_CartView(cart, total)), 0.0)
+
+    def _evaluate(self, order: List[Coupon], cart: Cart) -> float:
+        total = cart.get_current_total()
+        for coupon in order:
+            total = self._step(coupon, cart, total)
+        return total
+
+    def _prefix_totals(self, order: List[Coupon], cart: Cart, start_total: float) -> List[float]:
+        totals = [start_total]
+        for coupon in order:
+            totals.append(self._step(coupon, cart, totals[-1]))
+        return totals
+
+    def _greedy(self, coupons: List[Coupon], cart: Cart, deadline: float):
+        # Incumbent: proportional discounts before fixed ones (a coupon whose discount
+        # halves with the total goes first), then adjacent swaps while they help
+        start_total = cart.get_current_total()
+        def elasticity(coupon):
+            full = coupon.get_discount(_CartView(cart, start_total))
+            half = coupon.get_discount(_CartView(cart, start_total / 2.0))
+            return (half / full if full > 0 else 1.0, -full)
+        order = sorted((c for c in coupons if c.is_combinable()), key=elasticity)
+        totals = self._prefix_totals(order, cart, start_total)
+        improved = True
+        while improved and time.perf_counter() < deadline:
+            improved = False
+            for i in range(len(order) - 1):
+                # Maps are monotone, so a lower total after position i+1 can only help the final total
+                first = self._step(order[i + 1], cart, totals[i])
+                second = self._step(order[i], cart, first)
+                if second < totals[i + 2] - self.EPS:
+                    order[i], order[i + 1] = order[i + 1], order[i]
+                    totals[i + 1:] = self._prefix_totals(order[i:], cart, totals[i])[1:]
+                    improved = True
+        best_order, best_total = order, totals[-1]
+        for finisher in coupons:
+            if not finisher.is_combinable():
+                candidate = self._step(finisher, cart, totals[-1])
+                if candidate < best_total - self.EPS:
+                    best_order, best_total = order + [finisher], candidate
+        return best_order, best_total
+
+    def solve(self, cart: Cart, coupons: Iterable[Coupon]) -> CouponPlan:
+        start = time.perf_counter()
+        deadline = start + self.time_budget_ms / 1000.0
+        applicable = [c for c in coupons if c.is_applicable(cart)]
+        best_order, best_total = self._greedy(applicable, cart, deadline)
+        best_indexes = [applicable.index(c) for c in best_order]
+        n = len(applicable)
+        keys = [c.pricing_key() for c in applicable]
+        memo = {}                       # bitmask of applied coupons -> lowest total reached
+        path = []
+        nodes = 0
+        timed_out = False
+
+        def search(mask: int, total: float):
+            nonlocal best_total, best_indexes, nodes, timed_out
+            nodes += 1
+            if (nodes & 15) == 0 and time.perf_counter() > deadline:
+                timed_out = True
+            if timed_out:
+                return
+            if total < best_total - self.EPS:
+                best_total, best_indexes = total, list(path)
+            seen = memo.get(mask)
+            if seen is not None and seen <= total + self.EPS:
+                return
+            memo[mask] = total
+            children = []
+            discounts = {}              # pricing key -> discount at this total
+            bound = total
+            for i in range(n):
+                if mask >> i & 1:
+                    continue
+                discount = discounts.get(keys[i])
+                if discount is None:
+                    discount = discounts[keys[i]] = applicable[i].get_discount(_CartView(cart, total))
+                    children.append((max(total - discount, 0.0), i))
+                bound -= discount
+            if max(bound, 0.0) >= best_total - self.EPS:
+                return
+            children.sort()
+            for child_total, i in children:
+                path.append(i)
+                if applicable[i].is_combinable():
+                    search(mask | (1 << i), child_total)
+                elif child_total < best_total - self.EPS:
+                    # A non-combinable coupon ends the chain
+                    best_total, best_indexes = child_total, list(path)
+                path.pop()
+                if timed_out:
+                    return
+
+        search(0, cart.get_current_total())
+        return CouponPlan([applicable[i] for i in best_indexes], best_total, not timed_out, nodes)
+
 # ----------------------------
-# CouponManager (Singleton)
+# CartBatch: cart summaries as NumPy columns for vectorized re-pricing
+# ----------------------------
+class CartBatch:
+    def __init__(self, carts: List[Cart]):
+        self.carts = list(carts)
+        n = len(self.carts)
+        summaries = [c.get_summary() for c in self.carts]
+        self.current_total = np.fromiter((c.get_current_total() for c in self.carts), dtype=float, count=n)
+        self.original_total = np.fromiter((s.original_total for s in summaries), dtype=float, count=n)
+        self.loyalty_member = np.fromiter((s.loyalty_member for s in summaries), dtype=bool, count=n)
+        self.bank_codes = {}
+        self.bank = np.fromiter((self.bank_codes.setdefault(s.payment_bank, len(self.bank_codes)) for s in summaries),
+                                dtype=np.int32, count=n)
+        self.category_columns = {}
+        rows, cols, totals = [], [], []
+        for row, summary in enumerate(summaries):
+            for category, total in summary.category_totals.items():
+                rows.append(row)
+                cols.append(self.category_columns.setdefault(category, len(self.category_columns)))
+                totals.append(total)
+        self.category_totals = np.zeros((n, len(self.category_columns)), dtype=float)
+        self.category_present = np.zeros((n, len(self.category_columns)), dtype=bool)
+        self.category_totals[rows, cols] = totals
+        self.category_present[rows, cols] = True
+
+    def __len__(self):
+        return len(self.carts)
+
+    def bank_is(self, bank: str):
+        code = self.bank_codes.get(bank)
+        if code is None:
+            return np.zeros(len(self), dtype=bool)
+        return self.bank == code
+
+    def has_category(self, category: str):
+        col = self.category_columns.get(category)
+        if col is None:
+            return np.zeros(len(self), dtype=bool)
+        return self.category_present[:, col]
+
+    def category_total(self, category: str):
+        col = self.category_columns.get(category)
+        if col is None:
+            return np.zeros(len(self), dtype=float)
+        return self.category_totals[:, col]
+
+def reprice_batch(snapshot: CouponRuleTable, batch: CartBatch):
+    # Same walk as CouponRuleTable.apply, one coupon at a time across every cart
+    current = batch.current_total.copy()
+    active = np.ones(len(batch), dtype=bool)      # False once a non-combinable coupon ended a cart's chain
+    for coupon in snapshot.coupons:
+        mask = coupon.batch_applicable(batch) & active
+        if not mask.any():
+            continue
+        discount = coupon.batch_discount(batch, current)
+        current = np.where(mask, np.maximum(current - discount, 0.0), current)
+        if not coupon.is_combinable():
+            active &= ~mask
+    return current
+
+# ----------------------------
+# CouponManager (Singleton), copy-on-write: writers publish a new immutable
+# CouponRuleTable under _lock, readers grab the current one without locking
 # ----------------------------
 class CouponManager:
     _instance = None
     _lock = threading.Lock()
     def __init__(self):
         self.head = None
+        self.tail = None
+        self.snapshot = CouponRuleTable()
     @classmethod
     def get_instance(cls):
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = CouponManager()
-            return cls._instance
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = CouponManager()
+        return cls._instance
     def register_coupon(self, coupon: Coupon):
+        self.register_coupons([coupon])
+    def register_coupons(self, coupons: Iterable[Coupon]):
+        coupons = list(coupons)
         with self._lock:
-            if self.head is None:
-                self.head = coupon
-            else:
-                cur = self.head
-                while cur.get_next() is not None:
-                    cur = cur.get_next()
-                cur.set_next(coupon)
+            for coupon in coupons:
+                if self.head is None:
+                    self.head = coupon
+                else:
+                    self.tail.set_next(coupon)
+                self.tail = coupon
+            # Compiled once per batch, before publishing: the single reference
+            # assignment then swaps in the finished version atomically
+            self.snapshot = self.snapshot.extended(coupons)
+    def load_coupons(self, path: str) -> int:
+        # One coupon per CSV row, e.g. "seasonal,10,Clothing" or "bank,ABC,2000,15,500".
+        # Rows are parsed and chained in a single pass, then published as one snapshot.
+        # Bad rows raise ValueError prefixed with path:line (physical lines, so quoted newlines count).
+        coupons = []
+        with open(path, newline="") as f:
+            reader = csv.reader(f)
+            for row in reader:
+                if not row or row[0].startswith("#"):
+                    continue
+                where = f"{path}:{reader.line_num}"
+                kind = row[0].strip().lower()
+                if kind not in COUPON_LOADERS:
+                    raise ValueError(f"{where}: unknown coupon type '{row[0]}'")
+                fields, parse = COUPON_LOADERS[kind]
+                values = [field.strip() for field in row[1:]]
+                if len(values) != len(fields):
+                    raise ValueError(f"{where}: '{kind}' expects {len(fields)} fields "
+                                     f"({', '.join(fields)}), got {len(values)}")
+                try:
+                    coupons.append(parse(values))
+                except ValueError as error:
+                    raise ValueError(f"{where}: bad '{kind}' row: {error}") from error
+        self.register_coupons(coupons)
+        return len(coupons)
+    def get_snapshot(self) -> CouponRuleTable:
+        return self.snapshot
     def get_applicable(self, cart: Cart):
-        with self._lock:
-            res = []
-            cur = self.head
-            while cur:
-                if cur.is_applicable(cart):
-                    res.append(cur.name())
-                cur = cur.get_next()
-            return res
+        return self.snapshot.get_applicable(cart)
     def apply_all(self, cart: Cart):
-        with self._lock:
-            if self.head:
-                self.head.apply_discount(cart)
-            return cart.get_current_total()
+        return self.snapshot.apply(cart)
+    def get_best_plan(self, cart: Cart, time_budget_ms: float = 20.0) -> CouponPlan:
+        return CouponOptimizer(time_budget_ms).solve(cart, self.snapshot.candidates(cart))
+    def apply_best(self, cart: Cart, time_budget_ms: float = 20.0):
+        for coupon in self.get_best_plan(cart, time_budget_ms).coupons:
+            coupon.redeem(cart)
+        return cart.get_current_total()
+    def reprice_batch(self, carts: List[Cart], write_back: bool = True):
+        # Vectorized apply_all over many carts (no per-coupon output). Returns the totals as an array.
+        if np is None:
+            raise RuntimeError("NumPy is required for batch re-pricing")
+        totals = reprice_batch(self.snapshot, CartBatch(carts))
+        if write_back:
+            for cart, total in zip(carts, totals.tolist()):
+                cart.current_total = total
+        return totals
+    def apply_all_parallel(self, carts: List[Cart], max_workers: int = 4):
+        # Every cart is priced against the same snapshot, even if coupons change meanwhile
+        snapshot = self.snapshot
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(snapshot.apply, carts))
 
 # ----------------------------
 # Main: Client code
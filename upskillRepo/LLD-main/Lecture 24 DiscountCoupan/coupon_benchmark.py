@@ -0,0 +1,243 @@
+import contextlib
+import io
+import os
+import random
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from DiscountCoupon import (
+    BankingCoupon,
+    BulkPurchaseDiscount,
+    Cart,
+    CouponManager,
+    CouponOptimizer,
+    DiscountStrategyManager,
+    LoyaltyDiscount,
+    Product,
+    SeasonalOffer,
+)
+
+CATEGORIES = ["Clothing", "Electronics", "Grocery", "Books", "Toys", "Sports", "Beauty", "Home"]
+BANKS = ["ABC", "XYZ", "PQR"]
+
+
+# ----------------------------
+# Synthetic data
+# ----------------------------
+def build_coupons(count: int, seed: int = 7):
+    rnd = random.Random(seed)
+    coupons = []
+    for _ in range(count):
+        kind = rnd.randrange(4)
+        if kind == 0:
+            coupons.append(SeasonalOffer(rnd.randint(1, 30), rnd.choice(CATEGORIES)))
+        elif kind == 1:
+            coupons.append(LoyaltyDiscount(rnd.randint(1, 10)))
+        elif kind == 2:
+            coupons.append(BulkPurchaseDiscount(rnd.randint(0, 200000), rnd.randint(10, 500)))
+        else:
+            coupons.append(BankingCoupon(rnd.choice(BANKS), rnd.randint(0, 200000), rnd.randint(1, 20), rnd.randint(50, 1000)))
+    return coupons
+
+
+def build_manager(coupons):
+    mgr = CouponManager()
+    mgr.register_coupons(coupons)
+    return mgr
+
+
+def build_cart(lines: int, seed: int = 11):
+    rnd = random.Random(seed)
+    cart = Cart()
+    for i in range(lines):
+        cart.add_product(Product(f"item-{i}", rnd.choice(CATEGORIES), rnd.randint(10, 5000)), rnd.randint(1, 3))
+    cart.set_loyalty_member(True)
+    cart.set_payment_bank(rnd.choice(BANKS))
+    return cart
+
+
+def timed(fn, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# ----------------------------
+# Cart aggregation: per-coupon item rescans vs shared CartSummary
+# ----------------------------
+def rescan_evaluation(coupons, cart: Cart):
+    # What every coupon used to do: walk all cart lines for each check
+    total = 0.0
+    for coupon in coupons:
+        if isinstance(coupon, SeasonalOffer):
+            if any(item.get_product().get_category() == coupon.category for item in cart.get_items()):
+                total += sum(item.item_total() for item in cart.get_items()
+                             if item.get_product().get_category() == coupon.category)
+    return total
+
+
+def summary_evaluation(coupons, cart: Cart):
+    total = 0.0
+    for coupon in coupons:
+        if isinstance(coupon, SeasonalOffer) and coupon.is_applicable(cart):
+            total += cart.get_summary().category_total(coupon.category)
+    return total
+
+
+def bench_cart_summary(lines: int = 500, coupon_count: int = 1000, repeat: int = 5):
+    coupons = build_coupons(coupon_count)
+    mgr = build_manager(coupons)
+    cart = build_cart(lines)
+    print(f"Cart aggregation: {lines} lines x {coupon_count} coupons")
+    print(f"  build cart + summary    : {timed(lambda: build_cart(lines), repeat) * 1000:8.2f} ms")
+    print(f"  per-coupon rescans      : {timed(lambda: rescan_evaluation(coupons, cart), repeat) * 1000:8.2f} ms")
+    print(f"  shared CartSummary      : {timed(lambda: summary_evaluation(coupons, cart), repeat) * 1000:8.2f} ms")
+    print(f"  get_applicable+apply_all: {timed(lambda: _checkout(mgr, cart), repeat) * 1000:8.2f} ms")
+
+
+def _checkout(mgr: CouponManager, cart: Cart):
+    mgr.get_applicable(cart)
+    return mgr.apply_all(cart)
+
+
+# ----------------------------
+# Concurrent checkout: one global mutex vs lock-free snapshot reads
+# ----------------------------
+def bench_concurrent_checkout(cart_count: int = 2000, lines: int = 20, coupon_count: int = 1000,
+                              thread_counts=(1, 2, 4, 8)):
+    mgr = build_manager(build_coupons(coupon_count))
+    carts = [build_cart(lines, seed=i) for i in range(cart_count)]
+    global_lock = threading.Lock()
+
+    def locked_checkout(cart):
+        # Old behaviour: every checkout serialized behind CouponManager._lock
+        with global_lock:
+            mgr.get_applicable(cart)
+            return mgr.apply_all(cart)
+
+    print(f"Concurrent checkout: {cart_count} carts x {lines} lines, {coupon_count} coupons")
+    print(f"  {'threads':>7} {'global lock':>14} {'snapshot':>14}")
+    for threads in thread_counts:
+        results = []
+        for checkout in (locked_checkout, lambda cart: _checkout(mgr, cart)):
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                elapsed = timed(lambda: list(pool.map(checkout, carts)), 1)
+            results.append(cart_count / elapsed)
+        print(f"  {threads:>7} {results[0]:>10.0f} c/s {results[1]:>10.0f} c/s")
+
+
+# ----------------------------
+# Best-combination optimizer vs registration-order chain
+# ----------------------------
+def build_applicable_coupons(count: int, cart: Cart, seed: int = 3):
+    # Every coupon returned here applies to `cart`
+    rnd = random.Random(seed)
+    categories = list(cart.get_summary().category_totals)
+    bank = cart.get_payment_bank()
+    coupons = []
+    for _ in range(count):
+        kind = rnd.randrange(4)
+        if kind == 0:
+            coupons.append(SeasonalOffer(rnd.randint(1, 10), rnd.choice(categories)))
+        elif kind == 1:
+            coupons.append(LoyaltyDiscount(rnd.randint(1, 3)))
+        elif kind == 2:
+            coupons.append(BulkPurchaseDiscount(rnd.randint(0, 1000), rnd.randint(10, 200)))
+        else:
+            coupons.append(BankingCoupon(bank, rnd.randint(0, 1000), rnd.randint(1, 10), rnd.randint(50, 500)))
+    return coupons
+
+
+def bench_optimizer(counts=(10, 50, 200), time_budget_ms: float = 20.0):
+    print(f"Coupon optimizer (time budget {time_budget_ms:.0f} ms)")
+    print(f"  {'coupons':>7} {'chain total':>14} {'best total':>14} {'solve ms':>9} {'nodes':>8} {'optimal':>8}")
+    for count in counts:
+        cart = build_cart(100)
+        coupons = build_applicable_coupons(count, cart)
+        optimizer = CouponOptimizer(time_budget_ms)
+        chain_total = optimizer._evaluate(coupons, cart)
+        start = time.perf_counter()
+        plan = optimizer.solve(cart, coupons)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"  {count:>7} {chain_total:>14.2f} {plan.final_total:>14.2f} {elapsed:>9.2f} {plan.nodes:>8} {str(plan.optimal):>8}")
+
+
+# ----------------------------
+# Bulk campaign load with interned strategies
+# ----------------------------
+def write_campaign_file(path: str, count: int, seed: int = 5):
+    rnd = random.Random(seed)
+    with open(path, "w") as f:
+        f.write("# type,params...\n")
+        for _ in range(count):
+            kind = rnd.randrange(4)
+            if kind == 0:
+                f.write(f"seasonal,{rnd.randint(1, 30)},{rnd.choice(CATEGORIES)}\n")
+            elif kind == 1:
+                f.write(f"loyalty,{rnd.randint(1, 10)}\n")
+            elif kind == 2:
+                f.write(f"bulk,{rnd.randint(0, 200) * 100},{rnd.randint(1, 50) * 10}\n")
+            else:
+                f.write(f"bank,{rnd.choice(BANKS)},{rnd.randint(0, 200) * 100},{rnd.randint(1, 20)},{rnd.randint(1, 100) * 10}\n")
+
+
+def bench_bulk_load(count: int = 200000):
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    os.close(fd)
+    try:
+        write_campaign_file(path, count)
+        mgr = CouponManager()
+        start = time.perf_counter()
+        loaded = mgr.load_coupons(path)
+        elapsed = time.perf_counter() - start
+    finally:
+        os.remove(path)
+    print(f"Bulk load: {loaded} coupons in {elapsed * 1000:.0f} ms, "
+          f"{DiscountStrategyManager.get_instance().cache_size()} distinct strategy instances")
+
+
+# ----------------------------
+# Batch re-pricing: apply_all per cart vs vectorized reprice_batch
+# ----------------------------
+def bench_batch_reprice(cart_count: int = 100000, lines: int = 5, coupon_count: int = 200):
+    mgr = build_manager(build_coupons(coupon_count))
+    rnd = random.Random(13)
+    carts = []
+    for _ in range(cart_count):
+        cart = Cart()
+        for i in range(lines):
+            cart.add_product(Product(f"item-{i}", rnd.choice(CATEGORIES), rnd.randint(10, 50000)), rnd.randint(1, 3))
+        cart.set_loyalty_member(rnd.random() < 0.5)
+        cart.set_payment_bank(rnd.choice(BANKS))
+        carts.append(cart)
+    start_totals = [cart.get_current_total() for cart in carts]
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        scalar = [mgr.apply_all(cart) for cart in carts]
+    scalar_elapsed = time.perf_counter() - start
+
+    for cart, total in zip(carts, start_totals):
+        cart.current_total = total
+    start = time.perf_counter()
+    batch = mgr.reprice_batch(carts)
+    batch_elapsed = time.perf_counter() - start
+
+    print(f"Batch re-pricing: {cart_count} carts, {coupon_count} coupons")
+    print(f"  apply_all per cart: {scalar_elapsed * 1000:9.0f} ms")
+    print(f"  reprice_batch     : {batch_elapsed * 1000:9.0f} ms  ({scalar_elapsed / batch_elapsed:.1f}x)")
+    print(f"  identical totals  : {scalar == batch.tolist()}")
+
+
+if __name__ == "__main__":
+    bench_bulk_load()
+    bench_cart_summary()
+    bench_concurrent_checkout()
+    bench_optimizer()
+    bench_batch_reprice()